@@ -0,0 +1,117 @@
+"""
+Benchmarks for evaluating elementary Functions whose constant parts are precomputed:
+powers with constant exponents or bases, logs with constant bases, and tangents.
+Each is run against the original evaluation through exp and log, kept as a reference.
+Also evaluates an expensive Function at few distinct points, with and without a CachedFunction.
+
+Run from the repository root, eg.
+
+    python -m benchmarks.bench_functions --sizes 100 1000 10000
+
+Sizes are numbers of evaluation points.
+
+Author: Jack Romo <sharrackor@gmail.com>
+"""
+
+import random
+import sys
+
+from benchmarks import harness
+from mathlibpy.functions import Constant, Cos, Exp, Log, LogBase, Polynomial, Power, Sin, Tan
+
+
+def _points(n):
+    rand = random.Random(n)
+    return [rand.uniform(0.1, 1.4) for _ in range(n)]
+
+
+def _setup(f):
+    return lambda n: (f(), _points(n))
+
+
+def _setup_compiled(f):
+    return lambda n: (f().compile(), _points(n))
+
+
+def _setup_repeated(cached):
+    def setup(n):
+        f = _general_power() * Exp()(Sin() + Tan()) / (Constant(3) + LogBase(10))
+        rand = random.Random(n)
+        distinct = _points(64)
+        return f.cached() if cached else f, [rand.choice(distinct) for _ in range(n)]
+    return setup
+
+
+def _integer_power():
+    return Power(Sin() + Constant(2), Constant(3))
+
+
+def _constant_base():
+    return Power(Constant(2), Sin())
+
+
+def _general_power():
+    return Power(Sin() + Constant(2), Cos())
+
+
+def _log_base():
+    return LogBase(10)
+
+
+def _polynomial_power():
+    return Power(Polynomial([1, 2, 3]), Constant(4))
+
+
+def _run_power_reference(state):
+    # Original Power._evaluate, through exp and log of the base at every point
+    f, xs = state
+    exp, log = Exp(), Log()
+    return [exp(f.f2(x) * log(f.f1(x))) for x in xs]
+
+
+def _run_log_base_reference(state):
+    # Original LogBase._evaluate, finding the log of the base at every point
+    f, xs = state
+    log = Log()
+    return [log(x) / log(f.b) for x in xs]
+
+
+def _run_tan_reference(state):
+    # Original Tan._evaluate, evaluating sin and cos as Functions
+    _, xs = state
+    sin, cos = Sin(), Cos()
+    return [sin(x) / cos(x) for x in xs]
+
+
+def _run_call(state):
+    f, xs = state
+    return [f(x) for x in xs]
+
+
+def _run_evaluate_many(state):
+    f, xs = state
+    return f.evaluate_many(xs)
+
+
+BENCHMARKS = [
+    harness.Benchmark("integer_power_reference", _setup(_integer_power), _run_power_reference, None),
+    harness.Benchmark("integer_power", _setup(_integer_power), _run_call, None),
+    harness.Benchmark("integer_power_compiled", _setup_compiled(_integer_power), _run_call, None),
+    harness.Benchmark("integer_power_many", _setup(_integer_power), _run_evaluate_many, None),
+    harness.Benchmark("polynomial_power", _setup(_polynomial_power), _run_call, None),
+    harness.Benchmark("constant_base_reference", _setup(_constant_base), _run_power_reference, None),
+    harness.Benchmark("constant_base", _setup(_constant_base), _run_call, None),
+    harness.Benchmark("constant_base_compiled", _setup_compiled(_constant_base), _run_call, None),
+    harness.Benchmark("general_power", _setup(_general_power), _run_call, None),
+    harness.Benchmark("log_base_reference", _setup(_log_base), _run_log_base_reference, None),
+    harness.Benchmark("log_base", _setup(_log_base), _run_call, None),
+    harness.Benchmark("log_base_many", _setup(_log_base), _run_evaluate_many, None),
+    harness.Benchmark("tan_reference", _setup(Tan), _run_tan_reference, None),
+    harness.Benchmark("tan", _setup(Tan), _run_call, None),
+    harness.Benchmark("repeated_points", _setup_repeated(False), _run_call, None),
+    harness.Benchmark("repeated_points_cached", _setup_repeated(True), _run_call, None),
+]
+
+
+if __name__ == "__main__":
+    sys.exit(harness.main("functions", BENCHMARKS))
@@ -0,0 +1,97 @@
+"""
+Scaling benchmarks for Matrix operations.
+
+Run from the repository root, eg.
+
+    python -m benchmarks.bench_matrix --sizes 8 16 32 --output matrix.json
+    python -m benchmarks.bench_matrix --baseline matrix_baseline.json --threshold 1.2
+
+Author: Jack Romo <sharrackor@gmail.com>
+"""
+
+import random
+import sys
+
+from benchmarks import harness
+from mathlibpy.matrices import Matrix
+
+
+def _random_matrix(rows, cols, seed):
+    rand = random.Random(seed)
+    return Matrix([[rand.uniform(-1, 1) for _ in range(cols)] for _ in range(rows)])
+
+
+def _square(n):
+    return _random_matrix(n, n, n)
+
+
+def _square_pair(n):
+    return _random_matrix(n, n, n), _random_matrix(n, n, n + 1)
+
+
+def _kronecker_vector(n):
+    # Factors are n*n, so the product is n^2*n^2 and never built
+    return _random_matrix(n, n, n).kronecker(_random_matrix(n, n, n + 1)), _random_matrix(n*n, 1, n + 2)
+
+
+def _blocks(n):
+    return [_random_matrix(8, 8, i) for i in range(max(1, n // 8))]
+
+
+def _add(pair):
+    return pair[0] + pair[1]
+
+
+def _multiply(pair):
+    return pair[0] * pair[1]
+
+
+def _hadamard(pair):
+    return pair[0].hadamard(pair[1])
+
+
+def _kronecker_matvec(state):
+    return state[0] * state[1]
+
+
+def _block_diagonal(blocks):
+    return Matrix.block_diagonal(*blocks)
+
+
+def _determinant(m):
+    return m.get_determinant()
+
+
+def _inverse(m):
+    return m.get_inverse()
+
+
+def _echelon(m):
+    return m.get_echelon_form()
+
+
+def _reduced_echelon(m):
+    return m.get_reduced_echelon_form()
+
+
+def _row_reduced_echelon(m):
+    return m.get_row_reduced_echelon_form()
+
+
+BENCHMARKS = [
+    harness.Benchmark("add", _square_pair, _add, None),
+    harness.Benchmark("hadamard", _square_pair, _hadamard, None),
+    harness.Benchmark("block_diagonal", _blocks, _block_diagonal, None),
+    harness.Benchmark("multiply", _square_pair, _multiply, 256),
+    harness.Benchmark("kronecker_matvec", _kronecker_vector, _kronecker_matvec, 64),
+    # Determinants use cofactor expansion, which is O(n!); inverse checks the determinant first
+    harness.Benchmark("determinant", _square, _determinant, 8),
+    harness.Benchmark("inverse", _square, _inverse, 8),
+    harness.Benchmark("echelon_form", _square, _echelon, 256),
+    harness.Benchmark("reduced_echelon_form", _square, _reduced_echelon, 256),
+    harness.Benchmark("row_reduced_echelon_form", _square, _row_reduced_echelon, 256),
+]
+
+
+if __name__ == "__main__":
+    sys.exit(harness.main("matrix", BENCHMARKS))
@@ -0,0 +1,100 @@
+"""
+Benchmarks for Polynomial evaluation, against the original sum of powers and Estrin's scheme,
+and for root finding.
+
+Run from the repository root, eg.
+
+    python -m benchmarks.bench_polynomial --sizes 8 64 512
+
+Sizes are polynomial degrees. Batch benchmarks evaluate at 1000 points.
+
+Author: Jack Romo <sharrackor@gmail.com>
+"""
+
+import random
+import sys
+
+from benchmarks import harness
+from mathlibpy.functions import Polynomial
+
+
+POINTS = 1000
+
+
+def _polynomial(n):
+    rand = random.Random(n)
+    return Polynomial([rand.uniform(-1, 1) for _ in range(n + 1)])
+
+
+def _polynomial_and_points(n):
+    rand = random.Random(n + 1)
+    return _polynomial(n), [rand.uniform(-1, 1) for _ in range(POINTS)]
+
+
+def _compiled_and_points(n):
+    p, xs = _polynomial_and_points(n)
+    return p.compile(), xs
+
+
+def _sum_of_powers(coeffs, x):
+    # Original Polynomial._evaluate, kept as a reference
+    return sum(coeffs[i]*(x**i) for i in range(len(coeffs)))
+
+
+def _estrin(coeffs, x):
+    # Estrin's scheme: pairwise combination of terms, squaring x at each level
+    coeffs = list(coeffs)
+    while len(coeffs) > 1:
+        if len(coeffs) % 2:
+            coeffs.append(0)
+        coeffs = [a + b*x for a, b in zip(coeffs[::2], coeffs[1::2])]
+        x = x*x
+    return coeffs[0]
+
+
+def _run_sum_of_powers(state):
+    p, xs = state
+    return [_sum_of_powers(p.coeffs, x) for x in xs]
+
+
+def _run_estrin(state):
+    p, xs = state
+    return [_estrin(p.coeffs, x) for x in xs]
+
+
+def _run_horner(state):
+    p, xs = state
+    return [p(x) for x in xs]
+
+
+def _run_compiled(state):
+    f, xs = state
+    return [f(x) for x in xs]
+
+
+def _run_evaluate_many(state):
+    p, xs = state
+    return p.evaluate_many(xs)
+
+
+def _run_roots(p):
+    return p.roots()
+
+
+def _run_real_roots(p):
+    return p.real_roots()
+
+
+BENCHMARKS = [
+    harness.Benchmark("sum_of_powers", _polynomial_and_points, _run_sum_of_powers, None),
+    harness.Benchmark("estrin", _polynomial_and_points, _run_estrin, None),
+    harness.Benchmark("horner", _polynomial_and_points, _run_horner, None),
+    harness.Benchmark("compiled", _compiled_and_points, _run_compiled, None),
+    harness.Benchmark("evaluate_many", _polynomial_and_points, _run_evaluate_many, None),
+    harness.Benchmark("roots", _polynomial, _run_roots, 512),
+    harness.Benchmark("real_roots", _polynomial, _run_real_roots, 256),
+]
+
+
+if __name__ == "__main__":
+    sys.exit(harness.main("polynomial", BENCHMARKS))
@@ -0,0 +1,301 @@
+"""
+Shared benchmark harness: timing, peak memory, JSON reports and baseline regression checks.
+
+Each benchmark is run in its own child process, so that peak memory figures are not polluted by
+earlier benchmarks and a crash or runaway benchmark does not take the whole suite down.
+
+Author: Jack Romo <sharrackor@gmail.com>
+"""
+
+from __future__ import division
+import argparse
+import collections
+import json
+import multiprocessing
+import platform
+import sys
+import timeit
+
+try:
+    import Queue
+except ImportError:
+    import queue as Queue
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+
+Benchmark = collections.namedtuple("Benchmark", ["name", "setup", "run", "max_size"])
+"""
+A single benchmarked operation.
+
+Fields:
+    name (str): Unique name of benchmark, used as key in reports and baselines.
+    setup (callable): Takes a size n and returns the state passed to run. Not timed.
+    run (callable): Takes the state from setup and performs the timed operation.
+    max_size (int, None): Largest size the benchmark is run at, or None for no limit.
+                          Used to keep super-polynomial algorithms (eg. cofactor determinants) tractable.
+"""
+
+
+DEFAULT_SIZES = [8, 16, 32, 64, 128, 256, 512, 1000]
+_POLL_INTERVAL = 0.5    # Seconds between checks that a child process running a benchmark is still alive
+
+
+def _peak_memory_kb(func, fresh):
+    """
+    Run func once and measure the peak memory it allocated, in kilobytes.
+    Uses tracemalloc when available, else the growth of the process' maximum resident set size.
+    The latter only counts pages beyond the high water mark the process already had, so is only
+    meaningful in a fresh process, before anything else has run in it.
+
+    Args:
+        func (callable): Operation to measure.
+        fresh (bool): Whether nothing but func's setup has run in this process yet.
+
+    Returns:
+        float, None: Peak memory in kilobytes, or None if it cannot be measured.
+    """
+    if tracemalloc is not None:
+        tracemalloc.start()
+        func()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return peak / 1024
+    elif resource is not None and fresh:
+        before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        func()
+        after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        if sys.platform == "darwin":
+            return (after - before) / 1024     # macOS reports bytes, Linux kilobytes
+        return after - before
+    else:
+        func()
+        return None
+
+
+def measure(benchmark, size, repeat, fresh=False):
+    """
+    Time a benchmark at one size in the current process.
+
+    Args:
+        benchmark (Benchmark): Benchmark to run.
+        size (int): Problem size passed to benchmark setup.
+        repeat (int): Number of timed runs; each gets fresh state from setup.
+        fresh (bool): Whether the current process is a fresh one, in which nothing else has run.
+                      Peak memory is then measured first, before the timed runs raise the process' high water mark.
+
+    Returns:
+        dict: Result record with median and minimum time in seconds and peak memory in kilobytes
+              (None if it could not be measured).
+    """
+    state = benchmark.setup(size)
+    peak = _peak_memory_kb(lambda: benchmark.run(state), fresh)
+    times = []
+    for _ in range(repeat):
+        state = benchmark.setup(size)
+        start = timeit.default_timer()
+        benchmark.run(state)
+        times.append(timeit.default_timer() - start)
+    times.sort()
+    return {
+        "name": benchmark.name,
+        "size": size,
+        "repeat": repeat,
+        "median": times[len(times) // 2],
+        "min": times[0],
+        "peak_memory_kb": peak,
+    }
+
+
+def _measure_into_queue(queue, benchmark, size, repeat):
+    try:
+        queue.put(measure(benchmark, size, repeat, fresh=True))
+    except Exception as e:
+        queue.put({"name": benchmark.name, "size": size, "error": repr(e)})
+
+
+def measure_isolated(benchmark, size, repeat, timeout=None):
+    """
+    As measure, but run in a child process. Benchmark setup and run must be picklable (module-level).
+    If the child process dies or runs out of time, an error record is returned instead of a result.
+
+    Args:
+        timeout (float, None): Seconds to wait for the child process, or None to wait as long as it runs.
+    """
+    queue = multiprocessing.Queue()
+    proc = multiprocessing.Process(target=_measure_into_queue, args=(queue, benchmark, size, repeat))
+    proc.start()
+    start = timeit.default_timer()
+    result = None
+    while result is None:
+        try:
+            result = queue.get(timeout=_POLL_INTERVAL)
+        except Queue.Empty:
+            if not proc.is_alive():
+                try:
+                    result = queue.get(timeout=_POLL_INTERVAL)     # Result may have been sent just before exit
+                except Queue.Empty:
+                    result = {"name": benchmark.name, "size": size,
+                              "error": "Child process exited with code {0}".format(proc.exitcode)}
+            elif timeout is not None and timeit.default_timer() - start > timeout:
+                proc.terminate()
+                result = {"name": benchmark.name, "size": size,
+                          "error": "Timed out after {0} seconds".format(timeout)}
+    proc.join()
+    return result
+
+
+def run_suite(benchmarks, sizes, repeat=3, isolate=True, names=None, log=None, timeout=None):
+    """
+    Run every benchmark at every size up to its max_size.
+
+    Args:
+        benchmarks (list[Benchmark]): Benchmarks in suite.
+        sizes (list[int]): Problem sizes to run each benchmark at.
+        repeat (int): Number of timed runs per benchmark and size.
+        isolate (bool): Run each measurement in a fresh child process.
+        names (list[str], None): If given, only run benchmarks with these names.
+        log (file, None): Stream to write progress lines to.
+        timeout (float, None): Seconds each isolated measurement may take, or None for no limit.
+
+    Returns:
+        list[dict]: One result record per benchmark and size.
+    """
+    results = []
+    for benchmark in benchmarks:
+        if names and benchmark.name not in names:
+            continue
+        for size in sizes:
+            if benchmark.max_size is not None and size > benchmark.max_size:
+                continue
+            if isolate:
+                result = measure_isolated(benchmark, size, repeat, timeout)
+            else:
+                result = measure(benchmark, size, repeat)
+            results.append(result)
+            if log is not None:
+                log.write(format_result(result) + "\n")
+                log.flush()
+    return results
+
+
+def format_result(result):
+    """
+    Returns:
+        str: Human readable, single line summary of a result record.
+    """
+    if "error" in result:
+        return "{0:<28} n={1:<6} ERROR {2}".format(result["name"], result["size"], result["error"])
+    memory = result["peak_memory_kb"]
+    memory = "n/a" if memory is None else "{0:.1f} KiB".format(memory)
+    return "{0:<28} n={1:<6} median {2:.6f}s  min {3:.6f}s  peak {4}".format(
+        result["name"], result["size"], result["median"], result["min"], memory)
+
+
+def make_report(suite, results):
+    """
+    Returns:
+        dict: Machine readable report of a suite run, as written to JSON.
+    """
+    return {
+        "suite": suite,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+
+def compare(results, baseline, threshold):
+    """
+    Find benchmarks that have slowed down relative to a baseline.
+
+    Args:
+        results (list[dict]): Current result records.
+        baseline (dict): Report previously produced by make_report.
+        threshold (float): Maximum allowed ratio of current to baseline median time.
+
+    Returns:
+        list[dict]: One record per regression, with name, size, baseline and current time and their ratio.
+    """
+    previous = dict(((r["name"], r["size"]), r) for r in baseline["results"] if "error" not in r)
+    regressions = []
+    for result in results:
+        old = previous.get((result["name"], result["size"]))
+        if old is None or "error" in result or old["median"] <= 0:
+            continue
+        ratio = result["median"] / old["median"]
+        if ratio > threshold:
+            regressions.append({
+                "name": result["name"],
+                "size": result["size"],
+                "baseline": old["median"],
+                "current": result["median"],
+                "ratio": ratio,
+            })
+    return regressions
+
+
+def main(suite, benchmarks, argv=None):
+    """
+    Command line entry point shared by all benchmark suites.
+
+    Args:
+        suite (str): Name of suite, recorded in report.
+        benchmarks (list[Benchmark]): Benchmarks in suite.
+        argv (list[str], None): Command line arguments, defaults to sys.argv[1:].
+
+    Returns:
+        int: Exit status; 1 if a benchmark regressed beyond the threshold or failed, 0 otherwise.
+    """
+    parser = argparse.ArgumentParser(description="Run the {0} benchmark suite.".format(suite))
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                        help="problem sizes to run (default: %(default)s)")
+    parser.add_argument("--only", nargs="+", metavar="NAME",
+                        help="only run benchmarks with these names ({0})".format(
+                            ", ".join(b.name for b in benchmarks)))
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per measurement (default: 3)")
+    parser.add_argument("--no-isolate", action="store_true",
+                        help="run in this process instead of one child process per measurement")
+    parser.add_argument("--timeout", type=float, metavar="SECONDS",
+                        help="fail measurements taking longer than this in their child process (default: no limit)")
+    parser.add_argument("--output", metavar="FILE", help="write JSON report to FILE instead of stdout")
+    parser.add_argument("--baseline", metavar="FILE", help="JSON report to check for regressions against")
+    parser.add_argument("--threshold", type=float, default=1.25,
+                        help="fail if median time exceeds baseline by this factor (default: 1.25)")
+    parser.add_argument("--save-baseline", metavar="FILE", help="also write JSON report to FILE as new baseline")
+    args = parser.parse_args(argv)
+
+    results = run_suite(benchmarks, args.sizes, repeat=args.repeat, isolate=not args.no_isolate,
+                        names=args.only, log=sys.stderr, timeout=args.timeout)
+    report = make_report(suite, results)
+    status = 1 if any("error" in r for r in results) else 0
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        report["threshold"] = args.threshold
+        report["regressions"] = compare(results, baseline, args.threshold)
+        for reg in report["regressions"]:
+            sys.stderr.write("REGRESSION {0} n={1}: {2:.6f}s -> {3:.6f}s ({4:.2f}x)\n".format(
+                reg["name"], reg["size"], reg["baseline"], reg["current"], reg["ratio"]))
+        if report["regressions"]:
+            status = 1
+
+    text = json.dumps(report, indent=2, sort_keys=True, separators=(",", ": "))
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        sys.stdout.write(text + "\n")
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as f:
+            f.write(text + "\n")
+    return status
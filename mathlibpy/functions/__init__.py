@@ -1,5 +1,9 @@
 from function import*
 from exp import *
 from trig import *
-from polynomial import Polynomial
+from polynomial import Polynomial, SparsePolynomial, ShiftedPolynomial
+from interpolation import Barycentric, Chebyshev
+from cache import CachedFunction
+from interval import Interval
+from profiler import Profiler
 from sequence import *
@@ -0,0 +1,202 @@
+"""
+Elementwise operations on batches of numbers, used to evaluate Functions at many points at once.
+Batches are NumPy arrays when NumPy is installed, and lists of numbers otherwise.
+
+Author: Jack Romo <sharrackor@gmail.com>
+"""
+
+
+import array
+import math
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def to_batch(xs):
+    """
+    Args:
+        xs (sequence, array.array, numpy.ndarray): Input numbers.
+
+    Returns:
+        Batch holding the numbers of xs.
+    """
+    if numpy is not None:
+        return numpy.array(xs, dtype=float)
+    return list(xs)
+
+
+def to_array(batch):
+    """
+    Args:
+        batch: Batch of results.
+
+    Returns:
+        numpy.ndarray, array.array: Array of floats with same contents as batch.
+    """
+    if numpy is not None:
+        return numpy.asarray(batch, dtype=float)
+    return array.array("d", batch)
+
+
+def full(like, value):
+    """
+    Returns:
+        Batch of same length as like, every element equal to value.
+    """
+    if numpy is not None:
+        return numpy.full(len(like), value, dtype=float)
+    return [value] * len(like)
+
+
+def add(a, b):
+    if numpy is not None:
+        return a + b
+    return [i + j for i, j in zip(a, b)]
+
+
+def sub(a, b):
+    if numpy is not None:
+        return a - b
+    return [i - j for i, j in zip(a, b)]
+
+
+def mul(a, b):
+    if numpy is not None:
+        return a * b
+    return [i * j for i, j in zip(a, b)]
+
+
+def any_zero(a):
+    """
+    Returns:
+        bool: True if any element of batch is zero.
+    """
+    if numpy is not None:
+        return bool(numpy.any(a == 0))
+    return any(i == 0 for i in a)
+
+
+def div(a, b):
+    """
+    Raises:
+        ZeroDivisionError: Some element of b is zero.
+    """
+    if any_zero(b):
+        raise ZeroDivisionError()
+    if numpy is not None:
+        return a / b
+    return [i / float(j) for i, j in zip(a, b)]
+
+
+def div_scalar(a, c):
+    if numpy is not None:
+        return a / c
+    return [i / c for i in a]
+
+
+def mul_scalar(a, c):
+    if numpy is not None:
+        return a * c
+    return [i * c for i in a]
+
+
+def power(a, n):
+    """
+    Raise every element of batch to the number n.
+    """
+    if numpy is not None:
+        return a ** n
+    return [i ** n for i in a]
+
+
+def polyval(coeffs, xs):
+    """
+    Evaluate polynomial at every element of batch, by Horner's scheme.
+
+    Args:
+        coeffs (list): Coefficients indexed by degree.
+        xs: Batch of inputs.
+    """
+    if numpy is not None:
+        result = numpy.full(len(xs), coeffs[-1], dtype=float)
+        for c in reversed(coeffs[:-1]):
+            result *= xs
+            result += c
+        return result
+    result = []
+    rest = coeffs[-2::-1]
+    for x in xs:
+        y = coeffs[-1]
+        for c in rest:
+            y = y*x + c
+        result.append(y)
+    return result
+
+
+def sparse_polyval(terms, xs):
+    """
+    Evaluate sparse polynomial at every element of batch, by Horner's scheme over the gaps between exponents.
+
+    Args:
+        terms (list[tuple]): (exponent, coefficient) pairs, sorted by increasing exponent.
+        xs: Batch of inputs.
+    """
+    if numpy is not None:
+        result = numpy.full(len(xs), terms[-1][1], dtype=float)
+        for (e, c), (prev, _) in zip(reversed(terms[:-1]), reversed(terms[1:])):
+            result *= xs ** (prev - e)
+            result += c
+        if terms[0][0] > 0:
+            result *= xs ** terms[0][0]
+        return result
+    result = []
+    for x in xs:
+        y = terms[-1][1]
+        for (e, c), (prev, _) in zip(reversed(terms[:-1]), reversed(terms[1:])):
+            y = y * x ** (prev - e) + c
+        if terms[0][0] > 0:
+            y *= x ** terms[0][0]
+        result.append(y)
+    return result
+
+
+def sin(a):
+    if numpy is not None:
+        return numpy.sin(a)
+    return map(math.sin, a)
+
+
+def cos(a):
+    if numpy is not None:
+        return numpy.cos(a)
+    return map(math.cos, a)
+
+
+def exp(a):
+    if numpy is not None:
+        return numpy.exp(a)
+    return [math.e ** i for i in a]
+
+
+def log(a):
+    """
+    Raises:
+        ValueError: Some element of a is not positive, as with math.log.
+    """
+    if numpy is not None:
+        if numpy.any(a <= 0):
+            raise ValueError("math domain error")
+        return numpy.log(a)
+    return map(math.log, a)
+
+
+def apply(f, a):
+    """
+    Apply a scalar function to each element of batch.
+    """
+    if numpy is not None:
+        return numpy.array([f(i) for i in a], dtype=float)
+    return map(f, a)
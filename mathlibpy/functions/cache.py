@@ -0,0 +1,211 @@
+"""
+Memoization of expensive Functions, with a bounded least recently used (LRU) cache.
+
+Author: Jack Romo <sharrackor@gmail.com>
+"""
+
+import collections
+import decimal
+import fractions
+import sys
+import batch
+import dag
+import function
+
+
+CacheInfo = collections.namedtuple("CacheInfo", ["hits", "misses", "size", "maxsize", "bytes", "maxbytes"])
+"""
+Statistics of the cache of a CachedFunction.
+
+Fields:
+    hits (int): Number of evaluations answered from the cache.
+    misses (int): Number of evaluations at cacheable inputs not in the cache.
+    size (int): Number of results cached.
+    maxsize (int, None): Max number of results cached, or None if unbounded.
+    bytes (int): Approximate memory used by cached inputs and results.
+    maxbytes (int, None): Max memory used by cached inputs and results, or None if unbounded.
+"""
+
+
+_CACHEABLE_TYPES = (bool, int, long, float, complex, fractions.Fraction, decimal.Decimal)
+
+
+class CachedFunction(function.Function):
+    """
+    Function remembering its values at the most recently evaluated inputs, eg. for optimizers or solvers
+    that evaluate an expensive Function at the same points many times. Once the cache holds maxsize results,
+    or its inputs and results take up more than maxbytes, the least recently used results are discarded.
+
+    Only plain numbers (int, float, Fraction, etc.) and tuples of them are cached, keyed by value and type,
+    so f(1) and f(1.0) are cached separately. Other inputs, eg. dual numbers or Intervals, and NaN are evaluated
+    without the cache. Each point of a batch given to evaluate_many is looked up in the cache, and those missing
+    are evaluated together in one smaller batch; as batches hold floats, their results are shared with f(x)
+    for float x only. Errors are not cached.
+
+    Cached results are stamped like other caches of Functions (see Function._clear_caches), so they are
+    discarded once any Function is mutated, eg. when f is reassigned or a coefficient of f is set.
+    """
+
+    def __init__(self, f, maxsize=1024, maxbytes=None, per_node=False):
+        """
+        Args:
+            f (Function): Function to cache values of.
+            maxsize (int, None): Max number of results cached, or None for no limit.
+            maxbytes (int, None): Max approximate memory, in bytes, used by cached inputs and results,
+                                  as measured by sys.getsizeof, or None for no limit.
+            per_node (bool): Evaluate f after sharing its identical subtrees (see Function.share),
+                             computing each distinct subtree only once per input.
+        """
+        if not isinstance(f, function.Function):
+            raise TypeError("Can only cache a Function")
+        for name, limit in [("maxsize", maxsize), ("maxbytes", maxbytes)]:
+            if limit is not None and not isinstance(limit, (int, long)):
+                raise TypeError("{0} must be an integer or None".format(name))
+            elif limit is not None and limit < 0:
+                raise ValueError("{0} must be >= 0".format(name))
+        self.f = f
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.per_node = per_node
+        self._shared = f.share() if per_node else f
+        self._values = collections.OrderedDict()    # key of input -> (value, size), least recently used first
+        self._stamp = function._mutations
+        self._hits = 0
+        self._misses = 0
+        self._bytes = 0
+
+    def _validate(self):
+        """
+        Discard cached results, and rebuild the shared tree, if any Function was mutated since they were cached.
+        """
+        if self._stamp != function._mutations:
+            self._values.clear()
+            self._bytes = 0
+            self._shared = self.f.share() if self.per_node else self.f
+            self._stamp = function._mutations
+
+    def _evaluate(self, x):
+        self._validate()
+        key = _cache_key(x)
+        if key is None:
+            return self._compute(x)
+        entry = self._values.pop(key, None)
+        if entry is not None:
+            self._values[key] = entry   # Reinsert as most recently used
+            self._hits += 1
+            return entry[0]
+        self._misses += 1
+        value = self._compute(x)
+        self._store(key, x, value)
+        return value
+
+    def _compute(self, x):
+        if self.per_node:
+            return dag.evaluate(self._shared, x)
+        return self.f(x)
+
+    def _store(self, key, x, value):
+        size = _size(x) + _size(value)
+        if self.maxsize == 0 or (self.maxbytes is not None and size > self.maxbytes):
+            return
+        self._values[key] = (value, size)
+        self._bytes += size
+        while ((self.maxsize is not None and len(self._values) > self.maxsize)
+               or (self.maxbytes is not None and self._bytes > self.maxbytes)):
+            _, (_, evicted) = self._values.popitem(last=False)
+            self._bytes -= evicted
+
+    def _evaluate_many(self, xs):
+        self._validate()
+        values = [None]*len(xs)
+        missing = collections.OrderedDict()     # key of input, or index if not cacheable -> indices of input
+        for i, x in enumerate(xs):
+            key = _cache_key(_plain(x))
+            entry = None if key is None else self._values.pop(key, None)
+            if entry is not None:
+                self._values[key] = entry   # Reinsert as most recently used
+                self._hits += 1
+                values[i] = entry[0]
+            elif key is None:
+                missing[i] = [i]
+            elif key in missing:
+                self._hits += 1     # Repeated within batch, so evaluated once
+                missing[key].append(i)
+            else:
+                self._misses += 1
+                missing[key] = [i]
+        if missing:
+            computed = self.f._evaluate_many(batch.to_batch([xs[indices[0]] for indices in missing.values()]))
+            for (key, indices), value in zip(missing.items(), computed):
+                value = _plain(value)
+                for i in indices:
+                    values[i] = value
+                if isinstance(key, tuple):
+                    self._store(key, _plain(xs[indices[0]]), value)
+        return batch.to_batch(values)
+
+    def _children(self):
+        return self.f,
+
+    def _rebuild(self, children):
+        return CachedFunction(children[0], self.maxsize, self.maxbytes, self.per_node)
+
+    def _combine(self, x, values):
+        return values[0]
+
+    def _derivative(self):
+        return self.f.get_derivative()
+
+    def __eq__(self, other):
+        if not isinstance(other, CachedFunction):
+            return False
+        return self.f == other.f
+
+    def __repr__(self):
+        return "CachedFunction({0!r}, maxsize={1!r}, maxbytes={2!r}, per_node={3!r})".format(
+            self.f, self.maxsize, self.maxbytes, self.per_node)
+
+    def __str__(self):
+        return str(self.f)
+
+    def cache_info(self):
+        """
+        Returns:
+            CacheInfo: Hit and miss counts, and current size of the cache.
+        """
+        self._validate()
+        return CacheInfo(self._hits, self._misses, len(self._values), self.maxsize, self._bytes, self.maxbytes)
+
+    def cache_clear(self):
+        """
+        Discard all cached results, and reset hit and miss counts.
+        """
+        self._values.clear()
+        self._hits = self._misses = self._bytes = 0
+
+
+def _cache_key(x):
+    """
+    Returns:
+        tuple, None: Hashable key distinguishing x from inputs of other types or values, or None if x is not cacheable.
+    """
+    if isinstance(x, tuple):
+        keys = tuple(_cache_key(y) for y in x)
+        return None if None in keys else keys
+    elif type(x) not in _CACHEABLE_TYPES or x != x:
+        return None
+    return type(x), x
+
+
+def _plain(x):
+    """
+    Returns:
+        number: x as a plain Python number if it is a NumPy scalar, eg. an element of a batch, else x itself.
+    """
+    return x.item() if hasattr(x, "item") else x
+
+
+def _size(x):
+    if isinstance(x, tuple):
+        return sys.getsizeof(x) + sum(_size(y) for y in x)
+    return sys.getsizeof(x)
@@ -0,0 +1,102 @@
+"""
+Compiler from Function trees to plain Python functions.
+
+Author: Jack Romo <sharrackor@gmail.com>
+"""
+
+from __future__ import division    # inherited by generated code
+import math
+
+
+class Compiler(object):
+    """
+    Flattens a Function tree into the body of a single generated Python function.
+    Every node is emitted as one assignment to a temporary, in evaluation order,
+    so the generated function does no per-node dispatch or type checking.
+    """
+
+    def __init__(self):
+        self.namespace = {"math": math}
+        self._lines = []
+        self._count = 0
+        self._emitted = {}
+
+    def _new_name(self, prefix):
+        self._count += 1
+        return "{0}{1}".format(prefix, self._count)
+
+    def bind(self, value):
+        """
+        Make an object available to generated code.
+
+        Args:
+            value: Any object, eg. a number or Function.
+
+        Returns:
+            str: Name under which value can be referenced in generated code.
+        """
+        if type(value) in (int, long) or (type(value) is float and not (math.isinf(value) or math.isnan(value))):
+            return repr(value)
+        name = self._new_name("_c")
+        self.namespace[name] = value
+        return name
+
+    def emit(self, expr):
+        """
+        Emit an assignment of an expression to a new temporary.
+
+        Args:
+            expr (str): Python expression over names returned by bind, emit and compile.
+
+        Returns:
+            str: Name of temporary holding value of expression.
+        """
+        name = self._new_name("t")
+        self._lines.append("{0} = {1}".format(name, expr))
+        return name
+
+    def emit_statement(self, statement):
+        """
+        Emit a raw statement, eg. a guard that raises an exception.
+
+        Args:
+            statement (str): Single line Python statement.
+        """
+        self._lines.append(statement)
+
+    def compile(self, f, arg):
+        """
+        Emit code evaluating a Function at an argument.
+        The same node applied to the same argument is only emitted once.
+
+        Args:
+            f (Function): Function to be evaluated.
+            arg (str): Name or literal holding input to f.
+
+        Returns:
+            str: Name or literal holding f(arg).
+        """
+        key = (id(f), arg)
+        if key not in self._emitted:
+            # Keep f alive so its id cannot be reused by another node while compiling
+            self._emitted[key] = (f._compile(self, arg), f)
+        return self._emitted[key][0]
+
+    def build(self, f):
+        """
+        Compile a Function into a Python function of one number.
+
+        Args:
+            f (Function): Function to be compiled.
+
+        Returns:
+            function: Python function g such that g(x) == f(x) for any number x.
+                      The generated source is kept in g.source.
+        """
+        result = self.compile(f, "x")
+        source = "def _compiled(x):\n" + "".join("    {0}\n".format(line) for line in self._lines)
+        source += "    return {0}\n".format(result)
+        exec compile(source, "<compiled Function>", "exec") in self.namespace
+        compiled = self.namespace["_compiled"]
+        compiled.source = source
+        return compiled
@@ -0,0 +1,117 @@
+"""
+Hash-consing of Function trees into DAGs, and evaluation of DAGs.
+
+Author: Jack Romo <sharrackor@gmail.com>
+"""
+
+
+import copy
+import weakref
+import function
+
+
+class InternTable(object):
+    """
+    Hash-consing table of Function nodes.
+    Structurally identical nodes interned into the same table are the same object,
+    so a tree interned into it becomes a DAG in which every distinct subtree appears once.
+    Parameters are compared by type as well as value, so eg. Constant(1) and Constant(1.0) are not shared.
+    The table holds copies of the nodes interned, never the nodes themselves, so later mutation of an interned
+    Function does not reach other users of the table. Entries are weakly referenced, so the table does not
+    keep unused nodes alive.
+    """
+
+    def __init__(self):
+        self._nodes = weakref.WeakValueDictionary()
+
+    def __len__(self):
+        return len(self._nodes)
+
+    def intern(self, f):
+        """
+        Args:
+            f (Function): Function to intern.
+
+        Returns:
+            Function: Node structurally identical to f, whose every subtree is the canonical node in this table.
+        """
+        canonical = {}     # id of node of f -> its interned node
+        keep_alive = []    # nodes of f, so their ids are not reused while interning
+        stack = [f]
+        while stack:
+            node = stack[-1]
+            if id(node) in canonical:
+                stack.pop()
+                continue
+            children = node._children()
+            pending = [c for c in children if id(c) not in canonical]
+            if pending:
+                stack.extend(pending)
+                continue
+            stack.pop()
+            keep_alive.append(node)
+            shared_children = tuple(canonical[id(c)] for c in children)
+            key = (type(node), _typed(node._key()), tuple(id(c) for c in shared_children))
+            try:
+                shared = self._nodes.get(key)
+            except TypeError:
+                # Unhashable parameters, eg. a Constant holding a list; node cannot be shared
+                canonical[id(node)] = node._rebuild(shared_children) if children else node
+                continue
+            if shared is None:
+                shared = node._rebuild(shared_children) if children else copy.deepcopy(node)
+                self._nodes[key] = shared
+            canonical[id(node)] = shared
+        return canonical[id(f)]
+
+
+def _typed(key):
+    """
+    Returns:
+        tuple: key with the type of every parameter beside it, recursing into tuples.
+    """
+    return tuple((type(k), _typed(k) if isinstance(k, tuple) else k) for k in key)
+
+
+default_table = InternTable()
+
+
+def evaluate(f, x):
+    """
+    Evaluate a Function, computing each of its nodes at most once per input.
+    Uses an explicit stack rather than recursion.
+
+    Args:
+        f (Function): Function to evaluate.
+        x (number): Input to f.
+
+    Returns:
+        number: f(x)
+    """
+    values = {}    # (id of node, input) -> value of node at input
+    stack = [(f, x)]
+    while stack:
+        node, y = stack[-1]
+        key = (id(node), y)
+        if key in values:
+            stack.pop()
+            continue
+        if isinstance(node, function.FunctionCompNode):
+            inner = (id(node.f2), y)
+            if inner not in values:
+                stack.append((node.f2, y))
+                continue
+            outer = (id(node.f1), values[inner])
+            if outer not in values:
+                stack.append((node.f1, values[inner]))
+                continue
+            values[key] = values[outer]
+        else:
+            children = node._children()
+            pending = [(c, y) for c in children if (id(c), y) not in values]
+            if pending:
+                stack.extend(pending)
+                continue
+            values[key] = node._combine(y, [values[(id(c), y)] for c in children])
+        stack.pop()
+    return values[(id(f), x)]
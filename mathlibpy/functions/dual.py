@@ -0,0 +1,135 @@
+"""
+Dual numbers, for forward-mode automatic differentiation.
+
+Author: Jack Romo <sharrackor@gmail.com>
+"""
+
+from __future__ import division
+import math
+import numbers
+
+
+class Dual(object):
+    """
+    Dual number a + b*e, where e^2 = 0.
+    Evaluating f(a + e) gives f(a) + f'(a)*e, so passing a Dual through a Function
+    computes its value and derivative together.
+
+    Dual numbers count as Numbers, so they can be passed to any Function.
+    Functions built on elementary functions such as math.sin instead call the method of the same name
+    (sin, cos, exp, log) of any number math cannot handle, which Dual provides.
+
+    Notes:
+        Comparisons only look at the real part, so that tests in Functions (eg. for division by zero)
+        behave as they would at the real point.
+    """
+
+    def __init__(self, real, dual=0):
+        """
+        Args:
+            real (number): Real part a, the value at which a function is evaluated.
+            dual (number): Dual part b, the derivative carried along with the value.
+        """
+        self.real = real
+        self.dual = dual
+
+    def __repr__(self):
+        return "Dual({0!r}, {1!r})".format(self.real, self.dual)
+
+    def __eq__(self, other):
+        if isinstance(other, Dual):
+            return self.real == other.real
+        elif isinstance(other, numbers.Number):
+            return self.real == other
+        return False
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(self.real)
+
+    def __lt__(self, other):
+        return self.real < _real(other)
+
+    def __le__(self, other):
+        return self.real <= _real(other)
+
+    def __gt__(self, other):
+        return self.real > _real(other)
+
+    def __ge__(self, other):
+        return self.real >= _real(other)
+
+    def __neg__(self):
+        return Dual(-self.real, -self.dual)
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        return -self if self.real < 0 else self
+
+    def __add__(self, other):
+        if isinstance(other, Dual):
+            return Dual(self.real + other.real, self.dual + other.dual)
+        return Dual(self.real + other, self.dual)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if isinstance(other, Dual):
+            return Dual(self.real - other.real, self.dual - other.dual)
+        return Dual(self.real - other, self.dual)
+
+    def __rsub__(self, other):
+        return Dual(other - self.real, -self.dual)
+
+    def __mul__(self, other):
+        if isinstance(other, Dual):
+            return Dual(self.real*other.real, self.real*other.dual + self.dual*other.real)
+        return Dual(self.real*other, self.dual*other)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if isinstance(other, Dual):
+            return Dual(self.real / other.real, (self.dual*other.real - self.real*other.dual) / (other.real*other.real))
+        return Dual(self.real / other, self.dual / other)
+
+    def __rtruediv__(self, other):
+        return Dual(other / self.real, -other*self.dual / (self.real*self.real))
+
+    __div__ = __truediv__
+    __rdiv__ = __rtruediv__
+
+    def __pow__(self, other):
+        if isinstance(other, Dual):
+            return (other * self.log()).exp()
+        elif other == 0:
+            return Dual(self.real ** 0, 0)
+        return Dual(self.real ** other, other * self.real ** (other - 1) * self.dual)
+
+    def __rpow__(self, other):
+        value = other ** self.real
+        return Dual(value, value * math.log(other) * self.dual)
+
+    def sin(self):
+        return Dual(math.sin(self.real), math.cos(self.real) * self.dual)
+
+    def cos(self):
+        return Dual(math.cos(self.real), -math.sin(self.real) * self.dual)
+
+    def exp(self):
+        value = math.exp(self.real)
+        return Dual(value, value * self.dual)
+
+    def log(self):
+        return Dual(math.log(self.real), self.dual / self.real)
+
+
+numbers.Number.register(Dual)
+
+
+def _real(x):
+    return x.real if isinstance(x, Dual) else x
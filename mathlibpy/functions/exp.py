@@ -5,6 +5,7 @@ Author: Jack Romo <sharrackor@gmail.com>
 """
 
 
+import batch
 import function
 import polynomial
 import numbers
@@ -20,9 +21,15 @@ class Exp(function.Function):
         # TODO: Compute this via Maclaurin series or use constants.E
         return math.e ** x
 
-    def get_derivative(self):
+    def _evaluate_many(self, xs):
+        return batch.exp(xs)
+
+    def _derivative(self):
         return self
 
+    def _compile(self, compiler, arg):
+        return compiler.emit("math.e ** {0}".format(arg))
+
     def __eq__(self, other):
         return isinstance(other, Exp)
 
@@ -30,28 +37,98 @@ class Exp(function.Function):
 class Power(function.Function):
     """
     Adjustment of Exp for general powers of functions to functions.
+    Constant parts are found once, whenever the base or exponent is set: integer exponents are applied by **,
+    and the log of a constant base is precomputed.
     """
 
     def __init__(self, f1, f2):
-        if isinstance(f1, function.Function):
-            self.f1 = f1
-        elif isinstance(f1, numbers.Number):
-            self.f1 = function.Constant(f1)
-        if isinstance(f2, function.Function):
-            self.f2 = f2
-        elif isinstance(f2, numbers.Number):
-            self.f2 = function.Constant(f2)
         self.exp = Exp()
         self.log = Log()
+        self.f1 = f1
+        self.f2 = f2
+
+    @property
+    def f1(self):
+        return self._f1
+
+    @f1.setter
+    def f1(self, f1):
+        replaced = "_f1" in self.__dict__
+        self._f1 = _as_function(f1)
+        # Fast path: e ** (f2 * log(b)) for constant base b > 0
+        base = _constant_value(self._f1)
+        self._log_base = math.log(base) if isinstance(base, numbers.Real) and base > 0 else None
+        if replaced:
+            self._clear_caches()
+
+    @property
+    def f2(self):
+        return self._f2
+
+    @f2.setter
+    def f2(self, f2):
+        replaced = "_f2" in self.__dict__
+        self._f2 = _as_function(f2)
+        # Fast path: f1 ** n for integer constant n
+        self._exponent = _constant_value(self._f2)
+        if not (isinstance(self._exponent, numbers.Integral) or
+                (isinstance(self._exponent, float) and self._exponent.is_integer())):
+            self._exponent = None
+        if replaced:
+            self._clear_caches()
 
     def _evaluate(self, x):
-        return self.exp(self.f2(x) * self.log(self.f1(x)))
+        if self._exponent is not None:
+            return self.f1(x) ** self._exponent
+        elif self._log_base is not None:
+            return self.exp._evaluate(self.f2(x) * self._log_base)
+        return self.exp._evaluate(self.f2(x) * self.log._evaluate(self.f1(x)))
+
+    def _children(self):
+        return self.f1, self.f2
+
+    def _rebuild(self, children):
+        return Power(*children)
+
+    def _combine(self, x, values):
+        if self._exponent is not None:
+            return values[0] ** self._exponent
+        elif self._log_base is not None:
+            return self.exp._evaluate(values[1] * self._log_base)
+        return self.exp._evaluate(values[1] * self.log._evaluate(values[0]))
+
+    def _evaluate_many(self, xs):
+        if self._exponent is not None:
+            return batch.power(self.f1._evaluate_many(xs), self._exponent)
+        elif self._log_base is not None:
+            return batch.exp(batch.mul_scalar(self.f2._evaluate_many(xs), self._log_base))
+        return batch.exp(batch.mul(self.f2._evaluate_many(xs), batch.log(self.f1._evaluate_many(xs))))
 
-    def get_derivative(self):
+    def _derivative(self):
+        if self._exponent is not None:
+            # (f ** n)' = n f ** (n - 1) f'
+            return (function.Constant(self._exponent) * Power(self.f1, self._exponent - 1) *
+                    self.f1.get_derivative())
+        elif self._log_base is not None:
+            # (b ** g)' = log(b) b ** g g'
+            return function.Constant(self._log_base) * self * self.f2.get_derivative()
         return self.exp(self.f2 * self.log(self.f1)).get_derivative()
 
+    def _compile(self, compiler, arg):
+        if self._exponent is not None:
+            return compiler.emit("({0}) ** {1}".format(compiler.compile(self.f1, arg), compiler.bind(self._exponent)))
+        power = compiler.compile(self.f2, arg)
+        if self._log_base is not None:
+            return compiler.emit("math.e ** ({0} * {1})".format(power, compiler.bind(self._log_base)))
+        base = compiler.compile(self.f1, arg)
+        return compiler.emit("math.e ** ({0} * math.log({1}))".format(power, base))
+
     def __eq__(self, other):
-        if not isinstance(other, Power):
+        if self is other:
+            return True
+        elif not isinstance(other, Power):
+            return False
+        elif hash(self) != hash(other):
             return False
         return (self.f1 == other.f1) and (self.f2 == other.f2)
 
@@ -62,11 +139,20 @@ class Log(function.Function):
     """
 
     def _evaluate(self, x):
-        return math.log(x)
+        try:
+            return math.log(x)
+        except TypeError:
+            return x.log()      # Number type math cannot handle, eg. dual.Dual
+
+    def _evaluate_many(self, xs):
+        return batch.log(xs)
 
-    def get_derivative(self):
+    def _derivative(self):
         return function.Constant(1) / polynomial.Polynomial([0, 1])
 
+    def _compile(self, compiler, arg):
+        return compiler.emit("math.log({0})".format(arg))
+
     def __eq__(self, other):
         return isinstance(other, Log)
 
@@ -74,28 +160,115 @@ class Log(function.Function):
 class LogBase(function.Function):
     """
     Adjustment of Log to accommodate arbitrary bases.
+    The log of a positive numeric base is computed once, whenever the base is set.
+    Other numeric bases are left to fail when evaluated, as their log is undefined.
     """
 
     def __init__(self, b):
         self.log = Log()
-        if isinstance(b, numbers.Number) or isinstance(b, function.Function):
-            self.b = b
+        self.b = b
+
+    @property
+    def b(self):
+        return self._b
+
+    @b.setter
+    def b(self, b):
+        replaced = "_b" in self.__dict__
+        if isinstance(b, function.Function):
+            self._log_b = None
+        elif isinstance(b, numbers.Number):
+            self._log_b = self.log._evaluate(b) if isinstance(b, numbers.Real) and b > 0 else None
         else:
             raise TypeError("Base must either be a Function or a Number")
+        self._b = b
+        if replaced:
+            self._clear_caches()
+
+    def _log_of_base(self):
+        """
+        Returns:
+            number: Log of numeric base, precomputed if it is positive.
+        """
+        if self._log_b is None:
+            return self.log._evaluate(self.b)
+        return self._log_b
 
     def _evaluate(self, x):
         if isinstance(self.b, function.Function):
-            return self.log(x) / self.log(self.b(x))
-        else:
-            return self.log(x) / self.log(self.b)
+            return self.log._evaluate(x) / self.log._evaluate(self.b(x))
+        return self.log._evaluate(x) / self._log_of_base()
 
-    def get_derivative(self):
+    def _children(self):
+        if isinstance(self.b, function.Function):
+            return self.b,
+        return ()
+
+    def _rebuild(self, children):
+        if children:
+            return LogBase(children[0])
+        return self
+
+    def _key(self):
+        if isinstance(self.b, function.Function):
+            return ()
+        return self.b,
+
+    def _combine(self, x, values):
+        if values:
+            return self.log._evaluate(x) / self.log._evaluate(values[0])
+        return self._evaluate(x)
+
+    def _evaluate_many(self, xs):
+        if isinstance(self.b, function.Function):
+            return batch.div(batch.log(xs), batch.log(self.b._evaluate_many(xs)))
+        return batch.div_scalar(batch.log(xs), self._log_of_base())
+
+    def _derivative(self):
         if isinstance(self.b, function.Function):
             return ((function.Constant(1) / Log()(self.b)) * Log()).get_derivative()
+        elif self._log_b is None:
+            return ((function.Constant(1) / Log()(function.Constant(self.b))) * Log()).get_derivative()
         else:
-            return ((function.Constant(1) / function.Constant(Log()(self.b))) * Log()).get_derivative()
+            return ((function.Constant(1) / function.Constant(self._log_b)) * Log()).get_derivative()
+
+    def _compile(self, compiler, arg):
+        if isinstance(self.b, function.Function):
+            return compiler.emit("math.log({0}) / math.log({1})".format(arg, compiler.compile(self.b, arg)))
+        elif self._log_b is None:
+            return compiler.emit("math.log({0}) / math.log({1})".format(arg, compiler.bind(self.b)))
+        return compiler.emit("math.log({0}) / {1}".format(arg, compiler.bind(self._log_b)))
 
     def __eq__(self, other):
-        if not isinstance(other, LogBase):
+        if self is other:
+            return True
+        elif not isinstance(other, LogBase):
+            return False
+        elif hash(self) != hash(other):
             return False
         return self.b == other.b
+
+
+def _as_function(f):
+    """
+    Returns:
+        Function: f, or a Constant if f is a Number.
+
+    Raises:
+        TypeError: f is neither a Function nor a Number.
+    """
+    if isinstance(f, function.Function):
+        return f
+    elif isinstance(f, numbers.Number):
+        return function.Constant(f)
+    raise TypeError("Base and exponent must either be Functions or Numbers")
+
+
+def _constant_value(f):
+    """
+    Returns:
+        number, None: Value of f if it is a numeric Constant, None otherwise.
+    """
+    if isinstance(f, function.Constant) and isinstance(f.val, numbers.Number):
+        return f.val
+    return None
@@ -4,9 +4,16 @@ Function class and all FunctionBinaryTreeNode subclasses.
 Author: Jack Romo <sharrackor@gmail.com>
 """
 
-
+from __future__ import division
 import abc
 import numbers
+import batch
+import codegen
+import dag
+import dual
+import interval
+import reverse
+import traversal
 
 
 class Function(object):
@@ -19,29 +26,55 @@ class Function(object):
     def __call__(self, x):
         """
         Args:
-            x (Function, number): Either number from domain fed into self, or function to compose with self.
+            x (Function, number, tuple): Either number from domain fed into self, function to compose with self,
+                                         or tuple of numbers fed into a multivariate function (see Variable).
 
         Returns:
             Function: Self composed with x if x is Function
-            number: self applied to x if x is Number
+            number: self applied to x if x is Number or tuple
         """
-        if isinstance(x, numbers.Number):
+        if isinstance(x, numbers.Number) or isinstance(x, tuple):
             return self._evaluate(x)
         elif isinstance(x, Function):
             return FunctionCompNode(self, x)
         else:
-            raise TypeError("Can only be called on Function or Number")
+            raise TypeError("Can only be called on Function, Number or tuple")
 
     @abc.abstractmethod
     def _evaluate(self, x):
         """
         Take a number x, and return f(x).
-        Input x is guaranteed to be a Number.
+        Input x is guaranteed to be a Number, or a tuple of Numbers for multivariate functions.
 
         Args:
             x (number): Value to be mapped by self to result.
         """
 
+    def evaluate_many(self, xs):
+        """
+        Evaluate self at many points at once.
+        Every node of the tree is applied to the whole batch of points in one step,
+        using NumPy if it is installed.
+
+        Args:
+            xs (sequence, array.array, numpy.ndarray): Numbers from domain to be mapped by self.
+
+        Returns:
+            numpy.ndarray, array.array: Array of floats whose ith element is self(xs[i]).
+                                        A NumPy array if NumPy is installed, else an array.array.
+        """
+        return batch.to_array(self._evaluate_many(batch.to_batch(xs)))
+
+    def _evaluate_many(self, xs):
+        """
+        Take a batch of numbers xs (see batch module), and return a batch of f(x) for each x.
+        Subclasses override this with batch operations; by default _evaluate is applied to each point.
+
+        Args:
+            xs: Batch of values to be mapped by self.
+        """
+        return batch.apply(self._evaluate, xs)
+
     def __add__(self, other):
         """
         Args:
@@ -90,21 +123,447 @@ class Function(object):
             raise TypeError("Other must be of type Function")
         return FunctionDivNode(self, other)
 
+    __truediv__ = __div__
+
+    def compile(self):
+        """
+        Flatten own tree into a single generated Python function, for fast repeated evaluation.
+
+        Returns:
+            function: Python function g of one number such that g(x) == self(x).
+        """
+        return codegen.Compiler().build(self)
+
+    def _compile(self, compiler, arg):
+        """
+        Emit code evaluating self at arg into compiler.
+        Subclasses override this with inline code; by default self is bound and its _evaluate is called.
+
+        Args:
+            compiler (codegen.Compiler): Compiler to emit code into.
+            arg (str): Name or literal holding input number.
+
+        Returns:
+            str: Name or literal holding self(arg).
+        """
+        return compiler.emit("{0}._evaluate({1})".format(compiler.bind(self), arg))
+
+    def value_and_derivative(self, x):
+        """
+        Evaluate self and its derivative at a point in one pass, by forward-mode automatic differentiation.
+        No derivative tree is built; see dual.Dual. Trees too deep to recurse through are evaluated iteratively.
+
+        Args:
+            x (number): Point at which to evaluate self and its derivative.
+
+        Returns:
+            tuple(number, number): (f(x), f'(x))
+        """
+        if not isinstance(x, numbers.Number):
+            raise TypeError("Can only be evaluated on a Number")
+        d = dual.Dual(x, 1)
+        try:
+            result = self(d)
+        except RuntimeError:
+            result = traversal.evaluate(self, d)    # Maximum recursion depth exceeded
+        if isinstance(result, dual.Dual):
+            return result.real, result.dual
+        return result, 0    # Result independent of x, eg. a Constant
+
+    def value_and_gradient(self, point):
+        """
+        Evaluate self and its gradient at a point in one forward and one backward pass,
+        by reverse-mode automatic differentiation. No derivative tree is built; see reverse.Tape.
+
+        Args:
+            point (tuple, number): Point at which to evaluate self, as a tuple of numbers (one per Variable),
+                                   or a single number for functions of one variable.
+
+        Returns:
+            tuple(number, list): (f(point), list of partial derivatives of f, one per coordinate of point).
+        """
+        if isinstance(point, numbers.Number):
+            point = (point,)
+        elif not isinstance(point, tuple) or not all(isinstance(p, numbers.Number) for p in point):
+            raise TypeError("Point must be a Number or tuple of Numbers")
+        tape = reverse.Tape()
+        inputs = tuple(tape.variable(p) for p in point)
+        result = self(inputs if len(inputs) > 1 else inputs[0])
+        value = result.value if isinstance(result, reverse.TapeValue) else result
+        return value, tape.gradient(result, inputs)
+
+    def gradient(self, point):
+        """
+        Args:
+            point (tuple, number): Point at which to evaluate gradient; see value_and_gradient.
+
+        Returns:
+            list: Partial derivatives of self at point, one per coordinate of point.
+        """
+        return self.value_and_gradient(point)[1]
+
+    def taylor(self, a, n):
+        """
+        Build the Taylor polynomial of self about a, by evaluating self on a truncated power series
+        (see series.PowerSeries) rather than building n derivative trees. Each node takes O(n^2) time.
+
+        Args:
+            a (number): Point to expand about; 0 for the Maclaurin polynomial.
+            n (int): Order of polynomial, >= 0. self must be n times differentiable at a.
+
+        Returns:
+            ShiftedPolynomial: Polynomial p in powers of x - a, of degree at most n, whose first n derivatives at a
+                               equal those of self. p.coeffs are the Taylor coefficients and p.center is a.
+                               p.to_dense() gives p as a Polynomial in x, exactly if a and the coefficients are
+                               exact, but that expansion cancels catastrophically for large inexact a.
+        """
+        import polynomial
+        import series
+        if not isinstance(n, int):
+            raise TypeError("Order must be an integer")
+        elif n < 0:
+            raise ValueError("Order must be >= 0")
+        return polynomial.ShiftedPolynomial(series.taylor_coefficients(self, a, n), a)
+
+    def bound(self, lo, hi, pieces=1):
+        """
+        Find guaranteed bounds of self over [lo, hi] by interval arithmetic; see interval.Interval.
+        The bounds contain every value of self on [lo, hi], but may be loose. Splitting the range into pieces,
+        each bounded separately, tightens them.
+
+        Args:
+            lo (number): Lower end of range.
+            hi (number): Upper end of range, >= lo.
+            pieces (int): Number of equal pieces to split the range into.
+
+        Returns:
+            interval.Interval: Interval containing self(x) for every x in [lo, hi]. Ends may be infinite,
+                               eg. if a divisor may be 0 on the range.
+        """
+        if not isinstance(pieces, int):
+            raise TypeError("Number of pieces must be an integer")
+        elif pieces < 1:
+            raise ValueError("Number of pieces must be >= 1")
+        ends = [lo + (hi - lo) * i / pieces for i in range(pieces)] + [hi]
+        result = None
+        for a, b in zip(ends, ends[1:]):
+            value = self(interval.Interval(a, b))
+            value = value if isinstance(value, interval.Interval) else interval.Interval(value)
+            result = value if result is None else result.hull(value)
+        return result
+
+    def approximate(self, interval, tol=1e-12, max_degree=1024):
+        """
+        Build a cheap approximation of self on an interval, as a Chebyshev interpolant.
+        See interpolation.approximate.
+
+        Args:
+            interval (tuple): (lo, hi), ends of interval. self must be smooth on it.
+            tol (float): Target max absolute error.
+            max_degree (int): Max degree of interpolant.
+
+        Returns:
+            interpolation.Chebyshev: Approximation of self, defined only on the interval,
+                                     with estimated max error in its error attribute.
+        """
+        import interpolation
+        lo, hi = interval
+        return interpolation.approximate(self, lo, hi, tol, max_degree)
+
+    def cached(self, maxsize=1024, maxbytes=None, per_node=False):
+        """
+        Wrap self in a least recently used cache of its values, for expensive functions evaluated
+        at the same points many times. See cache.CachedFunction.
+
+        Args:
+            maxsize (int, None): Max number of values cached, or None for no limit.
+            maxbytes (int, None): Max approximate memory used by cached inputs and values, or None for no limit.
+            per_node (bool): Also compute each distinct subtree of self only once per input.
+
+        Returns:
+            cache.CachedFunction: Function equal to self, with hit and miss statistics given by its cache_info.
+        """
+        import cache
+        return cache.CachedFunction(self, maxsize, maxbytes, per_node)
+
+    def integrate(self, a, b, tol=1e-10, method="gauss-kronrod", pool=None):
+        """
+        Numerically integrate self over [a, b]. See quadrature module.
+
+        Args:
+            a (number): Lower limit.
+            b (number): Upper limit.
+            tol (float): Target absolute and relative error.
+            method (str): "gauss-kronrod" for adaptive Gauss-Kronrod quadrature, or "tanh-sinh" for
+                          double exponential quadrature, which suits functions with singularities at a or b.
+            pool (multiprocessing.Pool): Optional pool of processes to evaluate self with in parallel.
+
+        Returns:
+            tuple(float, float): (integral, estimate of absolute error)
+        """
+        import quadrature
+        if method == "gauss-kronrod":
+            return quadrature.gauss_kronrod(self, a, b, tol, tol, pool=pool)
+        elif method == "tanh-sinh":
+            return quadrature.tanh_sinh(self, a, b, tol, tol, pool=pool)
+        raise ValueError("Unknown method: {0}".format(method))
+
+    def minimize(self, lo, hi, tol=1e-8, method="global"):
+        """
+        Find the least value of self over [lo, hi]. See optimize module.
+
+        Args:
+            lo (number): Lower end of interval.
+            hi (number): Upper end of interval.
+            tol (float): For "global", tolerance on the value of the minimum. For local methods,
+                         tolerance on its location, relative to its magnitude.
+            method (str): "global" for the global minimum by branch and bound, or "brent" or "golden-section"
+                          for a local minimum, which is only the least value if self has a single minimum on [lo, hi].
+
+        Returns:
+            tuple(number, number): (x, self(x)), where x is the point at which self is least.
+        """
+        import optimize
+        if method == "global":
+            return optimize.global_minimum(self, lo, hi, tol)[:2]
+        elif method == "brent":
+            return optimize.brent(self, lo, hi, rtol=tol)
+        elif method == "golden-section":
+            return optimize.golden_section(self, lo, hi, rtol=tol)
+        raise ValueError("Unknown method: {0}".format(method))
+
+    def maximize(self, lo, hi, tol=1e-8, method="global"):
+        """
+        Find the greatest value of self over [lo, hi]; see minimize.
+
+        Returns:
+            tuple(number, number): (x, self(x)), where x is the point at which self is greatest.
+        """
+        x, value = (Constant(-1) * self).minimize(lo, hi, tol, method)
+        return x, -value
+
+    def _children(self):
+        """
+        Returns:
+            tuple[Function]: Functions self is built from, if any. For composition f1(f2), this is (f1, f2).
+        """
+        return ()
+
+    def _rebuild(self, children):
+        """
+        Args:
+            children (tuple[Function]): Replacements for each of self._children().
+
+        Returns:
+            Function: Function of same type and parameters as self, built from children instead.
+        """
+        return self
+
+    def _key(self):
+        """
+        Returns:
+            tuple: Hashable parameters that, with type and children, determine the structure of self.
+        """
+        return ()
+
+    def _combine(self, x, values):
+        """
+        Take a number x and the values of self._children() at x, and return f(x).
+        Lets evaluators compute each child themselves, eg. once per shared node.
+        Not used for composition, whose first child is applied to the value of the second instead.
+
+        Args:
+            x (number): Value to be mapped by self to result.
+            values (list): Value of each of self._children() at x.
+        """
+        return self._evaluate(x)
+
+    def share(self, table=None):
+        """
+        Intern every node of own tree, so that structurally identical subtrees become one shared node.
+        Nodes of the result must not be mutated, as they may be shared with other functions.
+
+        Args:
+            table (dag.InternTable, None): Table to intern nodes into. Defaults to a global table.
+
+        Returns:
+            Function: Function equal to self, whose tree is a DAG without duplicate subtrees.
+        """
+        return (table or dag.default_table).intern(self)
+
+    def evaluate_shared(self, x):
+        """
+        Evaluate self, computing each node reachable from self only once per input.
+        Most effective on the result of share().
+
+        Args:
+            x (number): Value to be mapped by self to result.
+
+        Returns:
+            number: self(x)
+        """
+        if not isinstance(x, numbers.Number):
+            raise TypeError("Can only be evaluated on a Number")
+        return dag.evaluate(self, x)
+
+    def evaluate_iterative(self, x):
+        """
+        Evaluate self without recursion, for trees too deep to call directly without exceeding
+        Python's recursion limit. See traversal.evaluate.
+
+        Args:
+            x (number, tuple): Value to be mapped by self to result, or tuple of numbers for multivariate functions.
+
+        Returns:
+            number: self(x)
+        """
+        if not (isinstance(x, numbers.Number) or isinstance(x, tuple)):
+            raise TypeError("Can only be evaluated on a Number or tuple")
+        return traversal.evaluate(self, x)
+
     @abc.abstractmethod
     def __eq__(self, other):
         """
         Notes:
             Currently checks for exact equivalences between functions. Requires intelligent search for identities.
+            Implementations may return False early if hash(self) != hash(other).
         """
 
-    @abc.abstractmethod
+    def __ne__(self, other):
+        return not self == other
+
+    def __setattr__(self, name, value):
+        replaced = not name.startswith("_") and name in self.__dict__
+        object.__setattr__(self, name, value)
+        if replaced:
+            self._clear_caches()    # Parameter or child replaced after construction, eg. f.f1 = g
+
+    def _clear_caches(self):
+        """
+        Forget cached hash, derivative and simplification of self, and of every Function containing self.
+        Must be called when self is mutated after construction; Functions do so themselves when a public attribute
+        is reassigned or a coefficient set, but not when a list attribute is changed in place, eg. p.coeffs[0] = 1.
+        Caches are stamped with the number of mutations so far, so those of other Functions are only rebuilt
+        when next used.
+        """
+        global _mutations
+        _mutations += 1
+        self._hash = None
+        self._derivative_cache = None
+        self._simplified = None
+
+    _hash = None
+    _hash_stamp = None
+
+    def __hash__(self):
+        """
+        Structural hash, consistent with __eq__ and computed once per node, until any Function is mutated.
+        Functions used as dict keys or set members must not be mutated afterwards.
+        Unhashed nodes are hashed children first without recursion, so deep trees can be hashed.
+        """
+        if self._hash_stamp != _mutations:
+            for node in traversal.postorder(self, lambda n: n._hash_stamp != _mutations):
+                node._hash = hash((_eq_class(type(node)), node._key(), tuple(hash(c) for c in node._children())))
+                node._hash_stamp = _mutations
+        return self._hash
+
+    _derivative_cache = None
+    _derivative_stamp = None
+
     def get_derivative(self):
         """
         Return own derivative as a function.
+        The derivative is built once, on the first call, and reused afterwards until any Function is mutated,
+        including the derivative itself.
+        Derivatives of nodes below self are built first, children before parents, so that each node's
+        _derivative finds those of its children cached, and deep trees are differentiated without recursion.
+
+        Returns:
+             Function: A function that, for input x, gets own gradient at (x, f(x)).
+        """
+        if self._derivative_stamp != _mutations:
+            # Nodes overriding get_derivative differentiate their own children, when their parent calls it
+            pending = lambda n: n._derivative_stamp != _mutations and not _overrides_get_derivative(n)
+            for node in traversal.postorder(self, pending):
+                node._derivative_cache = node._derivative()
+                node._derivative_stamp = _mutations
+        return self._derivative_cache
+
+    def _derivative(self):
+        """
+        Build own derivative as a function. Called by get_derivative once per node, until any Function is mutated.
+        Subclasses must override either this or, as before it existed, get_derivative.
 
         Returns:
              Function: A function that, for input x, gets own gradient at (x, f(x)).
         """
+        raise NotImplementedError("{0} does not implement _derivative".format(type(self).__name__))
+
+    _simplified = None
+    _simplified_stamp = None
+
+    def simplify(self):
+        """
+        Simplify own tree algebraically, eg. fold constants and remove multiplications by 0 and 1.
+        See rewrite.simplify for the rules applied. The result is computed once and reused afterwards,
+        until any Function is mutated.
+
+        Returns:
+            Function: A function equal in value to self wherever self is defined.
+        """
+        if self._simplified_stamp != _mutations:
+            import rewrite    # rewrite depends on the concrete Function subclasses, so import late
+            self._simplified = rewrite.simplify(self)
+            self._simplified_stamp = _mutations
+        return self._simplified
+
+    def get_nth_derivative(self, n, simplify=False):
+        """
+        Each derivative is built from the previous one, and all are cached, so repeated calls are cheap.
+
+        Args:
+            n (int): Order of derivative, n >= 0.
+            simplify (bool): Simplify each derivative before taking the next one.
+                             This stops repeated derivatives of products and quotients growing exponentially.
+
+        Returns:
+            Function: The nth derivative of self.
+        """
+        if not isinstance(n, int):
+            raise TypeError("Order of derivative must be an integer")
+        elif n < 0:
+            raise ValueError("Order of derivative must be >= 0")
+        result = self
+        for _ in range(n):
+            result = result.get_derivative()
+            if simplify:
+                result = result.simplify()
+        return result
+
+
+_mutations = 0     # Number of Functions mutated so far; caches filled before the last mutation may be stale
+
+_eq_classes = {}
+
+
+def _overrides_get_derivative(f):
+    """
+    Returns:
+        bool: True if the class of f overrides get_derivative rather than _derivative, as Functions written
+              before _derivative existed do.
+    """
+    return type(f).get_derivative.__func__ is not Function.get_derivative.__func__
+
+
+def _eq_class(cls):
+    """
+    Returns:
+        type: The class in cls' MRO defining its __eq__. Functions of different types compare
+              equal only if their types share this class, so it is hashed instead of the type.
+    """
+    if cls not in _eq_classes:
+        _eq_classes[cls] = next(c for c in cls.__mro__ if "__eq__" in c.__dict__)
+    return _eq_classes[cls]
 
 
 class FunctionBinaryTreeNode(Function):
@@ -121,10 +580,28 @@ class FunctionBinaryTreeNode(Function):
         self.f1 = f1
         self.f2 = f2
 
+    def _children(self):
+        return self.f1, self.f2
+
+    def _rebuild(self, children):
+        return type(self)(*children)
+
     def __eq__(self, other):
-        if not isinstance(other, FunctionBinaryTreeNode):
-            return False
-        return (self.f1 == other.f1) and (self.f2 == other.f2)
+        # Pairs of nodes are compared from an explicit stack, so deep trees can be compared
+        pairs = [(self, other)]
+        while pairs:
+            a, b = pairs.pop()
+            if a is b:
+                continue
+            elif _eq_class(type(a)) is not FunctionBinaryTreeNode:
+                if not a == b:
+                    return False
+            elif not isinstance(b, FunctionBinaryTreeNode) or type(a) != type(b) or hash(a) != hash(b):
+                return False
+            else:
+                pairs.append((a.f2, b.f2))
+                pairs.append((a.f1, b.f1))
+        return True
 
 
 class FunctionAddNode(FunctionBinaryTreeNode):
@@ -136,9 +613,18 @@ class FunctionAddNode(FunctionBinaryTreeNode):
     def _evaluate(self, x):
         return self.f1(x) + self.f2(x)
 
-    def get_derivative(self):
+    def _combine(self, x, values):
+        return values[0] + values[1]
+
+    def _evaluate_many(self, xs):
+        return batch.add(self.f1._evaluate_many(xs), self.f2._evaluate_many(xs))
+
+    def _derivative(self):
         return self.f1.get_derivative() + self.f2.get_derivative()
 
+    def _compile(self, compiler, arg):
+        return compiler.emit("{0} + {1}".format(compiler.compile(self.f1, arg), compiler.compile(self.f2, arg)))
+
 
 class FunctionSubNode(FunctionBinaryTreeNode):
     """
@@ -149,9 +635,18 @@ class FunctionSubNode(FunctionBinaryTreeNode):
     def _evaluate(self, x):
         return self.f1(x) - self.f2(x)
 
-    def get_derivative(self):
+    def _combine(self, x, values):
+        return values[0] - values[1]
+
+    def _evaluate_many(self, xs):
+        return batch.sub(self.f1._evaluate_many(xs), self.f2._evaluate_many(xs))
+
+    def _derivative(self):
         return self.f1.get_derivative() - self.f2.get_derivative()
 
+    def _compile(self, compiler, arg):
+        return compiler.emit("{0} - {1}".format(compiler.compile(self.f1, arg), compiler.compile(self.f2, arg)))
+
 
 class FunctionMulNode(FunctionBinaryTreeNode):
     """
@@ -162,7 +657,13 @@ class FunctionMulNode(FunctionBinaryTreeNode):
     def _evaluate(self, x):
         return self.f1(x) * self.f2(x)
 
-    def get_derivative(self):
+    def _combine(self, x, values):
+        return values[0] * values[1]
+
+    def _evaluate_many(self, xs):
+        return batch.mul(self.f1._evaluate_many(xs), self.f2._evaluate_many(xs))
+
+    def _derivative(self):
         # Use product rule
         u = self.f1
         v = self.f2
@@ -170,6 +671,9 @@ class FunctionMulNode(FunctionBinaryTreeNode):
         dv = self.f2.get_derivative()
         return (du * v) + (u * dv)
 
+    def _compile(self, compiler, arg):
+        return compiler.emit("{0} * {1}".format(compiler.compile(self.f1, arg), compiler.compile(self.f2, arg)))
+
 
 class FunctionDivNode(FunctionBinaryTreeNode):
     """
@@ -178,12 +682,24 @@ class FunctionDivNode(FunctionBinaryTreeNode):
     """
 
     def _evaluate(self, x):
-        if self.f2(x) == 0:
-            raise Exception("Division by Zero detected")
+        den = self.f2(x)
+        if den == 0:
+            raise ZeroDivisionError("Division by Zero detected")
         else:
-            return self.f1(x) / float(self.f2(x))
+            return self.f1(x) / den
 
-    def get_derivative(self):
+    def _combine(self, x, values):
+        if values[1] == 0:
+            raise ZeroDivisionError("Division by Zero detected")
+        return values[0] / values[1]
+
+    def _evaluate_many(self, xs):
+        den = self.f2._evaluate_many(xs)
+        if batch.any_zero(den):
+            raise ZeroDivisionError("Division by Zero detected")
+        return batch.div(self.f1._evaluate_many(xs), den)
+
+    def _derivative(self):
         # Use quotient rule
         u = self.f1
         v = self.f2
@@ -191,6 +707,12 @@ class FunctionDivNode(FunctionBinaryTreeNode):
         dv = self.f2.get_derivative()
         return ((du * v) - (u * dv)) / (v * v)
 
+    def _compile(self, compiler, arg):
+        num = compiler.compile(self.f1, arg)
+        den = compiler.compile(self.f2, arg)
+        compiler.emit_statement("if {0} == 0: raise ZeroDivisionError('Division by Zero detected')".format(den))
+        return compiler.emit("{0} / {1}".format(num, den))
+
 
 class FunctionCompNode(FunctionBinaryTreeNode):
     """
@@ -201,9 +723,15 @@ class FunctionCompNode(FunctionBinaryTreeNode):
     def _evaluate(self, x):
         return self.f1(self.f2(x))
 
-    def get_derivative(self):
+    def _evaluate_many(self, xs):
+        return self.f1._evaluate_many(self.f2._evaluate_many(xs))
+
+    def _derivative(self):
         return self.f2.get_derivative() * FunctionCompNode(self.f1.get_derivative(), self.f2)
 
+    def _compile(self, compiler, arg):
+        return compiler.compile(self.f1, compiler.compile(self.f2, arg))
+
 
 class Constant(Function):
     """
@@ -217,10 +745,100 @@ class Constant(Function):
     def _evaluate(self, x):
         return self.val
 
-    def get_derivative(self):
+    def _key(self):
+        return self.val,
+
+    def _is_polynomial(self, other):
+        """
+        Returns:
+            bool: True if other is a polynomial, which a numeric Constant combines with into a single polynomial,
+                  as it does when the polynomial comes first.
+        """
+        import polynomial
+        return (isinstance(other, (polynomial.Polynomial, polynomial.SparsePolynomial, polynomial.ShiftedPolynomial))
+                and isinstance(self.val, numbers.Number))
+
+    def __add__(self, other):
+        """
+        Returns:
+            Polynomial, SparsePolynomial, ShiftedPolynomial: Sum, if other is a polynomial.
+            Function: Self combined with other by addition otherwise.
+        """
+        if self._is_polynomial(other):
+            return other + self
+        return super(Constant, self).__add__(other)
+
+    def __sub__(self, other):
+        """
+        Returns:
+            Polynomial, SparsePolynomial, ShiftedPolynomial: Difference, if other is a polynomial.
+            Function: Self combined with other by subtraction otherwise.
+        """
+        if self._is_polynomial(other):
+            return other * Constant(-1) + self
+        return super(Constant, self).__sub__(other)
+
+    def __mul__(self, other):
+        """
+        Returns:
+            Polynomial, SparsePolynomial, ShiftedPolynomial: Product, if other is a polynomial.
+            Function: Self combined with other by multiplication otherwise.
+        """
+        if self._is_polynomial(other):
+            return other * self
+        return super(Constant, self).__mul__(other)
+
+    def _evaluate_many(self, xs):
+        return batch.full(xs, self.val)
+
+    def _derivative(self):
         return Constant(0)
 
+    def _compile(self, compiler, arg):
+        return compiler.bind(self.val)
+
     def __eq__(self, other):
         if not isinstance(other, Constant):
             return False
         return self.val == other.val
+
+
+class Variable(Function):
+    """
+    The ith coordinate of a point, ie. f(x_0, x_1, ...) = x_i.
+    Used to build multivariate functions, which are evaluated on tuples of numbers. For example,
+    Sin()(Variable(0) * Variable(1)) is sin(xy), and is evaluated as f((x, y)).
+    On a single number, Variable(0) is the identity.
+    """
+
+    def __init__(self, index):
+        """
+        Args:
+            index (int): Index of the coordinate, >= 0.
+        """
+        if not isinstance(index, int):
+            raise TypeError("Index must be an integer")
+        elif index < 0:
+            raise ValueError("Index must be >= 0")
+        self.index = index
+
+    def _evaluate(self, x):
+        if isinstance(x, tuple):
+            return x[self.index]
+        elif self.index == 0:
+            return x
+        else:
+            raise TypeError("Variable {0} requires a tuple input".format(self.index))
+
+    def _key(self):
+        return self.index,
+
+    def _derivative(self):
+        if self.index == 0:
+            return Constant(1)
+        raise TypeError("Multivariate functions have no single derivative; use gradient")
+
+    def __eq__(self, other):
+        if not isinstance(other, Variable):
+            return False
+        return self.index == other.index
@@ -0,0 +1,303 @@
+"""
+Polynomial evaluation at many points, polynomial interpolation through many points,
+and Chebyshev approximation of Functions.
+
+Author: Jack Romo <sharrackor@gmail.com>
+"""
+
+from __future__ import division
+import math
+import batch
+import function
+import polynomial
+
+
+def subproduct_tree(xs):
+    """
+    Build the tree of products of (x - xs[i]), used by multipoint evaluation and interpolation.
+
+    Args:
+        xs (list): Points, at least one.
+
+    Returns:
+        list[list[list]]: Levels of the tree from the leaves up. Level 0 holds the coefficients of x - xs[i],
+                          and node j of each higher level is the product of nodes 2j and 2j+1 below it
+                          (or just node 2j, if there is no node 2j+1). The last level holds only the root.
+    """
+    tree = [[[-x, 1] for x in xs]]
+    while len(tree[-1]) > 1:
+        below = tree[-1]
+        tree.append([polynomial._mul(below[j], below[j + 1]) if j + 1 < len(below) else below[j]
+                     for j in range(0, len(below), 2)])
+    return tree
+
+
+def multipoint_evaluate(coeffs, xs, tree=None):
+    """
+    Evaluate a polynomial at every point, by reducing it modulo each node of the subproduct tree of the points,
+    from the root down. The remainder at each leaf x - xs[i] is the value at xs[i].
+
+    Args:
+        coeffs (list): Coefficients of polynomial, indexed by degree.
+        xs (list): Points to evaluate at.
+        tree (list): Subproduct tree of xs, if already built.
+
+    Returns:
+        list: Value of the polynomial at each point.
+    """
+    if not xs:
+        return []
+    if tree is None:
+        tree = subproduct_tree(xs)
+    remainders = [polynomial._divmod(coeffs, tree[-1][0])[1]]
+    for level in reversed(tree[:-1]):
+        remainders = [polynomial._divmod(remainders[j // 2], node)[1] for j, node in enumerate(level)]
+    return [r[0] for r in remainders]
+
+
+def interpolate_subproduct(xs, ys):
+    """
+    Find the polynomial of least degree through the points (xs[i], ys[i]) using a subproduct tree.
+    The Lagrange form sum(ys[i] / M'(xs[i]) * M(x) / (x - xs[i])), where M is the product at the root of the tree,
+    is summed up the tree, with M'(xs[i]) found by multipoint evaluation.
+
+    Args:
+        xs (list): Distinct points.
+        ys (list): Value at each point.
+
+    Returns:
+        list: Coefficients of interpolating polynomial, indexed by degree.
+    """
+    tree = subproduct_tree(xs)
+    root = tree[-1][0]
+    weights = multipoint_evaluate([root[i]*i for i in range(1, len(root))], xs, tree)
+    if any(w == 0 for w in weights):
+        raise ValueError("Interpolation points must be distinct")
+    level = [[y / w] for y, w in zip(ys, weights)]
+    for below in tree[:-1]:
+        level = [polynomial._add(polynomial._mul(level[j], below[j + 1]), polynomial._mul(level[j + 1], below[j]))
+                 if j + 1 < len(level) else level[j]
+                 for j in range(0, len(level), 2)]
+    return level[0]
+
+
+def interpolate_newton(xs, ys):
+    """
+    Find the polynomial of least degree through the points (xs[i], ys[i]) by Newton's divided differences.
+
+    Args:
+        xs (list): Distinct points.
+        ys (list): Value at each point.
+
+    Returns:
+        list: Coefficients of interpolating polynomial, indexed by degree.
+    """
+    n = len(xs)
+    if len(set(xs)) != n:
+        raise ValueError("Interpolation points must be distinct")
+    diffs = list(ys)
+    for j in range(1, n):
+        for i in range(n - 1, j - 1, -1):
+            diffs[i] = (diffs[i] - diffs[i - 1]) / (xs[i] - xs[i - j])
+
+    # Expand diffs[0] + (x - xs[0])(diffs[1] + (x - xs[1])(...)) from the inside out
+    coeffs = [diffs[-1]]
+    for i in range(n - 2, -1, -1):
+        shifted = [0] + coeffs
+        for k, c in enumerate(coeffs):
+            shifted[k] -= xs[i]*c
+        shifted[0] += diffs[i]
+        coeffs = shifted
+    return coeffs
+
+
+class Barycentric(function.Function):
+    """
+    Polynomial of least degree through given points, evaluated in barycentric form.
+    Takes O(n) time per evaluation once built, and is better conditioned than expanding into coefficients.
+    """
+
+    def __init__(self, xs, ys):
+        """
+        Args:
+            xs (list): Distinct points.
+            ys (list): Value at each point.
+        """
+        if len(xs) != len(ys):
+            raise ValueError("Need a value for each point")
+        elif len(xs) == 0:
+            raise ValueError("Need at least one point")
+        elif len(set(xs)) != len(xs):
+            raise ValueError("Interpolation points must be distinct")
+        self.xs = list(xs)
+        self.ys = list(ys)
+        self.weights = []
+        for j, xj in enumerate(self.xs):
+            w = 1
+            for k, xk in enumerate(self.xs):
+                if k != j:
+                    w *= xj - xk
+            self.weights.append(1 / w)
+
+    def _evaluate(self, x):
+        numerator = 0
+        denominator = 0
+        for xj, yj, wj in zip(self.xs, self.ys, self.weights):
+            if x == xj:
+                return yj
+            t = wj / (x - xj)
+            numerator += t*yj
+            denominator += t
+        return numerator / denominator
+
+    def _key(self):
+        return tuple(self.xs), tuple(self.ys)
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        elif not isinstance(other, Barycentric):
+            return False
+        return self.xs == other.xs and self.ys == other.ys
+
+    def to_polynomial(self):
+        """
+        Returns:
+            Polynomial: Interpolating polynomial expanded into coefficients.
+        """
+        return polynomial.Polynomial.interpolate(self.xs, self.ys)
+
+    def _derivative(self):
+        return self.to_polynomial().get_derivative()
+
+
+class Chebyshev(function.Function):
+    """
+    Truncated Chebyshev series sum(c[k] T_k(t)) on an interval [lo, hi], where t = (2x - lo - hi) / (hi - lo)
+    maps the interval onto [-1, 1]. Evaluated by Clenshaw's recurrence, taking one multiplication and two additions
+    per coefficient. Built by Function.approximate as a cheap proxy for an expensive Function.
+    """
+
+    def __init__(self, coeffs, lo, hi, error=None):
+        """
+        Args:
+            coeffs (list): Chebyshev coefficients c, indexed by degree.
+            lo (number): Lower end of interval.
+            hi (number): Upper end of interval, > lo.
+            error (float): Estimated max absolute error against the approximated function on [lo, hi], if any.
+        """
+        if not lo < hi:
+            raise ValueError("Interval must have lo < hi")
+        self.coeffs = list(coeffs) or [0]
+        self.lo = lo
+        self.hi = hi
+        self.error = error
+
+    @property
+    def degree(self):
+        return len(self.coeffs) - 1
+
+    def _evaluate(self, x):
+        if x < self.lo or x > self.hi:
+            raise ValueError("{0} outside interval [{1}, {2}]".format(x, self.lo, self.hi))
+        t = (2*x - self.lo - self.hi) / (self.hi - self.lo)
+        b1, b2 = 0, 0
+        for c in self.coeffs[:0:-1]:
+            b1, b2 = c + 2*t*b1 - b2, b1
+        return self.coeffs[0] + t*b1 - b2
+
+    def _evaluate_many(self, xs):
+        if any(x < self.lo or x > self.hi for x in xs):
+            raise ValueError("Some point outside interval [{0}, {1}]".format(self.lo, self.hi))
+        t = batch.div_scalar(batch.sub(batch.add(xs, xs), batch.full(xs, self.lo + self.hi)), self.hi - self.lo)
+        two_t = batch.add(t, t)
+        b1, b2 = batch.full(xs, 0), batch.full(xs, 0)
+        for c in self.coeffs[:0:-1]:
+            b1, b2 = batch.add(batch.full(xs, c), batch.sub(batch.mul(two_t, b1), b2)), b1
+        return batch.add(batch.full(xs, self.coeffs[0]), batch.sub(batch.mul(t, b1), b2))
+
+    def _key(self):
+        return tuple(self.coeffs), self.lo, self.hi
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        elif not isinstance(other, Chebyshev):
+            return False
+        return self.coeffs == other.coeffs and self.lo == other.lo and self.hi == other.hi
+
+    def _derivative(self):
+        # If f = sum(c[k] T_k), then f' = sum(d[k] T_k) where d[k-1] = d[k+1] + 2k c[k], with d[0] halved
+        n = self.degree
+        if n == 0:
+            return Chebyshev([0], self.lo, self.hi)
+        d = [0]*(n + 1)
+        for k in range(n, 0, -1):
+            d[k - 1] = d[k + 1] + 2*k*self.coeffs[k] if k + 1 <= n else 2*k*self.coeffs[k]
+        d[0] /= 2
+        scale = 2 / (self.hi - self.lo)
+        return Chebyshev([c*scale for c in d[:n]], self.lo, self.hi)
+
+
+def chebyshev_coefficients(values):
+    """
+    Coefficients of the polynomial interpolating values at the Chebyshev points cos(pi j / n), j = 0, ..., n,
+    by a discrete cosine transform, computed with a fast Fourier transform.
+
+    Args:
+        values (list): Values at the n + 1 Chebyshev points, where n is a power of 2.
+
+    Returns:
+        list: Chebyshev coefficients, indexed by degree.
+    """
+    n = len(values) - 1
+    if n == 0:
+        return list(values)
+    extended = [complex(v) for v in values] + [complex(v) for v in values[-2:0:-1]]
+    polynomial._fft(extended, False)
+    coeffs = [v.real / n for v in extended[:n + 1]]
+    coeffs[0] /= 2
+    coeffs[-1] /= 2
+    return coeffs
+
+
+def approximate(f, lo, hi, tol=1e-12, max_degree=1024):
+    """
+    Build a Chebyshev interpolant of f on [lo, hi], doubling its degree until the trailing coefficients
+    are negligible, then dropping coefficients while the error stays within tol.
+
+    Args:
+        f (Function): Function of one variable, smooth on [lo, hi].
+        lo (number): Lower end of interval.
+        hi (number): Upper end of interval, > lo.
+        tol (float): Target max absolute error.
+        max_degree (int): Max degree of interpolant.
+
+    Returns:
+        Chebyshev: Interpolant, whose error attribute is the larger of the total size of the dropped and
+                   last quarter of coefficients, and the largest error measured between the Chebyshev points.
+
+    Raises:
+        ConvergenceError: tol not met with degree max_degree, eg. as f is not smooth.
+    """
+    import solvers
+    if not lo < hi:
+        raise ValueError("Interval must have lo < hi")
+    n = 16
+    while n <= max_degree:
+        points = [(lo + hi) / 2 + (hi - lo) / 2 * math.cos(math.pi * j / n) for j in range(n + 1)]
+        coeffs = chebyshev_coefficients(list(f.evaluate_many(points)))
+
+        # Coefficients of smooth functions decay quickly, so the last quarter bounds those beyond degree n
+        error = sum(abs(c) for c in coeffs[3*n//4:])
+        if error <= tol / 2:
+            while len(coeffs) > 1 and error + abs(coeffs[-1]) <= tol:
+                error += abs(coeffs.pop())
+            result = Chebyshev(coeffs, lo, hi)
+            midpoints = [(lo + hi) / 2 + (hi - lo) / 2 * math.cos(math.pi * (j + 0.5) / n) for j in range(n)]
+            measured = max(abs(y - z) for y, z in zip(f.evaluate_many(midpoints), result.evaluate_many(midpoints)))
+            result.error = max(error, measured)
+            if result.error <= tol:
+                return result
+        n *= 2
+    raise solvers.ConvergenceError("Could not approximate to within {0} with degree {1}".format(tol, max_degree))
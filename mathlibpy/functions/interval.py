@@ -0,0 +1,281 @@
+"""
+Interval arithmetic, for guaranteed bounds of Functions over ranges of inputs.
+
+Author: Jack Romo <sharrackor@gmail.com>
+"""
+
+from __future__ import division
+import math
+import numbers
+import struct
+
+
+INFINITY = float("inf")
+TWO_PI = 2 * math.pi
+
+
+class Interval(object):
+    """
+    Closed interval [lo, hi] of real numbers, standing for an unknown number within it.
+    The result of every operation on intervals contains the result of the operation on any numbers within them,
+    so evaluating a Function on an Interval bounds its values over the whole interval at once.
+    Bounds may be loose, as each node is bounded independently (eg. x - x on [0, 1] gives [-1, 1]),
+    but narrow as the interval does. Float ends are rounded outwards after each operation.
+
+    Intervals count as Numbers, so they can be passed to any Function. Like dual.Dual,
+    they provide sin, cos, exp and log methods, which Functions call as math cannot handle them.
+
+    Notes:
+        Intervals are equal only if their ends are, and equal to a number only if both ends are that number.
+        Orderings hold only if they hold for every pair of numbers within the intervals, eg. I < J if I.hi < J.lo,
+        so I < J and I >= J may both be False.
+    """
+
+    def __init__(self, lo, hi=None):
+        """
+        Args:
+            lo (number): Lower end.
+            hi (number, None): Upper end, >= lo. Defaults to lo, giving an interval of a single number.
+        """
+        if hi is None:
+            hi = lo
+        if not (isinstance(lo, numbers.Real) and isinstance(hi, numbers.Real)):
+            raise TypeError("Ends must be real numbers")
+        elif not lo <= hi:
+            raise ValueError("Need lo <= hi")
+        self.lo = lo
+        self.hi = hi
+
+    @property
+    def width(self):
+        return self.hi - self.lo
+
+    @property
+    def midpoint(self):
+        return self.lo + (self.hi - self.lo) / 2
+
+    def __contains__(self, x):
+        if isinstance(x, Interval):
+            return self.lo <= x.lo and x.hi <= self.hi
+        return self.lo <= x <= self.hi
+
+    def hull(self, other):
+        """
+        Returns:
+            Interval: Smallest interval containing self and other.
+        """
+        other = _interval(other)
+        return Interval(min(self.lo, other.lo), max(self.hi, other.hi))
+
+    def split(self):
+        """
+        Returns:
+            tuple(Interval, Interval): Halves of self, either side of its midpoint.
+        """
+        mid = self.midpoint
+        return Interval(self.lo, mid), Interval(mid, self.hi)
+
+    def __repr__(self):
+        return "Interval({0!r}, {1!r})".format(self.lo, self.hi)
+
+    def __eq__(self, other):
+        if isinstance(other, Interval):
+            return self.lo == other.lo and self.hi == other.hi
+        elif isinstance(other, numbers.Number):
+            return self.lo == other and self.hi == other
+        return False
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(self.lo) if self.lo == self.hi else hash((self.lo, self.hi))
+
+    def __lt__(self, other):
+        return self.hi < _interval(other).lo
+
+    def __le__(self, other):
+        return self.hi <= _interval(other).lo
+
+    def __gt__(self, other):
+        return self.lo > _interval(other).hi
+
+    def __ge__(self, other):
+        return self.lo >= _interval(other).hi
+
+    def __neg__(self):
+        return Interval(-self.hi, -self.lo)
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        if self.lo >= 0:
+            return self
+        elif self.hi <= 0:
+            return -self
+        return Interval(0, max(-self.lo, self.hi))
+
+    def __add__(self, other):
+        other = _interval(other)
+        return _rounded(self.lo + other.lo, self.hi + other.hi)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        other = _interval(other)
+        return _rounded(self.lo - other.hi, self.hi - other.lo)
+
+    def __rsub__(self, other):
+        return _interval(other) - self
+
+    def __mul__(self, other):
+        other = _interval(other)
+        products = [_product(a, b) for a in (self.lo, self.hi) for b in (other.lo, other.hi)]
+        return _rounded(min(products), max(products))
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        other = _interval(other)
+        if other.lo > 0 or other.hi < 0:
+            quotients = [a / b for a in (self.lo, self.hi) for b in (other.lo, other.hi)]
+            return _rounded(min(quotients), max(quotients))
+        elif other.lo == other.hi == 0:
+            raise ZeroDivisionError("Division by the interval [0, 0]")
+        elif other.lo == 0:
+            return self * _rounded(1 / other.hi, INFINITY)
+        elif other.hi == 0:
+            return self * _rounded(-INFINITY, 1 / other.lo)
+        return Interval(-INFINITY, INFINITY)     # Divisor contains 0 and numbers either side of it
+
+    def __rtruediv__(self, other):
+        return _interval(other) / self
+
+    __div__ = __truediv__
+    __rdiv__ = __rtruediv__
+
+    def __pow__(self, other):
+        if isinstance(other, Interval):
+            return (other * self.log()).exp()
+        elif isinstance(other, numbers.Integral) or (isinstance(other, float) and other.is_integer()):
+            return self._integer_power(int(other))
+        return (other * self.log()).exp()
+
+    def __rpow__(self, other):
+        if isinstance(other, Interval):
+            return other ** self
+        elif other == math.e:
+            return self.exp()
+        elif other <= 0:
+            raise ValueError("Base of power of an interval must be positive")
+        ends = [_power(other, self.lo), _power(other, self.hi)]
+        return _rounded(min(ends), max(ends))
+
+    def _integer_power(self, n):
+        if n < 0:
+            return 1 / self._integer_power(-n)
+        elif n == 0:
+            return Interval(1)
+        lo, hi = _power(self.lo, n), _power(self.hi, n)
+        if n % 2 == 1 or self.lo >= 0:
+            return _rounded(lo, hi)
+        elif self.hi <= 0:
+            return _rounded(hi, lo)
+        return _rounded(0, max(lo, hi))     # Even power has its minimum, 0, inside the interval
+
+    def sin(self):
+        return self._periodic(math.sin, math.pi / 2, -math.pi / 2)
+
+    def cos(self):
+        return self._periodic(math.cos, 0, math.pi)
+
+    def _periodic(self, f, peak, trough):
+        """
+        Bound a function of period 2 pi, monotonic between its maxima of 1 at peak + 2k pi
+        and minima of -1 at trough + 2k pi.
+        """
+        if self.hi - self.lo >= TWO_PI:
+            return Interval(-1, 1)
+        ends = [f(self.lo), f(self.hi)]
+        lo, hi = min(ends), max(ends)
+        if _contains_periodic(self.lo, self.hi, peak):
+            hi = 1
+        if _contains_periodic(self.lo, self.hi, trough):
+            lo = -1
+        bound = _rounded(lo, hi)
+        return Interval(max(bound.lo, -1), min(bound.hi, 1))
+
+    def exp(self):
+        bound = _rounded(_exp(self.lo), _exp(self.hi))
+        return Interval(max(bound.lo, 0), bound.hi)
+
+    def log(self):
+        if self.hi <= 0:
+            raise ValueError("Logarithm of an interval without positive numbers")
+        return _rounded(math.log(self.lo) if self.lo > 0 else -INFINITY, math.log(self.hi))
+
+
+numbers.Number.register(Interval)
+
+
+def _interval(x):
+    return x if isinstance(x, Interval) else Interval(x)
+
+
+def _rounded(lo, hi):
+    """
+    Returns:
+        Interval: [lo, hi] with float ends moved outwards by one unit in the last place, to contain the exact result
+                  of whichever operation gave them. Undefined ends, eg. from inf - inf, become infinite.
+    """
+    if lo != lo:
+        lo = -INFINITY
+    if hi != hi:
+        hi = INFINITY
+    return Interval(_next_float(lo, -1), _next_float(hi, 1))
+
+
+def _next_float(x, direction):
+    """
+    Returns:
+        number: Float adjacent to x in the given direction (1 for up, -1 for down) if x is a finite float, else x.
+    """
+    if not isinstance(x, float) or x in (INFINITY, -INFINITY):
+        return x
+    elif x == 0:
+        return direction * 5e-324
+    bits = struct.unpack("<q", struct.pack("<d", x))[0]
+    bits += 1 if (x > 0) == (direction > 0) else -1
+    return struct.unpack("<d", struct.pack("<q", bits))[0]
+
+
+def _product(a, b):
+    # 0 * inf is taken to be 0, as an infinite end only stands for arbitrarily large finite numbers
+    if a == 0 or b == 0:
+        return 0
+    return a * b
+
+
+def _power(x, n):
+    try:
+        return x ** n
+    except OverflowError:
+        return INFINITY if x > 0 or n % 2 == 0 else -INFINITY
+
+
+def _exp(x):
+    try:
+        return math.exp(x)
+    except OverflowError:
+        return INFINITY
+
+
+def _contains_periodic(lo, hi, point):
+    """
+    Returns:
+        bool: True if some point + 2k pi may lie in [lo, hi]. Points just outside are included,
+              allowing for rounding in multiples of pi, as this only loosens the bound.
+    """
+    candidate = point + TWO_PI * math.ceil((lo - point) / TWO_PI)
+    return candidate <= hi + 8 * 2.0 ** -52 * max(1, abs(candidate))
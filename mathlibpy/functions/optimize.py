@@ -0,0 +1,268 @@
+"""
+Minimization of Functions of one variable: local methods on a bracket or from a starting point,
+and global minimization over an interval by branch and bound.
+
+Author: Jack Romo <sharrackor@gmail.com>
+"""
+
+from __future__ import division
+import math
+import function
+import interval
+import solvers
+
+
+SQRT_EPSILON = 2.0 ** -26       # Minima can only be located to about the square root of float precision
+INV_PHI = (math.sqrt(5) - 1) / 2
+
+
+def golden_section(f, a, b, xtol=1e-10, rtol=SQRT_EPSILON, max_iter=200):
+    """
+    Find a local minimum of f in [a, b] by golden section search. Each step shrinks the bracket
+    by the golden ratio, reusing one of the two points evaluated inside it.
+
+    Args:
+        f (Function, callable): Function of one variable, with a single minimum in [a, b].
+        a (number): One end of bracket.
+        b (number): Other end of bracket.
+        xtol (float): Absolute tolerance on the minimum.
+        rtol (float): Tolerance on the minimum relative to its magnitude.
+        max_iter (int): Max number of evaluations of f after the first two.
+
+    Returns:
+        tuple(number, number): (x, f(x)), where x is within tolerance of a minimum of f.
+
+    Raises:
+        ConvergenceError: Tolerance not met within max_iter iterations.
+    """
+    a, b = min(a, b), max(a, b)
+    c, d = b - INV_PHI*(b - a), a + INV_PHI*(b - a)
+    fc, fd = f(c), f(d)
+    for _ in range(max_iter):
+        if b - a <= xtol + rtol*(abs(c) + abs(d)):
+            return (c, fc) if fc < fd else (d, fd)
+        if fc < fd:
+            b, d, fd = d, c, fc     # Minimum in [a, d]; old c is the new d
+            c = b - INV_PHI*(b - a)
+            fc = f(c)
+        else:
+            a, c, fc = c, d, fd     # Minimum in [c, b]; old d is the new c
+            d = a + INV_PHI*(b - a)
+            fd = f(d)
+    raise solvers.ConvergenceError("Golden section search did not converge in {0} iterations".format(max_iter))
+
+
+def brent(f, a, b, xtol=1e-10, rtol=SQRT_EPSILON, max_iter=100):
+    """
+    Find a local minimum of f in [a, b] by Brent's method, taking parabolic interpolation steps through
+    the three best points so far, and golden section steps where those are too slow or leave the bracket.
+    Converges superlinearly for smooth f.
+
+    Args:
+        f (Function, callable): Function of one variable, with a single minimum in [a, b].
+        a (number): One end of bracket.
+        b (number): Other end of bracket.
+        xtol (float): Absolute tolerance on the minimum.
+        rtol (float): Tolerance on the minimum relative to its magnitude.
+        max_iter (int): Max number of evaluations of f after the first.
+
+    Returns:
+        tuple(number, number): (x, f(x)), where x is within tolerance of a minimum of f.
+
+    Raises:
+        ConvergenceError: Tolerance not met within max_iter iterations.
+    """
+    a, b = min(a, b), max(a, b)
+    x = w = v = a + (1 - INV_PHI)*(b - a)     # x is the best point, w the second best, v the previous w
+    fx = fw = fv = f(x)
+    d = e = 0
+    for _ in range(max_iter):
+        mid = (a + b) / 2
+        tol = (rtol*abs(x) + xtol) / 2
+        if abs(x - mid) <= 2*tol - (b - a) / 2:
+            return x, fx
+        golden = True
+        if abs(e) > tol:
+            # Parabola through x, w and v
+            r = (x - w)*(fx - fv)
+            q = (x - v)*(fx - fw)
+            p = (x - v)*q - (x - w)*r
+            q = 2*(q - r)
+            if q > 0:
+                p = -p
+            q = abs(q)
+            if abs(p) < abs(q*e / 2) and q*(a - x) < p < q*(b - x):
+                e, d = d, p / q
+                golden = False
+                if x + d - a < 2*tol or b - x - d < 2*tol:
+                    d = tol if mid > x else -tol
+        if golden:
+            e = a - x if x >= mid else b - x
+            d = (1 - INV_PHI)*e
+        u = x + d if abs(d) >= tol else x + (tol if d > 0 else -tol)
+        fu = f(u)
+        if fu <= fx:
+            if u >= x:
+                a = x
+            else:
+                b = x
+            v, w, x = w, x, u
+            fv, fw, fx = fw, fx, fu
+        else:
+            if u < x:
+                a = u
+            else:
+                b = u
+            if fu <= fw or w == x:
+                v, w = w, u
+                fv, fw = fw, fu
+            elif fu <= fv or v == x or v == w:
+                v, fv = u, fu
+    raise solvers.ConvergenceError("Brent's method did not converge in {0} iterations".format(max_iter))
+
+
+def newton(f, x0, tol=1e-12, max_iter=50, mode="ad"):
+    """
+    Find a local minimum of f near x0 by Newton's method on f', using f''.
+    Converges quadratically near minima where f'' > 0, but may diverge from a poor starting point.
+
+    Args:
+        f (Function): Function of one variable, twice differentiable.
+        x0 (number): Starting point.
+        tol (float): Stop once a step is this small relative to the magnitude of x (or 1, if larger).
+        max_iter (int): Max number of steps.
+        mode (str): "ad" or "symbolic"; see solvers.halley.
+
+    Returns:
+        tuple(number, number): (x, f(x)), where x is approximately a local minimum of f.
+
+    Raises:
+        ConvergenceError: Tolerance not met within max_iter steps, or f'' was not positive,
+                          so that a step would head for a maximum or inflection point.
+    """
+    derivatives = solvers._derivatives(f, 2, mode)
+    x = x0
+    for _ in range(max_iter):
+        fx, dfx, ddfx = derivatives(x)
+        if dfx == 0:
+            return x, fx
+        elif ddfx <= 0:
+            raise solvers.ConvergenceError("Second derivative not positive at {0}".format(x))
+        step = dfx / ddfx
+        x -= step
+        if abs(step) <= tol*max(abs(x), 1):
+            return x, f(x)
+    raise solvers.ConvergenceError("Newton's method did not converge in {0} iterations".format(max_iter))
+
+
+def global_minimum(f, lo, hi, tol=1e-8, xtol=1e-10, max_boxes=10000):
+    """
+    Find the global minimum of f over [lo, hi] by branch and bound. Subintervals (boxes) are bounded below
+    by interval arithmetic (see interval.Interval), using f' where it is available to tighten bounds
+    near minima, and f is evaluated at their midpoints, the least value
+    found being an upper bound on the minimum. Each round, every box whose lower bound is further than tol below
+    the best value is halved, and f is evaluated at the midpoints of all new boxes at once with evaluate_many.
+    Boxes whose lower bound is within tol of the best value cannot contain a much smaller value, so are discarded.
+
+    Args:
+        f (Function): Function of one variable. Points of [lo, hi] where f is undefined are ignored,
+                      and boxes containing them are split until xtol or max_boxes stops the search.
+        lo (number): Lower end of interval.
+        hi (number): Upper end of interval, >= lo.
+        tol (float): Stop once the best value found is within this of the minimum.
+        xtol (float): Boxes this narrow are not split further. Bounds of f may not narrow enough to meet tol
+                      near poles or where f is undefined, so this limits the work done there.
+        max_boxes (int): Max number of boxes to bound, at which the best value found so far is returned.
+
+    Returns:
+        tuple(number, number, float): (x, f(x), error), where x is the best point found and f(x) is within error
+                                      of the global minimum of f on [lo, hi]. error may exceed tol if xtol or
+                                      max_boxes stopped the search first.
+    """
+    if not lo <= hi:
+        raise ValueError("Need lo <= hi")
+    try:
+        derivative = f.get_derivative()
+    except (NotImplementedError, TypeError):
+        derivative = None
+    best, best_x = _least(f, [lo, (lo + hi) / 2, hi])
+    boxes = [(_lower_bound(f, derivative, lo, hi), lo, hi)]
+    floor = best    # Least lower bound of discarded boxes
+    count = 1
+    while True:
+        split = [box for box in boxes if box[0] < best - tol and box[2] - box[1] > xtol]
+        if not split or count + 2*len(split) > max_boxes:
+            break
+        split_set = set(split)
+        halves = []
+        for _, a, b in split:
+            mid = a + (b - a) / 2
+            halves.extend([(a, mid), (mid, b)])
+        value, x = _least(f, [a + (b - a) / 2 for a, b in halves])
+        if value < best:
+            best, best_x = value, x
+        count += len(halves)
+        boxes = [box for box in boxes if box not in split_set]
+        boxes.extend((_lower_bound(f, derivative, a, b), a, b) for a, b in halves)
+        kept = []
+        for box in boxes:
+            if box[0] < best - tol:
+                kept.append(box)
+            else:
+                floor = min(floor, box[0])
+        boxes = kept
+    lowest = min([floor] + [box[0] for box in boxes])
+    return best_x, best, max(best - lowest, 0)
+
+
+def _least(f, points):
+    """
+    Returns:
+        tuple: (value, x) for the point x at which f is least, evaluating f at all points at once.
+               Points where f is NaN or undefined are ignored.
+    """
+    try:
+        values = f.evaluate_many(points)
+    except (ArithmeticError, ValueError):
+        # Some point is outside the domain of f, eg. a division by zero; evaluate the others alone
+        values = [solvers._value_or_nan(f, x) for x in points]
+    candidates = [(value, x) for value, x in zip(values, points) if value == value]
+    return min(candidates) if candidates else (float("inf"), points[0])
+
+
+def _lower_bound(f, derivative, lo, hi):
+    """
+    Returns:
+        number: Lower bound of f on [lo, hi]; the greater of the bounds given by evaluating f on the interval,
+                and by the mean value form f(m) + f'([lo, hi])([lo, hi] - m) about the midpoint m,
+                which is much tighter on narrow intervals where f' is small, ie. near minima.
+                -inf if f is undefined on part of [lo, hi], so that the box is split further.
+    """
+    box = interval.Interval(lo, hi)
+    try:
+        bound = _interval_lo(f(box))
+    except (ArithmeticError, ValueError):
+        return float("-inf")    # f undefined somewhere on the box, eg. the log of a negative number
+    if derivative is not None:
+        mid = interval.Interval(lo + (hi - lo) / 2)
+        try:
+            mean_value = f(mid) + derivative(box) * (box - mid)
+        except (ArithmeticError, ValueError):
+            return bound    # f undefined at the midpoint, eg. a division by zero
+        bound = max(bound, _interval_lo(mean_value))
+    return bound
+
+
+def _interval_lo(value):
+    return value.lo if isinstance(value, interval.Interval) else value
+
+
+def global_maximum(f, lo, hi, tol=1e-8, xtol=1e-10, max_boxes=10000):
+    """
+    Find the global maximum of f over [lo, hi] by branch and bound; see global_minimum.
+
+    Returns:
+        tuple(number, number, float): (x, f(x), error), where f(x) is within error of the global maximum.
+    """
+    x, value, error = global_minimum(function.Constant(-1) * f, lo, hi, tol, xtol, max_boxes)
+    return x, -value, error
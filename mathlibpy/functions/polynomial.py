@@ -4,10 +4,19 @@ Polynomial class.
 Author: Jack Romo <sharrackor@gmail.com>
 """
 
-
+from __future__ import division
+import bisect
+import cmath
+import fractions
+import numbers
+import batch
 import function
 
 
+KARATSUBA_THRESHOLD = 64    # Min number of coefficients of both factors for Karatsuba multiplication
+FFT_THRESHOLD = 256         # Min number of coefficients of both factors for FFT multiplication
+
+
 class Polynomial(function.Function):
     """
     Generic dense one-variable polynomial.
@@ -30,6 +39,7 @@ class Polynomial(function.Function):
 
     @coeffs.setter
     def coeffs(self, c):
+        replaced = "_coeffs" in self.__dict__
         if not isinstance(c, list):
             raise TypeError("must provide list as arg")
         elif len(c) == 0:
@@ -39,9 +49,33 @@ class Polynomial(function.Function):
                 if d != 0:
                     self._coeffs = c[:len(c) - i]
                     break
+            else:
+                self._coeffs = [0]    # Zero polynomial
+            if replaced:
+                self._clear_caches()
 
     def _evaluate(self, x):
-        return sum(self[i]*(x**i) for i in range(self.degree+1))
+        # Horner's scheme: one multiplication and addition per coefficient, no powers
+        coeffs = self.coeffs
+        result = coeffs[-1]
+        for c in coeffs[-2::-1]:
+            result = result*x + c
+        return result
+
+    def _key(self):
+        return tuple(self.coeffs)
+
+    def _evaluate_many(self, xs):
+        return batch.polyval(self.coeffs, xs)
+
+    def _compile(self, compiler, arg):
+        # Horner's scheme, with coefficients inlined. Nesting is limited to keep Python's parser happy.
+        expr = compiler.bind(self.coeffs[-1])
+        for i, c in enumerate(reversed(self.coeffs[:-1])):
+            if i % 16 == 15:
+                expr = compiler.emit(expr)
+            expr = "({0}) * {1} + {2}".format(expr, arg, compiler.bind(c))
+        return compiler.emit(expr)
 
     def __str__(self):
         """
@@ -61,12 +95,16 @@ class Polynomial(function.Function):
         return result
 
     def __eq__(self, other):
-        if not isinstance(other, Polynomial):
+        if self is other:
+            return True
+        elif not isinstance(other, Polynomial):
+            return False
+        elif hash(self) != hash(other):
             return False
         elif self.degree != other.degree:
             return False
         else:
-            return all(self[i] == other[i] for i in range(self.degree))
+            return all(self[i] == other[i] for i in range(self.degree+1))
 
     def __getitem__(self, item):
         """
@@ -104,9 +142,778 @@ class Polynomial(function.Function):
             # Degree automatically updated by coeffs setter
         else:
             self.coeffs[key] = value
+        self._clear_caches()
+
+    def _coeffs_of(self, other):
+        """
+        Returns:
+            list, None: Coefficients of other if it is a Polynomial or numeric Constant, None otherwise.
+        """
+        if isinstance(other, Polynomial):
+            return other.coeffs
+        elif isinstance(other, function.Constant) and isinstance(other.val, numbers.Number):
+            return [other.val]
+        return None
+
+    def __add__(self, other):
+        """
+        Args:
+            other (Function): Function to add to self.
+
+        Returns:
+            Polynomial: Sum of coefficients, if other is a Polynomial or Constant.
+            SparsePolynomial: Sum, if other is a SparsePolynomial.
+            Function: Self combined with other by addition otherwise.
+        """
+        if isinstance(other, SparsePolynomial):
+            return SparsePolynomial.from_dense(self).__add__(other)
+        coeffs = self._coeffs_of(other)
+        if coeffs is None:
+            return super(Polynomial, self).__add__(other)
+        return Polynomial(_add(self.coeffs, coeffs))
+
+    def __sub__(self, other):
+        """
+        Args:
+            other (Function): Function to subtract from self.
+
+        Returns:
+            Polynomial: Difference of coefficients, if other is a Polynomial or Constant.
+            SparsePolynomial: Difference, if other is a SparsePolynomial.
+            Function: Self combined with other by subtraction otherwise.
+        """
+        if isinstance(other, SparsePolynomial):
+            return SparsePolynomial.from_dense(self).__sub__(other)
+        coeffs = self._coeffs_of(other)
+        if coeffs is None:
+            return super(Polynomial, self).__sub__(other)
+        return Polynomial(_add(self.coeffs, [-c for c in coeffs]))
+
+    def __mul__(self, other):
+        """
+        Multiplies by schoolbook, Karatsuba or FFT multiplication, depending on degrees.
+        FFT multiplication is only used for inexact (eg. float) coefficients, as it rounds.
+
+        Args:
+            other (Function): Function to multiply with self.
+
+        Returns:
+            Polynomial: Product, if other is a Polynomial or Constant.
+            SparsePolynomial: Product, if other is a SparsePolynomial.
+            Function: Self combined with other by multiplication otherwise.
+        """
+        if isinstance(other, SparsePolynomial):
+            return SparsePolynomial.from_dense(self).__mul__(other)
+        coeffs = self._coeffs_of(other)
+        if coeffs is None:
+            return super(Polynomial, self).__mul__(other)
+        return Polynomial(_mul(self.coeffs, coeffs))
+
+    def __divmod__(self, other):
+        """
+        Polynomial long division.
+
+        Args:
+            other (Polynomial, Constant): Nonzero divisor.
+
+        Returns:
+            tuple(Polynomial, Polynomial): Quotient q and remainder r, such that self = q*other + r
+                                           and r has lower degree than other.
 
-    def get_derivative(self):
+        Raises:
+            ZeroDivisionError: other is the zero polynomial.
+        """
+        coeffs = self._coeffs_of(other)
+        if coeffs is None:
+            raise TypeError("Can only divide Polynomial by Polynomial or Constant")
+        q, r = _divmod(self.coeffs, coeffs)
+        return Polynomial(q), Polynomial(r)
+
+    def __floordiv__(self, other):
+        return divmod(self, other)[0]
+
+    def __mod__(self, other):
+        return divmod(self, other)[1]
+
+    def gcd(self, other, tol=1e-9):
+        """
+        Greatest common divisor, by Euclid's algorithm.
+
+        Args:
+            other (Polynomial, Constant): Polynomial to find common divisor with.
+            tol (float): With inexact coefficients, remainder coefficients this small relative to the largest
+                         are treated as zero, to absorb rounding errors. Exact (rational) coefficients
+                         are handled exactly, as Fractions.
+
+        Returns:
+            Polynomial: Monic greatest common divisor, or the zero polynomial if both are zero.
+        """
+        coeffs = self._coeffs_of(other)
+        if coeffs is None:
+            raise TypeError("Can only find gcd of Polynomial and Polynomial or Constant")
+        a, b = _exact(self.coeffs), _exact(coeffs)
+        if isinstance(a[-1], fractions.Fraction) and isinstance(b[-1], fractions.Fraction):
+            tol = 0
+        while not (len(b) == 1 and b[0] == 0):
+            a, b = b, _trim(_divmod(a, b)[1], tol)
+        lead = a[-1]
+        if lead == 0:
+            return Polynomial([0])
+        return Polynomial([c / lead for c in a])
+
+    def evaluate_at(self, xs, method="horner"):
+        """
+        Evaluate self exactly at many points.
+
+        Args:
+            xs (list): Numbers to evaluate self at.
+            method (str): "horner" to apply Horner's scheme at each point, taking O(n^2) operations for n points
+                          and degree n, or "subproduct" to reduce self modulo a subproduct tree of the points,
+                          taking O(n log^2 n) operations. The subproduct tree is only numerically stable with
+                          exact coefficients and points (eg. Fractions), and its intermediate coefficients grow
+                          far larger than the values, so in practice Horner's scheme is faster in CPython.
+
+        Returns:
+            list: Value of self at each point.
+        """
+        import interpolation
+        if method == "horner":
+            return [self._evaluate(x) for x in xs]
+        elif method == "subproduct":
+            return interpolation.multipoint_evaluate(self.coeffs, list(xs))
+        raise ValueError("Unknown method: {0}".format(method))
+
+    @classmethod
+    def interpolate(cls, xs, ys, method="newton"):
+        """
+        Find the polynomial of least degree through the points (xs[i], ys[i]).
+
+        Args:
+            xs (list): Distinct points.
+            ys (list): Value at each point.
+            method (str): "newton" for Newton's divided differences, taking O(n^2) operations for n points,
+                          or "subproduct" to sum the Lagrange form up a subproduct tree of the points,
+                          taking O(n log^2 n) operations. As with evaluate_at, the subproduct tree is only
+                          suitable for exact points and values. See also interpolation.Barycentric.
+
+        Returns:
+            Polynomial: Interpolating polynomial, of degree < len(xs).
+
+        Raises:
+            ValueError: xs and ys differ in length, are empty, or xs has repeated points.
+        """
+        import interpolation
+        xs, ys = list(xs), list(ys)
+        if len(xs) != len(ys):
+            raise ValueError("Need a value for each point")
+        elif len(xs) == 0:
+            raise ValueError("Need at least one point")
+        elif method == "newton":
+            return cls(interpolation.interpolate_newton(xs, ys))
+        elif method == "subproduct":
+            return cls(interpolation.interpolate_subproduct(xs, ys))
+        raise ValueError("Unknown method: {0}".format(method))
+
+    def roots(self, tol=1e-12, max_iter=100):
+        """
+        Find all complex roots at once by Aberth's method. See roots.aberth.
+
+        Args:
+            tol (float): Relative size of step at which a root stops being refined.
+            max_iter (int): Max number of iterations.
+
+        Returns:
+            list[complex]: Each root, repeated according to multiplicity.
+        """
+        import roots
+        return roots.aberth(self.coeffs, tol, max_iter)
+
+    def real_roots(self, tol=1e-12):
+        """
+        Find distinct real roots by Sturm sequences. See roots.real_roots.
+
+        Args:
+            tol (float): Max distance of each result from the true root.
+
+        Returns:
+            list[float]: Distinct real roots in increasing order.
+        """
+        import roots
+        return roots.real_roots(self.coeffs, tol)
+
+    def sturm_sequence(self):
+        """
+        Returns:
+            list[Polynomial]: Sturm sequence of self, starting with self and its derivative.
+        """
+        import roots
+        return [Polynomial(c) for c in roots.sturm_sequence(self.coeffs)]
+
+    def count_real_roots(self, lo=None, hi=None):
+        """
+        Count distinct real roots between lo and hi by Sturm's theorem.
+
+        Args:
+            lo (number): Lower end of interval, which must not be a root. Unbounded if None.
+            hi (number): Upper end of interval, which must not be a root. Unbounded if None.
+
+        Returns:
+            int: Number of distinct real roots between lo and hi.
+        """
+        import roots
+        return roots.count_real_roots(self.coeffs, lo, hi)
+
+    def isolate_real_roots(self):
+        """
+        Returns:
+            list[tuple]: (lo, hi) intervals in increasing order, each holding exactly one distinct real root.
+        """
+        import roots
+        return roots.isolate_real_roots(self.coeffs)
+
+    def _derivative(self):
         if self.degree == 0:
             return function.Constant(0)
         else:
             return Polynomial([self.coeffs[i]*i for i in range(1, self.degree+1)])
+
+
+class SparsePolynomial(function.Function):
+    """
+    One-variable polynomial storing only its nonzero terms, for polynomials of high degree with few terms,
+    eg. x^1000000 + 1.
+    """
+
+    def __init__(self, terms):
+        """
+        Args:
+            terms (dict): Coefficient of each term, indexed by exponent. ie. terms[n] = nth degree coefficient.
+                          A list of (exponent, coefficient) pairs is also accepted.
+        """
+        if isinstance(terms, dict):
+            terms = terms.items()
+        collected = {}
+        for e, c in terms:
+            if not isinstance(e, (int, long)):
+                raise TypeError("exponents must be integers")
+            elif e < 0:
+                raise ValueError("exponents must be >= 0")
+            collected[e] = collected.get(e, 0) + c
+        self._terms = sorted((e, c) for e, c in collected.items() if c != 0) or [(0, 0)]    # Zero polynomial
+
+    @classmethod
+    def from_dense(cls, p):
+        """
+        Args:
+            p (Polynomial): Dense polynomial.
+
+        Returns:
+            SparsePolynomial: Polynomial equal to p.
+        """
+        return cls([(e, c) for e, c in enumerate(p.coeffs) if c != 0])
+
+    def to_dense(self):
+        """
+        Returns:
+            Polynomial: Dense polynomial equal to self.
+        """
+        coeffs = [0]*(self.degree + 1)
+        for e, c in self._terms:
+            coeffs[e] = c
+        return Polynomial(coeffs)
+
+    @property
+    def terms(self):
+        """
+        Returns:
+            list[tuple]: (exponent, coefficient) pairs of nonzero terms, sorted by increasing exponent.
+        """
+        return list(self._terms)
+
+    @property
+    def degree(self):
+        return self._terms[-1][0]
+
+    def _evaluate(self, x):
+        # Horner's scheme over the gaps between exponents, where x ** gap is found by repeated squaring
+        terms = self._terms
+        result = terms[-1][1]
+        for i in range(len(terms) - 2, -1, -1):
+            e, c = terms[i]
+            result = result * x ** (terms[i + 1][0] - e) + c
+        if terms[0][0] > 0:
+            result = result * x ** terms[0][0]
+        return result
+
+    def _key(self):
+        return tuple(self._terms)
+
+    def _evaluate_many(self, xs):
+        return batch.sparse_polyval(self._terms, xs)
+
+    def _compile(self, compiler, arg):
+        terms = self._terms
+        expr = compiler.bind(terms[-1][1])
+        for i in range(len(terms) - 2, -1, -1):
+            if i % 16 == 15:
+                expr = compiler.emit(expr)
+            e, c = terms[i]
+            expr = "({0}) * ({1}) ** {2} + {3}".format(expr, arg, terms[i + 1][0] - e, compiler.bind(c))
+        if terms[0][0] > 0:
+            expr = "({0}) * ({1}) ** {2}".format(expr, arg, terms[0][0])
+        return compiler.emit(expr)
+
+    def __str__(self):
+        """
+        Returns:
+             str: String of following form: '#x^a +- #x^b +- ... +- #x^n', with only nonzero terms.
+        """
+        result = ""
+        for i, (e, c) in enumerate(self._terms):
+            if i == 0:
+                result += str(c) if e == 0 else "{0}x^{1}".format(c, e)
+            elif c < 0:
+                result += " - {0}x^{1}".format(-c, e)
+            else:
+                result += " + {0}x^{1}".format(c, e)
+        return result
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        elif not isinstance(other, SparsePolynomial):
+            return False
+        elif hash(self) != hash(other):
+            return False
+        else:
+            return self._terms == other._terms
+
+    def __getitem__(self, item):
+        """
+        Gets nth coefficient of polynomial.
+
+        Args:
+            item (int): Degree of the term whose coefficient will be retrieved.
+
+        Returns:
+            number: Coefficient of term with degree equal to provided index, 0 if there is no such term.
+        """
+        if not isinstance(item, (int, long)):
+            raise TypeError("Tried to index with a non-integer")
+        elif item < 0:
+            raise ValueError("Tried to index term of exponent < 0")
+        # Terms are sorted by exponent, so binary search finds the term in O(log terms) time
+        i = bisect.bisect_left(self._terms, (item,))
+        if i < len(self._terms) and self._terms[i][0] == item:
+            return self._terms[i][1]
+        return 0
+
+    def _terms_of(self, other):
+        """
+        Returns:
+            list[tuple], None: Terms of other if it is a polynomial or numeric Constant, None otherwise.
+        """
+        if isinstance(other, SparsePolynomial):
+            return other._terms
+        elif isinstance(other, Polynomial):
+            return [(e, c) for e, c in enumerate(other.coeffs) if c != 0]
+        elif isinstance(other, function.Constant) and isinstance(other.val, numbers.Number):
+            return [(0, other.val)]
+        return None
+
+    def __add__(self, other):
+        """
+        Args:
+            other (Function): Function to add to self.
+
+        Returns:
+            SparsePolynomial: Sum, if other is a polynomial or Constant.
+            Function: Self combined with other by addition otherwise.
+        """
+        terms = self._terms_of(other)
+        if terms is None:
+            return super(SparsePolynomial, self).__add__(other)
+        return SparsePolynomial(self._terms + terms)
+
+    def __sub__(self, other):
+        """
+        Args:
+            other (Function): Function to subtract from self.
+
+        Returns:
+            SparsePolynomial: Difference, if other is a polynomial or Constant.
+            Function: Self combined with other by subtraction otherwise.
+        """
+        terms = self._terms_of(other)
+        if terms is None:
+            return super(SparsePolynomial, self).__sub__(other)
+        return SparsePolynomial(self._terms + [(e, -c) for e, c in terms])
+
+    def __mul__(self, other):
+        """
+        Multiplies every pair of terms, so takes time proportional to the product of the numbers of terms.
+
+        Args:
+            other (Function): Function to multiply with self.
+
+        Returns:
+            SparsePolynomial: Product, if other is a polynomial or Constant.
+            Function: Self combined with other by multiplication otherwise.
+        """
+        terms = self._terms_of(other)
+        if terms is None:
+            return super(SparsePolynomial, self).__mul__(other)
+        return SparsePolynomial([(e1 + e2, c1*c2) for e1, c1 in self._terms for e2, c2 in terms])
+
+    def _derivative(self):
+        terms = [(e - 1, c*e) for e, c in self._terms if e > 0]
+        if not terms:
+            return function.Constant(0)
+        return SparsePolynomial(terms)
+
+
+class ShiftedPolynomial(function.Function):
+    """
+    One-variable polynomial in powers of x - center, eg. a Taylor polynomial about center.
+    x - center is found before anything else, so values near center stay accurate however large center is,
+    whereas expanding into powers of x (see to_dense) cancels catastrophically for large center or degree.
+    """
+
+    def __init__(self, coeffs, center=0):
+        """
+        Args:
+            coeffs (list): List of all coefficients, indexed by degree. ie. coeffs[n] = coefficient of (x - center)^n.
+            center (number): Point the powers are taken about.
+        """
+        self.coeffs = coeffs
+        self.center = center
+
+    @property
+    def coeffs(self):
+        return self._polynomial.coeffs
+
+    @coeffs.setter
+    def coeffs(self, c):
+        replaced = "_polynomial" in self.__dict__
+        self._polynomial = Polynomial(c)    # Polynomial in x - center
+        if replaced:
+            self._clear_caches()
+
+    @property
+    def degree(self):
+        return self._polynomial.degree
+
+    def to_dense(self):
+        """
+        Expand self into powers of x by a Taylor shift (see series.shift). Exact for exact coefficients and center,
+        eg. ints or Fractions, but may lose all precision otherwise.
+
+        Returns:
+            Polynomial: Polynomial in x equal to self.
+        """
+        import series
+        return Polynomial(series.shift(self.coeffs, self.center))
+
+    def _evaluate(self, x):
+        return self._polynomial._evaluate(x - self.center)
+
+    def _key(self):
+        return tuple(self.coeffs), self.center
+
+    def _evaluate_many(self, xs):
+        return batch.polyval(self.coeffs, batch.sub(xs, batch.full(xs, self.center)))
+
+    def _compile(self, compiler, arg):
+        return self._polynomial._compile(compiler, compiler.emit("{0} - {1}".format(arg, compiler.bind(self.center))))
+
+    def __str__(self):
+        """
+        Returns:
+             str: String of following form: '#(x - a)^0 +- #(x - a)^1 +- ... +- #(x - a)^n'
+        """
+        result = ""
+        for i, c in enumerate(self.coeffs):
+            if i == 0:
+                result += str(c)
+            elif c == 0:
+                continue
+            elif c < 0:
+                result += " - {0}(x - {1})^{2}".format(-c, self.center, i)
+            else:
+                result += " + {0}(x - {1})^{2}".format(c, self.center, i)
+        return result
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        elif not isinstance(other, ShiftedPolynomial):
+            return False
+        elif hash(self) != hash(other):
+            return False
+        return self.center == other.center and self.coeffs == other.coeffs
+
+    def __getitem__(self, item):
+        """
+        Gets nth coefficient of polynomial.
+
+        Args:
+            item (int): Power of x - center whose coefficient will be retrieved.
+
+        Returns:
+            number: Coefficient of (x - center)^item.
+        """
+        return self._polynomial[item]
+
+    def _coeffs_of(self, other):
+        """
+        Returns:
+            list, None: Coefficients of other if it is a ShiftedPolynomial with the same center
+                        or a numeric Constant, None otherwise.
+        """
+        if isinstance(other, ShiftedPolynomial) and other.center == self.center:
+            return other.coeffs
+        elif isinstance(other, function.Constant) and isinstance(other.val, numbers.Number):
+            return [other.val]
+        return None
+
+    def __add__(self, other):
+        """
+        Args:
+            other (Function): Function to add to self.
+
+        Returns:
+            ShiftedPolynomial: Sum of coefficients, if other is a ShiftedPolynomial with the same center or Constant.
+            Function: Self combined with other by addition otherwise.
+        """
+        coeffs = self._coeffs_of(other)
+        if coeffs is None:
+            return super(ShiftedPolynomial, self).__add__(other)
+        return ShiftedPolynomial(_add(self.coeffs, coeffs), self.center)
+
+    def __sub__(self, other):
+        """
+        Args:
+            other (Function): Function to subtract from self.
+
+        Returns:
+            ShiftedPolynomial: Difference of coefficients, if other is a ShiftedPolynomial with the same center
+                               or Constant.
+            Function: Self combined with other by subtraction otherwise.
+        """
+        coeffs = self._coeffs_of(other)
+        if coeffs is None:
+            return super(ShiftedPolynomial, self).__sub__(other)
+        return ShiftedPolynomial(_add(self.coeffs, [-c for c in coeffs]), self.center)
+
+    def __mul__(self, other):
+        """
+        Args:
+            other (Function): Function to multiply with self.
+
+        Returns:
+            ShiftedPolynomial: Product, if other is a ShiftedPolynomial with the same center or Constant.
+            Function: Self combined with other by multiplication otherwise.
+        """
+        coeffs = self._coeffs_of(other)
+        if coeffs is None:
+            return super(ShiftedPolynomial, self).__mul__(other)
+        return ShiftedPolynomial(_mul(self.coeffs, coeffs), self.center)
+
+    def roots(self, tol=1e-12, max_iter=100):
+        """
+        Find all complex roots at once, as roots of the polynomial in x - center. See Polynomial.roots.
+
+        Returns:
+            list[complex]: Each root, repeated according to multiplicity.
+        """
+        return [r + self.center for r in self._polynomial.roots(tol, max_iter)]
+
+    def real_roots(self, tol=1e-12):
+        """
+        Find distinct real roots, as roots of the polynomial in x - center. See Polynomial.real_roots.
+
+        Returns:
+            list[float]: Distinct real roots in increasing order.
+        """
+        return [r + self.center for r in self._polynomial.real_roots(tol)]
+
+    def _derivative(self):
+        if self.degree == 0:
+            return function.Constant(0)
+        return ShiftedPolynomial(self._polynomial._derivative().coeffs, self.center)
+
+
+def _exact(coeffs):
+    """
+    Returns:
+        list: coeffs as Fractions if all are rational, so that division is exact, else a copy of coeffs.
+    """
+    if all(isinstance(c, numbers.Rational) for c in coeffs):
+        return [fractions.Fraction(c) for c in coeffs]
+    return list(coeffs)
+
+
+def _trim(coeffs, tol=0):
+    """
+    Returns:
+        list: coeffs without trailing zeros, zeroing any with absolute value <= tol * largest absolute value.
+    """
+    scale = max(abs(c) for c in coeffs)
+    coeffs = [0 if abs(c) <= tol*scale else c for c in coeffs]
+    while len(coeffs) > 1 and coeffs[-1] == 0:
+        coeffs.pop()
+    return coeffs
+
+
+def _add(a, b):
+    if len(a) < len(b):
+        a, b = b, a
+    result = list(a)
+    for i, c in enumerate(b):
+        result[i] += c
+    return result
+
+
+def _mul(a, b):
+    """
+    Returns:
+        list: Coefficients of product of polynomials with coefficients a and b.
+    """
+    shortest = min(len(a), len(b))
+    if shortest >= FFT_THRESHOLD and not all(isinstance(c, numbers.Rational) for c in a + b):
+        return _mul_fft(a, b)
+    elif shortest >= KARATSUBA_THRESHOLD:
+        return _mul_karatsuba(a, b)
+    return _mul_schoolbook(a, b)
+
+
+def _mul_schoolbook(a, b):
+    result = [0]*(len(a) + len(b) - 1)
+    for i, x in enumerate(a):
+        if x == 0:
+            continue
+        for j, y in enumerate(b):
+            result[i + j] += x*y
+    return result
+
+
+def _mul_karatsuba(a, b):
+    # (a0 + a1 x^m)(b0 + b1 x^m) = z0 + (z1 - z0 - z2) x^m + z2 x^2m, where z1 = (a0 + a1)(b0 + b1)
+    if min(len(a), len(b)) < KARATSUBA_THRESHOLD // 2:
+        return _mul_schoolbook(a, b)
+    m = max(len(a), len(b)) // 2
+    a0, a1 = a[:m], a[m:]
+    b0, b1 = b[:m], b[m:]
+    if not a1 or not b1:
+        return _mul_schoolbook(a, b)
+    z0 = _mul_karatsuba(a0, b0)
+    z2 = _mul_karatsuba(a1, b1)
+    z1 = _mul_karatsuba(_add(a0, a1), _add(b0, b1))
+    result = [0]*(len(a) + len(b) - 1)
+    for i, c in enumerate(z0):
+        result[i] += c
+        z1[i] -= c
+    for i, c in enumerate(z2):
+        result[i + 2*m] += c
+        z1[i] -= c
+    for i, c in enumerate(z1[:len(result) - m]):
+        result[i + m] += c
+    return result
+
+
+def _fft(values, invert):
+    """
+    In-place iterative radix-2 fast Fourier transform. len(values) must be a power of 2.
+    """
+    n = len(values)
+    j = 0
+    for i in range(1, n):
+        bit = n >> 1
+        while j & bit:
+            j ^= bit
+            bit >>= 1
+        j |= bit
+        if i < j:
+            values[i], values[j] = values[j], values[i]
+    length = 2
+    while length <= n:
+        half = length // 2
+        root = cmath.exp((-2j if invert else 2j) * cmath.pi / length)
+        twiddles = [root ** k for k in range(half)]
+        for start in range(0, n, length):
+            for k in range(half):
+                u = values[start + k]
+                v = values[start + k + half] * twiddles[k]
+                values[start + k] = u + v
+                values[start + k + half] = u - v
+        length *= 2
+    if invert:
+        for i in range(n):
+            values[i] /= n
+
+
+def _mul_fft(a, b):
+    size = len(a) + len(b) - 1
+    n = 1
+    while n < size:
+        n *= 2
+    fa = [complex(c) for c in a] + [0j]*(n - len(a))
+    fb = [complex(c) for c in b] + [0j]*(n - len(b))
+    _fft(fa, False)
+    _fft(fb, False)
+    product = [x*y for x, y in zip(fa, fb)]
+    _fft(product, True)
+    if any(isinstance(c, complex) for c in a + b):
+        return product[:size]
+    return [c.real for c in product[:size]]
+
+
+def _divmod(a, b):
+    """
+    Returns:
+        tuple(list, list): Coefficients of quotient and remainder of polynomial a divided by polynomial b.
+    """
+    b = _trim(b)
+    if len(b) == 1 and b[0] == 0:
+        raise ZeroDivisionError("Polynomial division by zero")
+    remainder = list(a)
+    if len(a) < len(b):
+        return [0], remainder
+    elif min(len(b), len(a) - len(b) + 1) >= KARATSUBA_THRESHOLD:
+        return _divmod_newton(a, b)
+    quotient = [0]*(len(a) - len(b) + 1)
+    lead = b[-1]
+    for i in range(len(quotient) - 1, -1, -1):
+        q = remainder[i + len(b) - 1] if lead == 1 else remainder[i + len(b) - 1] / lead
+        quotient[i] = q
+        if q != 0:
+            for j in range(len(b) - 1):
+                remainder[i + j] -= q*b[j]
+        remainder[i + len(b) - 1] = 0    # Eliminated exactly, whatever rounding occurred
+    return quotient, _trim(remainder[:len(b) - 1] or [0])
+
+
+def _reciprocal(f, n):
+    """
+    Returns:
+        list: First n coefficients of the power series 1/f, by Newton's iteration g <- g(2 - fg). Requires f[0] != 0.
+    """
+    g = [1 if f[0] == 1 else 1 / f[0]]    # Keeps exact integer coefficients exact when f[0] is 1
+    k = 1
+    while k < n:
+        k = min(2*k, n)
+        error = [-c for c in _mul(f[:k], g)[:k]]
+        error[0] += 2
+        g = _mul(g, error)[:k]
+    return g
+
+
+def _divmod_newton(a, b):
+    # The quotient of a by b reversed is rev(a) / rev(b) as power series, truncated to the degree of the quotient.
+    # Takes the time of a few multiplications rather than O(len(a) len(b)).
+    size = len(a) - len(b) + 1
+    quotient = _mul(a[::-1][:size], _reciprocal(b[::-1], size))[:size]
+    quotient = (quotient + [0]*(size - len(quotient)))[::-1]
+    product = _mul(quotient, b)
+    remainder = [a[i] - product[i] for i in range(len(b) - 1)]
+    return quotient, _trim(remainder or [0])
@@ -0,0 +1,139 @@
+"""
+Profiling of Function evaluation, node by node.
+
+Author: Jack Romo <sharrackor@gmail.com>
+"""
+
+import collections
+import numbers
+import timeit
+import function
+
+
+NodeStats = collections.namedtuple("NodeStats", ["calls", "total", "own"])
+"""
+Time spent evaluating a single node of a Function tree.
+
+Fields:
+    calls (int): Number of times the node was evaluated.
+    total (float): Seconds spent evaluating the node, including its children. Nested evaluations
+                   of the same node, eg. in f(f), are only counted once.
+    own (float): Seconds spent in the node itself, excluding evaluation of its children.
+"""
+
+
+class Profiler(object):
+    """
+    Context manager recording the number of evaluations and the time spent in every node of
+    every Function called within it, eg.
+
+        with Profiler() as profiler:
+            f(1.0)
+        print(profiler.report(f))
+
+    Function.__call__ is replaced while the profiler is active and restored afterwards,
+    so Functions run at full speed outside it. Times include the profiler's own overhead per call,
+    which dominates for cheap nodes such as Constants. Only evaluation by calling Functions is profiled;
+    compiled functions, evaluate_many and the evaluators of the dag and traversal modules are not.
+    Profilers cannot be nested.
+    """
+
+    _active = None
+
+    def __init__(self):
+        self._stats = {}        # id of node -> [node, calls, total, own]
+        self._child_time = []   # Time spent in children of each node being evaluated, innermost last
+        self._running = {}      # id of node -> number of evaluations of node in progress
+        self._call = None
+
+    def __enter__(self):
+        if Profiler._active is not None:
+            raise RuntimeError("Profilers cannot be nested")
+        Profiler._active = self
+        self._call = function.Function.__dict__["__call__"]
+        profiler = self
+
+        def __call__(node, x):
+            return profiler._profile(node, x)
+        __call__.__doc__ = self._call.__doc__
+        function.Function.__call__ = __call__
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        function.Function.__call__ = self._call
+        Profiler._active = None
+        return False
+
+    def _profile(self, node, x):
+        if not (isinstance(x, numbers.Number) or isinstance(x, tuple)):
+            return self._call(node, x)      # Composition or invalid input; nothing is evaluated
+        key = id(node)
+        self._running[key] = self._running.get(key, 0) + 1
+        self._child_time.append(0.0)
+        start = timeit.default_timer()
+        try:
+            return self._call(node, x)
+        finally:
+            elapsed = timeit.default_timer() - start
+            children = self._child_time.pop()
+            self._running[key] -= 1
+            if key not in self._stats:
+                self._stats[key] = [node, 0, 0.0, 0.0]
+            stats = self._stats[key]
+            stats[1] += 1
+            if not self._running[key]:
+                stats[2] += elapsed
+            stats[3] += elapsed - children
+            if self._child_time:
+                self._child_time[-1] += elapsed
+
+    def __getitem__(self, node):
+        """
+        Args:
+            node (Function): Node of a profiled Function.
+
+        Returns:
+            NodeStats: Statistics of node, all zero if it was never evaluated.
+        """
+        if id(node) not in self._stats:
+            return NodeStats(0, 0.0, 0.0)
+        return NodeStats(*self._stats[id(node)][1:])
+
+    def nodes(self):
+        """
+        Returns:
+            list[tuple]: (node, NodeStats) for every node evaluated, from most to least time spent in the node itself.
+        """
+        entries = [(entry[0], NodeStats(*entry[1:])) for entry in self._stats.values()]
+        return sorted(entries, key=lambda entry: -entry[1].own)
+
+    def report(self, f):
+        """
+        Args:
+            f (Function): Profiled Function.
+
+        Returns:
+            str: Tree of f, one node per line indented below its parent, with the statistics of each node.
+                 Nodes shared by several parents appear under each of them.
+        """
+        lines = []
+        stack = [(f, 0)]
+        while stack:
+            node, depth = stack.pop()
+            stats = self[node]
+            lines.append("{0}{1}  calls={2} total={3:.6f}s own={4:.6f}s".format(
+                "    " * depth, _label(node), stats.calls, stats.total, stats.own))
+            stack.extend((c, depth + 1) for c in reversed(node._children()))
+        return "\n".join(lines)
+
+
+def _label(node):
+    """
+    Returns:
+        str: Name of type of node, with its parameters if any, shortened to a single line.
+    """
+    label = type(node).__name__
+    key = node._key()
+    if key:
+        label += "(" + ", ".join(repr(k) for k in key) + ")"
+    return label if len(label) <= 60 else label[:57] + "..."
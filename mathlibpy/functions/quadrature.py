@@ -0,0 +1,215 @@
+"""
+Adaptive numerical integration of Functions over finite intervals.
+
+Author: Jack Romo <sharrackor@gmail.com>
+"""
+
+from __future__ import division
+import math
+import multiprocessing
+import function
+import solvers
+
+
+# Nodes in [0, 1] and weights of 15 point Kronrod rule, and weights of the 7 point Gauss rule
+# on its odd nodes (1, 3, 5, 7), from QUADPACK
+KRONROD_NODES = [0.991455371120812639206854697526329, 0.949107912342758524526189684047851,
+                 0.864864423359769072789712788640926, 0.741531185599394439863864773280788,
+                 0.586087235467691130294144845693013, 0.405845151377397166906606412076961,
+                 0.207784955007898467600689403773245, 0.0]
+KRONROD_WEIGHTS = [0.022935322010529224963732008058970, 0.063092092629978553290700663189204,
+                   0.104790010322250183839876322541518, 0.140653259715525918745189590510238,
+                   0.169004726639267902826583426598550, 0.190350578064785409913256402421014,
+                   0.204432940075298892414161999234649, 0.209482141084727828012999174891714]
+GAUSS_WEIGHTS = [0.129484966168869693270611432679082, 0.279705391489276667901467771423780,
+                 0.381830050505118944950369775488975, 0.417959183673469387755102040816327]
+
+
+def _values(f, points):
+    """
+    Returns:
+        list: f at each point, evaluating a Function at all points at once.
+    """
+    if isinstance(f, function.Function):
+        return list(f.evaluate_many(points))
+    return [f(x) for x in points]
+
+
+def _chunks(items):
+    """
+    Returns:
+        list[list]: items split into a few chunks per processor.
+    """
+    size = max(1, -(-len(items) // (4*multiprocessing.cpu_count())))
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def _kronrod_estimates(args):
+    """
+    Args:
+        args (tuple): (f, intervals), packed together for Pool.map.
+
+    Returns:
+        list[tuple]: (Kronrod estimate, |Kronrod - Gauss|) for integral of f over each (a, b) in intervals.
+    """
+    f, intervals = args
+    points = []
+    for a, b in intervals:
+        center = (a + b) / 2
+        half = (b - a) / 2
+        points.extend([center - half*x for x in KRONROD_NODES[:-1]])
+        points.extend([center + half*x for x in reversed(KRONROD_NODES)])
+    values = _values(f, points)
+    estimates = []
+    for i, (a, b) in enumerate(intervals):
+        # values[15i:15i+15] are f at the Kronrod nodes from left to right, the center being the 8th
+        v = values[15*i:15*i + 15]
+        kronrod = sum(w*(v[j] + v[14 - j]) for j, w in enumerate(KRONROD_WEIGHTS[:-1])) + KRONROD_WEIGHTS[-1]*v[7]
+        gauss = sum(w*(v[2*j + 1] + v[13 - 2*j]) for j, w in enumerate(GAUSS_WEIGHTS[:-1])) + GAUSS_WEIGHTS[-1]*v[7]
+        half = (b - a) / 2
+        estimates.append((kronrod*half, abs(kronrod - gauss)*half))
+    return estimates
+
+
+def _kronrod(f, intervals, pool):
+    if pool is None:
+        return _kronrod_estimates((f, intervals))
+    results = pool.map(_kronrod_estimates, [(f, chunk) for chunk in _chunks(intervals)])
+    return [estimate for chunk in results for estimate in chunk]
+
+
+def gauss_kronrod(f, a, b, tol=1e-10, rtol=1e-10, max_intervals=1000, pool=None):
+    """
+    Integrate f over [a, b] by adaptive 7-15 point Gauss-Kronrod quadrature.
+    Each round, every subinterval whose error estimate exceeds its share of the allowed error is halved,
+    and f is evaluated at the nodes of all new subintervals at once.
+
+    Args:
+        f (Function, callable): Function of one variable, finite on [a, b].
+        a (number): Lower limit.
+        b (number): Upper limit.
+        tol (float): Target absolute error.
+        rtol (float): Target error relative to the magnitude of the integral. Either target suffices.
+        max_intervals (int): Max number of subintervals, at which the current estimate is returned.
+        pool (multiprocessing.Pool): If given, new subintervals are split among its processes each round.
+                                     Only worthwhile for expensive functions. f must be picklable.
+
+    Returns:
+        tuple(float, float): (integral, estimate of absolute error), the difference between the Kronrod
+                             and Gauss rules, summed over subintervals.
+
+    Raises:
+        solvers.ConvergenceError: The error estimate is not finite, eg. f is NaN or infinite somewhere on [a, b],
+                                  or no subinterval can be split to reduce it.
+    """
+    if a == b:
+        return 0.0, 0.0
+    elif b < a:
+        value, error = gauss_kronrod(f, b, a, tol, rtol, max_intervals, pool)
+        return -value, error
+    intervals = [(a, b)]
+    estimates = _kronrod(f, intervals, pool)
+    while True:
+        value = sum(v for v, _ in estimates)
+        error = sum(e for _, e in estimates)
+        allowed = max(tol, rtol*abs(value))
+        if not error < float("inf"):
+            raise solvers.ConvergenceError("Error estimate of integral is not finite; f may be NaN or infinite")
+        elif error <= allowed or len(intervals) >= max_intervals:
+            return value, error
+
+        # Some interval must have more than its share, as the shares sum to the allowed error
+        split = sorted((i for i, (lo, hi) in enumerate(intervals) if estimates[i][1] > allowed*(hi - lo)/(b - a)),
+                       key=lambda i: -estimates[i][1])[:max_intervals - len(intervals)]
+        if not split:
+            raise solvers.ConvergenceError("No subinterval can be split to meet tolerance of integral")
+        halves = []
+        for i in split:
+            lo, hi = intervals[i]
+            halves.extend([(lo, (lo + hi) / 2), ((lo + hi) / 2, hi)])
+        new_estimates = _kronrod(f, halves, pool)
+        split = set(split)
+        kept = [i for i in range(len(intervals)) if i not in split]
+        intervals = [intervals[i] for i in kept] + halves
+        estimates = [estimates[i] for i in kept] + new_estimates
+
+
+def _tanh_sinh_nodes(a, b, ts):
+    """
+    Returns:
+        tuple(list, list): Nodes x(t) = (a + b)/2 + (b - a)/2 tanh(pi/2 sinh(t)) in [a, b] and weights x'(t),
+                           for each t and -t in ts (t > 0). Nodes are found from their distance to the nearest end,
+                           so are accurate close to the ends. Nodes which round to an end are dropped.
+    """
+    nodes = []
+    weights = []
+    for t in ts:
+        u = math.pi / 2 * math.sinh(t)
+        if u > 350:     # exp(2u) would overflow
+            break
+        distance = (b - a) / (1 + math.exp(2*u))
+        weight = (b - a) / 2 * math.pi / 2 * math.cosh(t) / math.cosh(u)**2
+        ends = [x for x in (a + distance, b - distance) if x != a and x != b]
+        if not ends or weight == 0:
+            break
+        nodes.extend(ends)
+        weights.extend([weight]*len(ends))
+    return nodes, weights
+
+
+def _evaluate_chunk(args):
+    f, points = args
+    return _values(f, points)
+
+
+def _evaluate(f, points, pool):
+    if pool is None:
+        return _values(f, points)
+    results = pool.map(_evaluate_chunk, [(f, chunk) for chunk in _chunks(points)])
+    return [value for chunk in results for value in chunk]
+
+
+def tanh_sinh(f, a, b, tol=1e-10, rtol=1e-10, max_level=10, pool=None):
+    """
+    Integrate f over [a, b] by tanh-sinh (double exponential) quadrature: the trapezoidal rule after substituting
+    x = (a + b)/2 + (b - a)/2 tanh(pi/2 sinh(t)). Converges very quickly for functions analytic inside (a, b),
+    even with singularities at a or b, as f is never evaluated at the ends. Nodes can only approach an end
+    as closely as floats near it allow, so singularities at a nonzero end are integrated less accurately.
+    Each level halves the step in t, evaluating f at all new nodes at once.
+
+    Args:
+        f (Function, callable): Function of one variable, finite inside (a, b).
+        a (number): Lower limit.
+        b (number): Upper limit.
+        tol (float): Target absolute error.
+        rtol (float): Target error relative to the magnitude of the integral. Either target suffices.
+        max_level (int): Max number of times to halve the step, at which the current estimate is returned.
+        pool (multiprocessing.Pool): If given, the nodes of each level are split among its processes.
+                                     Only worthwhile for expensive functions. f must be picklable.
+
+    Returns:
+        tuple(float, float): (integral, estimate of absolute error), the change from the previous level.
+    """
+    if a == b:
+        return 0.0, 0.0
+    elif b < a:
+        value, error = tanh_sinh(f, b, a, tol, rtol, max_level, pool)
+        return -value, error
+
+    # Level 0: step 1, at t = 0, +-1, +-2, ...
+    center = (a + b) / 2
+    nodes, weights = _tanh_sinh_nodes(a, b, range(1, 10))
+    values = _evaluate(f, [center] + nodes, pool)
+    value = (b - a) / 2 * math.pi / 2 * values[0] + sum(w*v for w, v in zip(weights, values[1:]))
+    error = abs(value)
+    for level in range(1, max_level + 1):
+        # Halving the step keeps all previous nodes, and adds nodes at odd multiples of the new step
+        step = 2.0 ** -level
+        nodes, weights = _tanh_sinh_nodes(a, b, [(2*k + 1)*step for k in range(int(10 / step))])
+        values = _evaluate(f, nodes, pool)
+        new_value = value / 2 + step*sum(w*v for w, v in zip(weights, values))
+        error = abs(new_value - value)
+        value = new_value
+        if level >= 2 and error <= max(tol, rtol*abs(value)):
+            break
+    return value, error
@@ -0,0 +1,173 @@
+"""
+Tape-based reverse-mode automatic differentiation.
+
+Author: Jack Romo <sharrackor@gmail.com>
+"""
+
+from __future__ import division
+import math
+import numbers
+
+
+class Tape(object):
+    """
+    Record of every arithmetic operation performed on its TapeValues.
+    After a forward evaluation, a single backward sweep over the record gives the partial derivatives
+    of a result with respect to every input at once.
+    """
+
+    def __init__(self):
+        self._partials = []    # index of value -> tuple of (index of operand, d value / d operand)
+
+    def __len__(self):
+        return len(self._partials)
+
+    def variable(self, value):
+        """
+        Args:
+            value (number): Value of a new input.
+
+        Returns:
+            TapeValue: Input to be differentiated with respect to.
+        """
+        return self._record(value, ())
+
+    def _record(self, value, partials):
+        self._partials.append(partials)
+        return TapeValue(self, len(self._partials) - 1, value)
+
+    def gradient(self, output, inputs):
+        """
+        Args:
+            output (TapeValue, number): Result of a computation on this tape.
+            inputs (list[TapeValue]): Inputs created by variable.
+
+        Returns:
+            list[number]: Partial derivative of output with respect to each input.
+        """
+        if not isinstance(output, TapeValue) or output.tape is not self:
+            return [0 for _ in inputs]     # Output does not depend on inputs
+        adjoints = [0]*(output.index + 1)
+        adjoints[output.index] = 1
+        for i in range(output.index, -1, -1):
+            adjoint = adjoints[i]
+            if adjoint == 0:
+                continue
+            for j, partial in self._partials[i]:
+                adjoints[j] += adjoint * partial
+        return [adjoints[x.index] if x.index <= output.index else 0 for x in inputs]
+
+
+class TapeValue(object):
+    """
+    Number recorded on a Tape. Arithmetic on TapeValues produces new TapeValues on the same tape,
+    recording the local partial derivatives of each operation.
+
+    TapeValues count as Numbers, and provide sin, cos, exp and log methods for elementary Functions,
+    as dual.Dual does. Comparisons only look at the value.
+    """
+
+    def __init__(self, tape, index, value):
+        self.tape = tape
+        self.index = index
+        self.value = value
+
+    def __repr__(self):
+        return "TapeValue({0!r})".format(self.value)
+
+    def __eq__(self, other):
+        return self.value == _value(other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(self.value)
+
+    def __lt__(self, other):
+        return self.value < _value(other)
+
+    def __le__(self, other):
+        return self.value <= _value(other)
+
+    def __gt__(self, other):
+        return self.value > _value(other)
+
+    def __ge__(self, other):
+        return self.value >= _value(other)
+
+    def __neg__(self):
+        return self.tape._record(-self.value, ((self.index, -1),))
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        return -self if self.value < 0 else self
+
+    def __add__(self, other):
+        if isinstance(other, TapeValue):
+            return self.tape._record(self.value + other.value, ((self.index, 1), (other.index, 1)))
+        return self.tape._record(self.value + other, ((self.index, 1),))
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if isinstance(other, TapeValue):
+            return self.tape._record(self.value - other.value, ((self.index, 1), (other.index, -1)))
+        return self.tape._record(self.value - other, ((self.index, 1),))
+
+    def __rsub__(self, other):
+        return self.tape._record(other - self.value, ((self.index, -1),))
+
+    def __mul__(self, other):
+        if isinstance(other, TapeValue):
+            return self.tape._record(self.value * other.value,
+                                     ((self.index, other.value), (other.index, self.value)))
+        return self.tape._record(self.value * other, ((self.index, other),))
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if isinstance(other, TapeValue):
+            return self.tape._record(self.value / other.value,
+                                     ((self.index, 1 / other.value),
+                                      (other.index, -self.value / (other.value * other.value))))
+        return self.tape._record(self.value / other, ((self.index, 1 / other),))
+
+    def __rtruediv__(self, other):
+        return self.tape._record(other / self.value, ((self.index, -other / (self.value * self.value)),))
+
+    __div__ = __truediv__
+    __rdiv__ = __rtruediv__
+
+    def __pow__(self, other):
+        if isinstance(other, TapeValue):
+            return (other * self.log()).exp()
+        elif other == 0:
+            return self.tape._record(self.value ** 0, ())
+        return self.tape._record(self.value ** other, ((self.index, other * self.value ** (other - 1)),))
+
+    def __rpow__(self, other):
+        value = other ** self.value
+        return self.tape._record(value, ((self.index, value * math.log(other)),))
+
+    def sin(self):
+        return self.tape._record(math.sin(self.value), ((self.index, math.cos(self.value)),))
+
+    def cos(self):
+        return self.tape._record(math.cos(self.value), ((self.index, -math.sin(self.value)),))
+
+    def exp(self):
+        value = math.exp(self.value)
+        return self.tape._record(value, ((self.index, value),))
+
+    def log(self):
+        return self.tape._record(math.log(self.value), ((self.index, 1 / self.value),))
+
+
+numbers.Number.register(TapeValue)
+
+
+def _value(x):
+    return x.value if isinstance(x, TapeValue) else x
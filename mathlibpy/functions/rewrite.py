@@ -0,0 +1,306 @@
+"""
+Rewrite-based algebraic simplification of Function trees.
+
+Author: Jack Romo <sharrackor@gmail.com>
+"""
+
+from __future__ import division
+import numbers
+import function
+import polynomial
+import exp
+import traversal
+
+
+def simplify(f):
+    """
+    Simplify a Function tree bottom-up, by:
+
+    * Folding operations on constants into a single Constant.
+    * Eliminating additions of 0, multiplications by 0 and 1, divisions by 1, etc.
+    * Merging sums, products and compositions of polynomials into a single Polynomial.
+    * Collecting like terms of sums, eg. 2*f + f - 3*f = 0.
+
+    The result is equal in value to f wherever f is defined.
+    Nodes are simplified children first, from an explicit stack (see traversal.postorder), so trees of any depth
+    can be simplified, and a node shared by several parents is simplified only once.
+
+    Args:
+        f (Function): Function to simplify.
+
+    Returns:
+        Function: Simplified function. Nodes of f are reused but never modified.
+    """
+    simplified = {}     # id of node -> simplified node
+    for node in traversal.postorder(f, lambda n: isinstance(n, _REWRITTEN)):
+        simplified[id(node)] = _simplify_node(node, lambda g: simplified.get(id(g), g))
+    return simplified.get(id(f), f)
+
+
+_REWRITTEN = (function.FunctionBinaryTreeNode, exp.Power, exp.LogBase, polynomial.Polynomial)
+
+
+def _simplify_node(f, simplified):
+    """
+    Args:
+        f (Function): Node to simplify.
+        simplified (callable): Takes a child of f and returns it simplified.
+
+    Returns:
+        Function: Simplification of f.
+    """
+    if isinstance(f, (function.FunctionAddNode, function.FunctionSubNode)):
+        return _simplify_sum(function.FunctionSubNode if isinstance(f, function.FunctionSubNode)
+                             else function.FunctionAddNode, simplified(f.f1), simplified(f.f2))
+    elif isinstance(f, function.FunctionMulNode):
+        return _simplify_product(simplified(f.f1), simplified(f.f2))
+    elif isinstance(f, function.FunctionDivNode):
+        return _simplify_quotient(simplified(f.f1), simplified(f.f2))
+    elif isinstance(f, function.FunctionCompNode):
+        return _simplify_composition(simplified(f.f1), simplified(f.f2))
+    elif isinstance(f, exp.Power):
+        return _simplify_power(simplified(f.f1), simplified(f.f2))
+    elif isinstance(f, exp.LogBase) and isinstance(f.b, function.Function):
+        return exp.LogBase(simplified(f.b))
+    elif isinstance(f, polynomial.Polynomial):
+        return _make_polynomial(f.coeffs)
+    else:
+        return f
+
+
+def _is_constant(f, val=None):
+    if not (isinstance(f, function.Constant) and isinstance(f.val, numbers.Number)):
+        return False
+    return val is None or f.val == val
+
+
+def _polynomial_coeffs(f):
+    """
+    Returns:
+        list, None: Coefficients of f if it is a Constant or Polynomial, None otherwise.
+    """
+    if _is_constant(f):
+        return [f.val]
+    elif isinstance(f, polynomial.Polynomial):
+        return list(f.coeffs)
+    return None
+
+
+def _make_polynomial(coeffs):
+    """
+    Returns:
+        Function: Constant if coeffs has degree 0, Polynomial otherwise.
+    """
+    p = polynomial.Polynomial(list(coeffs))
+    if p.degree == 0:
+        return function.Constant(p[0])
+    return p
+
+
+def _add_coeffs(c1, c2, scale=1):
+    """
+    Returns:
+        list: Coefficients of c1 + scale*c2.
+    """
+    return (polynomial.Polynomial(list(c1)) + polynomial.Polynomial([scale*c for c in c2])).coeffs
+
+
+def _mul_coeffs(c1, c2):
+    """
+    Returns:
+        list: Coefficients of product of polynomials with coefficients c1 and c2.
+    """
+    return (polynomial.Polynomial(list(c1)) * polynomial.Polynomial(list(c2))).coeffs
+
+
+def _compose_coeffs(c1, c2):
+    """
+    Returns:
+        list: Coefficients of p1(p2(x)), where p1 and p2 have coefficients c1 and c2. Uses Horner's scheme.
+    """
+    p2 = polynomial.Polynomial(list(c2))
+    result = polynomial.Polynomial([c1[-1]])
+    for c in reversed(c1[:-1]):
+        result = result * p2 + function.Constant(c)
+    return result.coeffs
+
+
+def _factors(f):
+    """
+    Returns:
+        list[Function]: Factors of f, flattening nested products.
+    """
+    factors = []
+    stack = [f]
+    while stack:
+        g = stack.pop()
+        if isinstance(g, function.FunctionMulNode):
+            stack.extend([g.f2, g.f1])
+        else:
+            factors.append(g)
+    return factors
+
+
+def _split_coefficient(f):
+    """
+    Split f into a polynomial coefficient and the product of its remaining factors.
+
+    Returns:
+        tuple(list, Function): (c, g) such that f = p*g, where p has coefficients c. g is None if f is a polynomial.
+    """
+    coeffs = [1]
+    rest = []
+    for factor in _factors(f):
+        factor_coeffs = _polynomial_coeffs(factor)
+        if factor_coeffs is not None:
+            coeffs = _mul_coeffs(coeffs, factor_coeffs)
+        else:
+            rest.append(factor)
+    if not rest:
+        return coeffs, None
+    return coeffs, reduce(function.FunctionMulNode, rest)
+
+
+def _terms(f, sign, terms):
+    """
+    Append (coefficients, term) pairs of the sum f, multiplied by sign, to terms.
+    """
+    stack = [(f, sign)]
+    while stack:
+        g, sign = stack.pop()
+        if isinstance(g, function.FunctionAddNode):
+            stack.extend([(g.f2, sign), (g.f1, sign)])
+        elif isinstance(g, function.FunctionSubNode):
+            stack.extend([(g.f2, -sign), (g.f1, sign)])
+        else:
+            coeffs, h = _split_coefficient(g)
+            terms.append(([sign*c for c in coeffs], h))
+
+
+def _same(f1, f2):
+    """
+    Returns:
+        bool: True if f1 and f2 are structurally identical, node for node. Unlike ==, nodes must be of
+              exactly the same type, so eg. f/g and f(g) are never like terms, whatever their __eq__.
+    """
+    pairs = [(f1, f2)]
+    while pairs:
+        a, b = pairs.pop()
+        if a is b:
+            continue
+        elif type(a) is not type(b):
+            return False
+        children = a._children()
+        if children:
+            if a._key() != b._key():
+                return False
+            pairs.extend(zip(children, b._children()))
+        elif not a == b:
+            return False
+    return True
+
+
+def _simplify_sum(node_type, f1, f2):
+    if _is_constant(f1) and _is_constant(f2):
+        return function.Constant(node_type(f1, f2)(0))
+    terms = []
+    _terms(f1, 1, terms)
+    _terms(f2, -1 if node_type is function.FunctionSubNode else 1, terms)
+
+    # Collect like terms by exact equality, adding their polynomial coefficients
+    collected = []
+    for coeffs, g in terms:
+        for i, (other_coeffs, other_g) in enumerate(collected):
+            if (g is None and other_g is None) or (g is not None and other_g is not None and _same(g, other_g)):
+                collected[i] = (_add_coeffs(other_coeffs, coeffs), other_g)
+                break
+        else:
+            collected.append((coeffs, g))
+
+    result = None
+    for coeffs, g in collected:
+        coeff = _make_polynomial(coeffs)
+        if _is_constant(coeff, 0):
+            continue
+        negate = result is not None and _is_constant(coeff) and coeff.val < 0
+        if negate:
+            coeff = function.Constant(-coeff.val)
+        term = coeff if g is None else _simplify_product(coeff, g)
+        if result is None:
+            result = term
+        elif negate:
+            result = function.FunctionSubNode(result, term)
+        else:
+            result = function.FunctionAddNode(result, term)
+    return function.Constant(0) if result is None else result
+
+
+def _simplify_product(f1, f2):
+    """
+    Multiply simplified functions. A simplified product is leading*rest, where leading is its only
+    constant or polynomial factor, if any, so the factors of f1 and f2 are merged without flattening them;
+    flattening would take time quadratic in the depth of long products, eg. derivatives of deep compositions.
+    """
+    coeffs = [1]
+    rest = []
+    for f in [f1, f2]:
+        if isinstance(f, function.FunctionMulNode) and _polynomial_coeffs(f.f1) is not None:
+            f, g = f.f1, f.f2
+            rest.append(g)
+        f_coeffs = _polynomial_coeffs(f)
+        if f_coeffs is not None:
+            coeffs = _mul_coeffs(coeffs, f_coeffs)
+        else:
+            rest.append(f)
+    leading = _make_polynomial(coeffs)
+    if _is_constant(leading, 0):
+        return function.Constant(0)
+    elif not rest:
+        return leading
+    body = reduce(function.FunctionMulNode, rest)
+    if _is_constant(leading, 1):
+        return body
+    return function.FunctionMulNode(leading, body)
+
+
+def _simplify_quotient(f1, f2):
+    if _is_constant(f2, 1):
+        return f1
+    elif _is_constant(f1, 0) and not _is_constant(f2, 0):
+        return function.Constant(0)
+    elif _is_constant(f2) and f2.val != 0:
+        coeffs = _polynomial_coeffs(f1)
+        if coeffs is not None:
+            return _make_polynomial([c / float(f2.val) for c in coeffs])
+    return function.FunctionDivNode(f1, f2)
+
+
+def _simplify_composition(f1, f2):
+    identity = [0, 1]
+    if _is_constant(f1):
+        return f1
+    elif _polynomial_coeffs(f1) == identity:
+        return f2
+    elif _polynomial_coeffs(f2) == identity:
+        return f1
+    elif _is_constant(f2):
+        try:
+            return function.Constant(f1(f2.val))
+        except (ArithmeticError, ValueError):
+            return function.FunctionCompNode(f1, f2)
+    elif isinstance(f1, polynomial.Polynomial) and isinstance(f2, polynomial.Polynomial):
+        return _make_polynomial(_compose_coeffs(f1.coeffs, f2.coeffs))
+    return function.FunctionCompNode(f1, f2)
+
+
+def _simplify_power(f1, f2):
+    if _is_constant(f2, 0):
+        return function.Constant(1)
+    elif _is_constant(f2, 1):
+        return f1
+    elif _is_constant(f1) and _is_constant(f2):
+        try:
+            return function.Constant(exp.Power(f1, f2)(0))
+        except (ArithmeticError, ValueError):
+            pass
+    return exp.Power(f1, f2)
@@ -0,0 +1,401 @@
+"""
+Roots of polynomials: all complex roots by Aberth's method, and real roots by Sturm sequences.
+
+Author: Jack Romo <sharrackor@gmail.com>
+"""
+
+from __future__ import division
+import cmath
+import fractions
+import numbers
+import polynomial
+
+
+def aberth(coeffs, tol=1e-12, max_iter=100):
+    """
+    Find all complex roots of a polynomial at once by Aberth's method.
+    Every root estimate takes a Newton step, corrected by repulsion from the other estimates.
+    Estimates are updated in turn, each using the latest values of the others, and frozen once converged.
+
+    Args:
+        coeffs (list): Coefficients of polynomial, indexed by degree. Must not be the zero polynomial.
+        tol (float): Stop refining a root once its step is this small relative to its magnitude (or 1, if larger).
+        max_iter (int): Max number of sweeps over all roots.
+
+    Returns:
+        list[complex]: Each root, repeated according to multiplicity. Multiple roots converge slowly,
+                       so are less accurate.
+    """
+    coeffs = polynomial._trim(list(coeffs))
+    if len(coeffs) == 1 and coeffs[0] == 0:
+        raise ValueError("Zero polynomial has infinitely many roots")
+    zeros = 0
+    while coeffs[zeros] == 0:
+        zeros += 1
+    coeffs = coeffs[zeros:]
+    roots = [0j]*zeros
+    n = len(coeffs) - 1
+    if n == 0:
+        return roots
+    monic = [complex(c) / coeffs[-1] for c in coeffs]
+    if n == 1:
+        return roots + [-monic[0]]
+
+    # Start on a circle whose radius is the geometric mean of the magnitudes of the roots,
+    # with angles offset to avoid symmetries of the polynomial
+    radius = abs(monic[0]) ** (1 / n)
+    z = [radius * cmath.exp(1j * (2*cmath.pi*k/n + 0.4)) for k in range(n)]
+    converged = [False]*n
+    for _ in range(max_iter):
+        for i in range(n):
+            if converged[i]:
+                continue
+            zi = z[i]
+            p, dp = monic[-1], 0j     # p(zi) and p'(zi) together by Horner's scheme
+            for c in monic[-2::-1]:
+                dp = dp*zi + p
+                p = p*zi + c
+            if p == 0:
+                converged[i] = True
+                continue
+            repulsion = sum(1 / (zi - zj) for j, zj in enumerate(z) if j != i and zj != zi)
+            step = p / (dp - p*repulsion) if dp - p*repulsion != 0 else tol*radius
+            z[i] = zi - step
+            if abs(step) <= tol * max(abs(z[i]), 1):
+                converged[i] = True
+        if all(converged):
+            break
+    return roots + z
+
+
+def sturm_sequence(coeffs, tol=1e-12):
+    """
+    Args:
+        coeffs (list): Coefficients of polynomial p, indexed by degree. Must not be the zero polynomial.
+        tol (float): With inexact coefficients, remainder coefficients this small relative to the largest
+                     are treated as zero. Exact (rational) coefficients are handled exactly.
+
+    Returns:
+        list[list]: Coefficients of p, p' and the negated remainders of Euclid's algorithm on them.
+                    With rational coefficients, every polynomial is an integer polynomial, scaled by some
+                    positive factor, which leaves the signs of its values unchanged. Remainders are then
+                    computed by pseudo-division and divided by their content (the gcd of their coefficients),
+                    which keeps the coefficients from growing exponentially along the sequence.
+    """
+    coeffs = polynomial._exact(polynomial._trim(list(coeffs)))
+    if len(coeffs) == 1 and coeffs[0] == 0:
+        raise ValueError("Zero polynomial has infinitely many roots")
+    elif isinstance(coeffs[-1], fractions.Fraction):
+        return _primitive_sturm_sequence(_integer(coeffs))
+    sequence = [coeffs]
+    if len(coeffs) > 1:
+        sequence.append([coeffs[i]*i for i in range(1, len(coeffs))])
+    while len(sequence[-1]) > 1:
+        remainder = polynomial._trim(polynomial._divmod(sequence[-2], sequence[-1])[1], tol)
+        if len(remainder) == 1 and remainder[0] == 0:
+            break
+        sequence.append([-c for c in remainder])
+    return sequence
+
+
+def _integer(coeffs):
+    """
+    Returns:
+        list[int]: Fractions coeffs multiplied by the least common multiple of their denominators.
+    """
+    scale = 1
+    for c in coeffs:
+        scale = scale * c.denominator // _gcd(scale, c.denominator)
+    return [int(c * scale) for c in coeffs]
+
+
+def _gcd(a, b):
+    while b:
+        a, b = b, a % b
+    return abs(a)
+
+
+def _primitive(coeffs):
+    """
+    Returns:
+        list[int]: coeffs divided by their content, the positive gcd of all of them.
+    """
+    content = 0
+    for c in coeffs:
+        content = _gcd(content, c)
+        if content == 1:
+            return coeffs
+    return [c // content for c in coeffs]
+
+
+def _pseudo_divmod(a, b):
+    """
+    Pseudo-division of integer polynomials, which needs no fractions.
+
+    Returns:
+        tuple(list, list): Coefficients of q and r such that lc(b)^(deg a - deg b + 1) a = q b + r,
+                           where lc(b) is the leading coefficient of b and r has lower degree than b.
+    """
+    m = len(b) - 1
+    lead = b[-1]
+    r = list(a)
+    q = [0]*max(len(a) - m, 1)
+    for i in range(len(a) - 1 - m, -1, -1):
+        top = r[m + i]
+        q = [c*lead for c in q]
+        q[i] = top
+        r = [c*lead for c in r]
+        if top:
+            for j, c in enumerate(b):
+                r[i + j] -= top*c
+        r.pop()
+    return q, polynomial._trim(r) if r else [0]
+
+
+def _primitive_sturm_sequence(coeffs):
+    sequence = [coeffs]
+    if len(coeffs) > 1:
+        sequence.append([coeffs[i]*i for i in range(1, len(coeffs))])
+    while len(sequence[-1]) > 1:
+        a, b = sequence[-2], sequence[-1]
+        remainder = _pseudo_divmod(a, b)[1]
+        if len(remainder) == 1 and remainder[0] == 0:
+            break
+        # The remainder was scaled by lc(b)^(deg a - deg b + 1); negate it unless that factor is negative
+        if b[-1] > 0 or (len(a) - len(b)) % 2 == 1:
+            remainder = [-c for c in remainder]
+        sequence.append(_primitive(remainder))
+    return sequence
+
+
+def _is_exact(sequence):
+    return all(isinstance(c, numbers.Integral) for c in sequence[0])
+
+
+def _sign(coeffs, num, den):
+    """
+    Returns:
+        int: Sign of the integer polynomial with coefficients coeffs at num / den, where den > 0, computed
+             as the sign of den^n p(num / den) by Horner's scheme in integers.
+    """
+    value = coeffs[-1]
+    scale = 1
+    for c in coeffs[-2::-1]:
+        scale *= den
+        value = value*num + c*scale
+    return (value > 0) - (value < 0)
+
+
+def _count_changes(values):
+    changes = 0
+    last = 0
+    for value in values:
+        if value != 0:
+            if last != 0 and (value < 0) != (last < 0):
+                changes += 1
+            last = value
+    return changes
+
+
+def sign_changes(sequence, x):
+    """
+    Returns:
+        int: Number of sign changes in the values of the polynomials of sequence at x, ignoring zeros.
+             Exact for the integer sequences of polynomials with rational coefficients, and rational or float x.
+    """
+    if _is_exact(sequence):
+        x = fractions.Fraction(x)
+        return _count_changes([_sign(coeffs, x.numerator, x.denominator) for coeffs in sequence])
+    return _count_changes([_horner(coeffs, x) for coeffs in sequence])
+
+
+def root_bound(coeffs):
+    """
+    Returns:
+        number: Cauchy's bound, which is greater than the magnitude of every root of the polynomial.
+    """
+    coeffs = polynomial._trim(list(coeffs))
+    return 1 + max(abs(c / coeffs[-1]) for c in coeffs[:-1]) if len(coeffs) > 1 else 1
+
+
+def _dyadic_bound(coeffs):
+    """
+    Returns:
+        int: Power of two greater than Cauchy's bound for an integer polynomial.
+    """
+    ratio = max(abs(c) for c in coeffs[:-1]) // abs(coeffs[-1]) if len(coeffs) > 1 else 0
+    return 1 << (ratio + 2).bit_length()
+
+
+def count_real_roots(coeffs, lo=None, hi=None):
+    """
+    Count distinct real roots of a polynomial by Sturm's theorem.
+
+    Args:
+        coeffs (list): Coefficients of polynomial, indexed by degree. Must not be the zero polynomial.
+        lo (number): Lower end of interval, which must not be a root. Unbounded if None.
+        hi (number): Upper end of interval, which must not be a root. Unbounded if None.
+
+    Returns:
+        int: Number of distinct real roots between lo and hi.
+    """
+    sequence = sturm_sequence(coeffs)
+    bound = _dyadic_bound(sequence[0]) if _is_exact(sequence) else root_bound(sequence[0])
+    return (sign_changes(sequence, -bound if lo is None else lo) -
+            sign_changes(sequence, bound if hi is None else hi))
+
+
+def _split(sequence, lo, hi):
+    """
+    Returns:
+        number: Point strictly between lo and hi that is not a root of the first polynomial of sequence.
+    """
+    k = 2
+    while True:
+        mid = lo + (hi - lo) / k
+        if _horner(sequence[0], mid) != 0:
+            return mid
+        k += 1
+
+
+def isolate_real_roots(coeffs):
+    """
+    Find disjoint intervals each containing exactly one distinct real root of a polynomial, by bisection
+    with Sturm's theorem.
+
+    Args:
+        coeffs (list): Coefficients of polynomial, indexed by degree. Must not be the zero polynomial.
+
+    Returns:
+        list[tuple]: (lo, hi) pairs in increasing order, such that one root lies between lo and hi,
+                     neither of which are roots. lo and hi are Fractions if all coefficients are rational.
+    """
+    sequence = sturm_sequence(coeffs)
+    if _is_exact(sequence):
+        return [(fractions.Fraction(lo, 1 << k), fractions.Fraction(hi, 1 << k))
+                for lo, hi, k in _isolate_dyadic(sequence)]
+    return _isolate(sequence)
+
+
+def _isolate(sequence):
+    bound = root_bound(sequence[0])
+    intervals = []
+    stack = [(-bound, bound, sign_changes(sequence, -bound), sign_changes(sequence, bound))]
+    while stack:
+        lo, hi, changes_lo, changes_hi = stack.pop()
+        count = changes_lo - changes_hi
+        if count == 1:
+            intervals.append((lo, hi))
+        elif count > 1:
+            mid = _split(sequence, lo, hi)
+            changes_mid = sign_changes(sequence, mid)
+            stack.append((lo, mid, changes_lo, changes_mid))
+            stack.append((mid, hi, changes_mid, changes_hi))
+    return sorted(intervals)
+
+
+def _isolate_dyadic(sequence):
+    """
+    As _isolate, for integer sequences, with every end point a dyadic rational m / 2^k so that
+    signs are found in integer arithmetic.
+
+    Returns:
+        list[tuple]: (lo, hi, k) triples in increasing order, for intervals from lo / 2^k to hi / 2^k.
+    """
+    def changes(m, k):
+        return _count_changes([_sign(coeffs, m, 1 << k) for coeffs in sequence])
+
+    bound = _dyadic_bound(sequence[0])
+    intervals = []
+    stack = [(-bound, bound, 0, changes(-bound, 0), changes(bound, 0))]
+    while stack:
+        lo, hi, k, changes_lo, changes_hi = stack.pop()
+        count = changes_lo - changes_hi
+        if count == 1:
+            intervals.append((lo, hi, k))
+        elif count > 1:
+            # Halve the interval, or if its midpoint is a root, split it at the nearest point lo + (hi - lo) / 2^j
+            # that is not
+            j = 1
+            while _sign(sequence[0], (lo << j) + hi - lo, 1 << (k + j)) == 0:
+                j += 1
+            mid = (lo << j) + hi - lo
+            changes_mid = changes(mid, k + j)
+            stack.append((lo << j, mid, k + j, changes_lo, changes_mid))
+            stack.append((mid, hi << j, k + j, changes_mid, changes_hi))
+    return sorted(intervals, key=lambda i: fractions.Fraction(i[0], 1 << i[2]))
+
+
+def real_roots(coeffs, tol=1e-12):
+    """
+    Find distinct real roots of a polynomial. Roots are isolated with Sturm's theorem, then refined by bisection,
+    both exactly if all coefficients are rational, and in floating point otherwise. Unlike aberth, multiple roots
+    are found as accurately as simple ones.
+
+    Args:
+        coeffs (list): Coefficients of polynomial, indexed by degree. Must not be the zero polynomial.
+        tol (float): Width of interval around each root at which bisection stops.
+
+    Returns:
+        list[float]: Distinct real roots in increasing order.
+    """
+    sequence = sturm_sequence(coeffs)
+    if _is_exact(sequence):
+        return _refine_dyadic(sequence, tol)
+
+    # The last polynomial of the sequence is the gcd of p and p', so dividing by it leaves every root simple,
+    # and the sign of the quotient changes at each root
+    simple = polynomial._divmod(sequence[0], sequence[-1])[0] if len(sequence[-1]) > 1 else sequence[0]
+    scale = max(abs(c) for c in simple)
+    simple = [float(c / scale) for c in simple]
+
+    roots = []
+    for lo, hi in _isolate(sequence):
+        lo, hi = float(lo), float(hi)
+        negative_lo = _horner(simple, lo) < 0
+        while hi - lo > tol:
+            mid = (lo + hi) / 2
+            value = _horner(simple, mid)
+            if value == 0 or not lo < mid < hi:
+                lo = hi = mid
+            elif (value < 0) == negative_lo:
+                lo = mid
+            else:
+                hi = mid
+        roots.append((lo + hi) / 2)
+    return roots
+
+
+def _refine_dyadic(sequence, tol):
+    """
+    Bisect each interval from _isolate_dyadic in integer arithmetic, on the quotient of p by the gcd of p and p'
+    (the last polynomial of the sequence), in which every root is simple, so its sign changes at each root.
+
+    Returns:
+        list[float]: Midpoints of the final intervals, at most tol wide.
+    """
+    simple = sequence[0]
+    if len(sequence[-1]) > 1:
+        simple = _primitive(_pseudo_divmod(sequence[0], sequence[-1])[0])
+    roots = []
+    for lo, hi, k in _isolate_dyadic(sequence):
+        sign_lo = _sign(simple, lo, 1 << k)
+        while hi - lo > tol * (1 << k):
+            lo, hi, k = lo << 1, hi << 1, k + 1
+            mid = (lo + hi) // 2
+            sign = _sign(simple, mid, 1 << k)
+            if sign == 0:
+                lo = hi = mid
+            elif sign == sign_lo:
+                lo = mid
+            else:
+                hi = mid
+        roots.append(float(fractions.Fraction(lo + hi, 1 << (k + 1))))
+    return roots
+
+
+def _horner(coeffs, x):
+    value = coeffs[-1]
+    for c in coeffs[-2::-1]:
+        value = value*x + c
+    return value
@@ -0,0 +1,219 @@
+"""
+Truncated power series, for Taylor expansions of Functions.
+
+Author: Jack Romo <sharrackor@gmail.com>
+"""
+
+from __future__ import division
+import math
+import numbers
+import polynomial
+
+
+class PowerSeries(object):
+    """
+    Power series c[0] + c[1] t + ... + c[n] t^n, truncated after order n.
+    Evaluating f(a + t) gives the Taylor series of f about a, as every operation on series
+    keeps the terms of its result up to order n. Products, quotients and elementary functions
+    of series take O(n^2) time, however deep the derivatives involved.
+
+    Series count as Numbers, so they can be passed to any Function. Like dual.Dual,
+    they provide sin, cos, exp and log methods, which Functions call as math cannot handle them.
+
+    Notes:
+        Comparisons only look at the constant term, so that tests in Functions (eg. for division by zero)
+        behave as they would at the point of expansion.
+    """
+
+    def __init__(self, coeffs):
+        """
+        Args:
+            coeffs (list): Coefficients c, indexed by power of t. Their number fixes the order of the series.
+        """
+        if len(coeffs) == 0:
+            raise ValueError("Need at least one coefficient")
+        self.coeffs = list(coeffs)
+
+    @property
+    def order(self):
+        return len(self.coeffs) - 1
+
+    def __repr__(self):
+        return "PowerSeries({0!r})".format(self.coeffs)
+
+    def __eq__(self, other):
+        return self.coeffs[0] == _constant(other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(self.coeffs[0])
+
+    def __lt__(self, other):
+        return self.coeffs[0] < _constant(other)
+
+    def __le__(self, other):
+        return self.coeffs[0] <= _constant(other)
+
+    def __gt__(self, other):
+        return self.coeffs[0] > _constant(other)
+
+    def __ge__(self, other):
+        return self.coeffs[0] >= _constant(other)
+
+    def __neg__(self):
+        return PowerSeries([-c for c in self.coeffs])
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        return -self if self.coeffs[0] < 0 else self
+
+    def __add__(self, other):
+        if isinstance(other, PowerSeries):
+            return PowerSeries([a + b for a, b in zip(self.coeffs, other.coeffs)])
+        return PowerSeries([self.coeffs[0] + other] + self.coeffs[1:])
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if isinstance(other, PowerSeries):
+            return PowerSeries([a - b for a, b in zip(self.coeffs, other.coeffs)])
+        return PowerSeries([self.coeffs[0] - other] + self.coeffs[1:])
+
+    def __rsub__(self, other):
+        return -self + other
+
+    def __mul__(self, other):
+        if not isinstance(other, PowerSeries):
+            return PowerSeries([c*other for c in self.coeffs])
+        a, b = self.coeffs, other.coeffs
+        n = min(len(a), len(b))
+        return PowerSeries([sum(a[i]*b[k - i] for i in range(k + 1)) for k in range(n)])
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if not isinstance(other, PowerSeries):
+            return PowerSeries([c / other for c in self.coeffs])
+        a, b = self.coeffs, other.coeffs
+        if b[0] == 0:
+            raise ZeroDivisionError("Division by series with zero constant term")
+        # a = q b, so a[k] = sum(q[i] b[k - i]) for i <= k, solved for q[k]
+        q = []
+        for k in range(min(len(a), len(b))):
+            q.append((a[k] - sum(q[i]*b[k - i] for i in range(k))) / b[0])
+        return PowerSeries(q)
+
+    def __rtruediv__(self, other):
+        return PowerSeries([other] + [0]*self.order) / self
+
+    __div__ = __truediv__
+    __rdiv__ = __rtruediv__
+
+    def __pow__(self, other):
+        if isinstance(other, PowerSeries):
+            return (other * self.log()).exp()
+        elif ((isinstance(other, numbers.Integral) or (isinstance(other, float) and other.is_integer()))
+              and other >= 0):
+            return self._integer_power(int(other))    # Exact for exact coefficients, and allows a zero constant term
+        elif self.coeffs[0] == 0:
+            raise ValueError("Series with zero constant term can only be raised to non-negative integer powers")
+        # p = a^r satisfies a p' = r a' p, so k a[0] p[k] = sum((r j - (k - j)) a[j] p[k - j]) for 1 <= j <= k
+        a = self.coeffs
+        p = [a[0] ** other]
+        for k in range(1, len(a)):
+            p.append(sum((other*j - (k - j)) * a[j] * p[k - j] for j in range(1, k + 1)) / (k * a[0]))
+        return PowerSeries(p)
+
+    def __rpow__(self, other):
+        if other == math.e:
+            return self.exp()
+        return (self * math.log(other)).exp()
+
+    def _integer_power(self, n):
+        result = PowerSeries([1] + [0]*self.order)
+        base = self
+        while n:
+            if n & 1:
+                result = result * base
+            base = base * base
+            n >>= 1
+        return result
+
+    def sin(self):
+        return self._sin_cos()[0]
+
+    def cos(self):
+        return self._sin_cos()[1]
+
+    def _sin_cos(self):
+        # s' = c a' and c' = -s a', so k s[k] = sum(j a[j] c[k - j]) and k c[k] = -sum(j a[j] s[k - j])
+        a = self.coeffs
+        s, c = [math.sin(a[0])], [math.cos(a[0])]
+        for k in range(1, len(a)):
+            s.append(sum(j * a[j] * c[k - j] for j in range(1, k + 1)) / k)
+            c.append(-sum(j * a[j] * s[k - j] for j in range(1, k + 1)) / k)
+        return PowerSeries(s), PowerSeries(c)
+
+    def exp(self):
+        # e' = a' e, so k e[k] = sum(j a[j] e[k - j])
+        a = self.coeffs
+        e = [math.exp(a[0])]
+        for k in range(1, len(a)):
+            e.append(sum(j * a[j] * e[k - j] for j in range(1, k + 1)) / k)
+        return PowerSeries(e)
+
+    def log(self):
+        # a l' = a', so k a[0] l[k] = k a[k] - sum(j l[j] a[k - j]) for 1 <= j < k
+        a = self.coeffs
+        l = [math.log(a[0])]
+        for k in range(1, len(a)):
+            l.append((k * a[k] - sum(j * l[j] * a[k - j] for j in range(1, k))) / (k * a[0]))
+        return PowerSeries(l)
+
+
+numbers.Number.register(PowerSeries)
+
+
+def _constant(x):
+    return x.coeffs[0] if isinstance(x, PowerSeries) else x
+
+
+def taylor_coefficients(f, a, n):
+    """
+    Args:
+        f (Function): Function of one variable, n times differentiable at a.
+        a (number): Point to expand about.
+        n (int): Order of expansion, >= 0.
+
+    Returns:
+        list: Coefficients c of the Taylor polynomial sum(c[k] (x - a)^k) of f about a, up to order n.
+              c[k] is the kth derivative of f at a divided by k!.
+    """
+    value = f(PowerSeries([a, 1] + [0]*(n - 1)) if n > 0 else PowerSeries([a]))
+    if isinstance(value, PowerSeries):
+        return value.coeffs
+    return [value] + [0]*n      # Result independent of x, eg. a Constant
+
+
+def shift(coeffs, a):
+    """
+    Taylor shift: expand a polynomial in powers of (x - a) into powers of x, in O(n^2) time.
+    Exact for exact coefficients and a, but otherwise lossy: terms grow like a^k and cancel, so for large a
+    or high degree the result may lose all precision.
+
+    Args:
+        coeffs (list): Coefficients c of sum(c[k] (x - a)^k), indexed by k.
+        a (number): Shift.
+
+    Returns:
+        list: Coefficients of the same polynomial in powers of x, indexed by degree.
+    """
+    result = [coeffs[-1]]
+    for c in coeffs[-2::-1]:
+        # result = result * (x - a) + c, by Horner's scheme
+        result = [c - a*result[0]] + [result[i - 1] - a*result[i] for i in range(1, len(result))] + [result[-1]]
+    return polynomial._trim(result)
@@ -0,0 +1,292 @@
+"""
+Numeric solvers for zeros and fixed points of Functions.
+
+Author: Jack Romo <sharrackor@gmail.com>
+"""
+
+from __future__ import division
+import function
+
+
+EPSILON = 2.0 ** -52     # Spacing of floats near 1
+
+
+class ConvergenceError(ArithmeticError):
+    """
+    Raised when an iterative method fails to meet its tolerance within its iteration limit.
+    """
+
+
+def brent(f, a, b, xtol=1e-12, rtol=4*EPSILON, max_iter=100):
+    """
+    Find a zero of f in [a, b] by Brent's method, combining bisection with secant steps and
+    inverse quadratic interpolation. Always converges, as the zero stays bracketed.
+
+    Args:
+        f (Function, callable): Function of one variable.
+        a (number): One end of bracket.
+        b (number): Other end of bracket. f(a) and f(b) must have opposite signs.
+        xtol (float): Absolute tolerance on the zero.
+        rtol (float): Tolerance on the zero relative to its magnitude.
+        max_iter (int): Max number of evaluations of f after the first two.
+
+    Returns:
+        number: Point within xtol + rtol*|x| of a zero of f.
+
+    Raises:
+        ValueError: f(a) and f(b) have the same sign.
+        ConvergenceError: Tolerance not met within max_iter iterations.
+    """
+    fa, fb = f(a), f(b)
+    if fa == 0:
+        return a
+    elif fb == 0:
+        return b
+    elif (fa < 0) == (fb < 0):
+        raise ValueError("f(a) and f(b) must have opposite signs")
+    c, fc = b, fb
+    d = e = b - a
+    for _ in range(max_iter):
+        if (fb < 0) == (fc < 0):
+            c, fc = a, fa       # Zero lies between b and c
+            d = e = b - a
+        if abs(fc) < abs(fb):
+            a, b, c = b, c, b   # b is the best estimate
+            fa, fb, fc = fb, fc, fb
+        tol = 2*rtol*abs(b) + xtol/2
+        half = (c - b) / 2
+        if abs(half) <= tol or fb == 0:
+            return b
+        if abs(e) >= tol and abs(fa) > abs(fb):
+            s = fb / fa
+            if a == c:      # Secant step
+                p = 2*half*s
+                q = 1 - s
+            else:           # Inverse quadratic interpolation
+                q = fa / fc
+                r = fb / fc
+                p = s*(2*half*q*(q - r) - (b - a)*(r - 1))
+                q = (q - 1)*(r - 1)*(s - 1)
+            if p > 0:
+                q = -q
+            p = abs(p)
+            if 2*p < min(3*half*q - abs(tol*q), abs(e*q)):
+                e, d = d, p / q
+            else:
+                d = e = half    # Interpolation too slow or out of bracket, bisect instead
+        else:
+            d = e = half
+        a, fa = b, fb
+        b += d if abs(d) > tol else (tol if half > 0 else -tol)
+        fb = f(b)
+    raise ConvergenceError("Brent's method did not converge in {0} iterations".format(max_iter))
+
+
+def _derivatives(f, order, mode):
+    """
+    Returns:
+        callable: Function of x returning the list [f(x), f'(x), ..., f^(order)(x)].
+    """
+    if mode == "symbolic":
+        derivatives = [f] + [f.get_nth_derivative(n) for n in range(1, order + 1)]
+        return lambda x: [g(x) for g in derivatives]
+    elif mode == "ad":
+        # Forward-mode differentiation gives the last two; any below are differentiated symbolically
+        derivatives = [f] + [f.get_nth_derivative(n) for n in range(1, order)]
+        return lambda x: [g(x) for g in derivatives[:-1]] + list(derivatives[-1].value_and_derivative(x))
+    raise ValueError("Unknown mode: {0}".format(mode))
+
+
+def newton(f, x0, tol=1e-12, max_iter=50, mode="ad"):
+    """
+    Find a zero of f near x0 by Newton's method. Converges quadratically near simple zeros, but may diverge
+    from a poor starting point; see brent for a method which always converges.
+
+    Args:
+        f (Function): Function of one variable.
+        x0 (number): Starting point.
+        tol (float): Stop once a step is this small relative to the magnitude of x (or 1, if larger).
+        max_iter (int): Max number of steps.
+        mode (str): "ad" to find f' by forward-mode automatic differentiation, or "symbolic"
+                    to evaluate the derivative tree from get_derivative.
+
+    Returns:
+        number: Approximate zero of f.
+
+    Raises:
+        ConvergenceError: Tolerance not met within max_iter steps, or f' vanished.
+    """
+    derivatives = _derivatives(f, 1, mode)
+    x = x0
+    for _ in range(max_iter):
+        fx, dfx = derivatives(x)
+        if fx == 0:
+            return x
+        elif dfx == 0:
+            raise ConvergenceError("Derivative vanished at {0}".format(x))
+        step = fx / dfx
+        x -= step
+        if abs(step) <= tol*max(abs(x), 1):
+            return x
+    raise ConvergenceError("Newton's method did not converge in {0} iterations".format(max_iter))
+
+
+def halley(f, x0, tol=1e-12, max_iter=50, mode="ad"):
+    """
+    Find a zero of f near x0 by Halley's method, which also uses f'' and converges cubically near simple zeros.
+
+    Args:
+        f (Function): Function of one variable.
+        x0 (number): Starting point.
+        tol (float): Stop once a step is this small relative to the magnitude of x (or 1, if larger).
+        max_iter (int): Max number of steps.
+        mode (str): "ad" to find f'' by forward-mode automatic differentiation of f', or "symbolic"
+                    to evaluate the derivative trees of f' and f''.
+
+    Returns:
+        number: Approximate zero of f.
+
+    Raises:
+        ConvergenceError: Tolerance not met within max_iter steps, or the step was undefined.
+    """
+    derivatives = _derivatives(f, 2, mode)
+    x = x0
+    for _ in range(max_iter):
+        fx, dfx, ddfx = derivatives(x)
+        if fx == 0:
+            return x
+        denominator = 2*dfx*dfx - fx*ddfx
+        if denominator == 0:
+            raise ConvergenceError("Halley step undefined at {0}".format(x))
+        step = 2*fx*dfx / denominator
+        x -= step
+        if abs(step) <= tol*max(abs(x), 1):
+            return x
+    raise ConvergenceError("Halley's method did not converge in {0} iterations".format(max_iter))
+
+
+def fixed_point(f, x0, tol=1e-12, max_iter=100, accelerate=True):
+    """
+    Find a fixed point x = f(x) by iterating f from x0.
+
+    Args:
+        f (Function, callable): Function of one variable.
+        x0 (number): Starting point.
+        tol (float): Stop once successive estimates differ by this much relative to their magnitude (or 1).
+        max_iter (int): Max number of iterations.
+        accelerate (bool): Use Steffensen's method, applying Aitken's extrapolation to every two evaluations of f.
+                           Converges quadratically rather than linearly, but may fail where plain iteration
+                           converges slowly.
+
+    Returns:
+        number: Approximate fixed point of f.
+
+    Raises:
+        ConvergenceError: Tolerance not met within max_iter iterations.
+    """
+    x = x0
+    for _ in range(max_iter):
+        x1 = f(x)
+        if accelerate:
+            x2 = f(x1)
+            denominator = x2 - 2*x1 + x
+            new = x2 if denominator == 0 else x - (x1 - x)**2 / denominator
+        else:
+            new = x1
+        if abs(new - x) <= tol*max(abs(new), 1):
+            return new
+        x = new
+    raise ConvergenceError("Fixed point iteration did not converge in {0} iterations".format(max_iter))
+
+
+def newton_many(f, xs, tol=1e-12, max_iter=50):
+    """
+    Run Newton's method from many starting points at once. Each step evaluates f and its derivative tree
+    at every unconverged point together with evaluate_many, so uses NumPy if it is installed.
+
+    Args:
+        f (Function): Function of one variable.
+        xs (list): Starting points.
+        tol (float): Stop refining a point once its step is this small relative to its magnitude (or 1).
+        max_iter (int): Max number of steps.
+
+    Returns:
+        list[float]: Approximate zero reached from each starting point, or NaN for points that failed to converge,
+                     reached a vanishing derivative, or left the domain of f.
+    """
+    derivative = f.get_derivative()
+    xs = [float(x) for x in xs]
+    results = [float("nan")]*len(xs)
+    active = range(len(xs))
+    for _ in range(max_iter):
+        if not active:
+            break
+        points = [xs[i] for i in active]
+        values = _evaluate_all(f, points)
+        slopes = _evaluate_all(derivative, points)
+        unconverged = []
+        for i, x, fx, dfx in zip(active, points, values, slopes):
+            if fx != fx or dfx != dfx:
+                continue    # Undefined at x; leave the result as NaN
+            elif fx == 0:
+                results[i] = x
+            elif dfx != 0:
+                step = fx / dfx
+                xs[i] = x - step
+                if abs(step) <= tol*max(abs(xs[i]), 1):
+                    results[i] = xs[i]
+                else:
+                    unconverged.append(i)
+        active = unconverged
+    return results
+
+
+def _evaluate_all(f, points):
+    """
+    Returns:
+        list: Values of f at all points, evaluated at once, with NaN at points where f is undefined.
+    """
+    try:
+        return f.evaluate_many(points)
+    except (ArithmeticError, ValueError):
+        # Some point is outside the domain of f, eg. a division by zero; evaluate the others alone
+        return [_value_or_nan(f, x) for x in points]
+
+
+def _value_or_nan(f, x):
+    """
+    Returns:
+        number: f(x), or NaN if x is outside the domain of f.
+    """
+    try:
+        return f(x)
+    except (ArithmeticError, ValueError):
+        return float("nan")
+
+
+def brent_many(f, brackets, xtol=1e-12, rtol=4*EPSILON, max_iter=100):
+    """
+    Run Brent's method on many brackets. A Function is compiled once (see Function.compile) and reused for all.
+
+    Args:
+        f (Function, callable): Function of one variable.
+        brackets (list[tuple]): (a, b) pairs with f(a) and f(b) of opposite signs.
+        xtol (float): Absolute tolerance on each zero.
+        rtol (float): Tolerance on each zero relative to its magnitude.
+        max_iter (int): Max number of evaluations of f per bracket.
+
+    Returns:
+        list: Zero found in each bracket, or NaN for brackets where the tolerance was not met.
+
+    Raises:
+        ValueError: Some bracket does not have ends of opposite signs.
+    """
+    if isinstance(f, function.Function):
+        f = f.compile()
+    results = []
+    for a, b in brackets:
+        try:
+            results.append(brent(f, a, b, xtol, rtol, max_iter))
+        except ConvergenceError:
+            results.append(float("nan"))
+    return results
@@ -0,0 +1,89 @@
+"""
+Iterative traversal and evaluation of Function trees, for trees too deep to recurse through,
+eg. those built by composing or summing Functions in a loop.
+
+Author: Jack Romo <sharrackor@gmail.com>
+"""
+
+
+import function
+
+
+def postorder(f, pending):
+    """
+    Find the nodes of a tree that need some cached property computed, children before parents.
+    Uses an explicit stack rather than recursion.
+
+    Args:
+        f (Function): Root of tree.
+        pending (callable): Takes a node and returns True if it needs computing. Children of nodes
+                            which do not are skipped, as they are assumed to have been computed already.
+
+    Returns:
+        list[Function]: Pending nodes reachable from f, each once, every node after its children.
+    """
+    order = []
+    seen = set()
+    stack = [(f, False)]
+    while stack:
+        node, expanded = stack.pop()
+        if expanded:
+            order.append(node)
+        elif id(node) not in seen and pending(node):
+            seen.add(id(node))
+            stack.append((node, True))
+            stack.extend((c, False) for c in node._children())
+    return order
+
+
+def evaluate(f, x):
+    """
+    Evaluate a Function without recursion, so that trees of any depth can be evaluated.
+    Nodes are visited from an explicit stack, and each is computed at most once per input and combined
+    from the values of its children (see Function._combine), so DAGs with much sharing, such as derivatives
+    of deep compositions, take time linear in their number of distinct nodes. Slower than calling f for shallow trees.
+
+    Unlike dag.evaluate, values are remembered by the identity of their input rather than its value,
+    so inputs need not be hashable, and numbers comparing equal despite differing, eg. dual.Dual numbers
+    with the same real part, are never confused.
+
+    Args:
+        f (Function): Function to evaluate.
+        x (number, tuple): Input to f; a tuple of numbers for multivariate functions.
+
+    Returns:
+        number: f(x)
+    """
+    # (id of node, id of input) -> value of node at input. Every input is either x or a value kept here,
+    # so ids are never reused by other inputs while evaluating.
+    values = {}
+    stack = [(f, x)]
+    while stack:
+        node, y = stack[-1]
+        key = id(node), id(y)
+        if key in values:
+            stack.pop()
+            continue
+        if isinstance(node, function.FunctionCompNode):
+            inner = id(node.f2), id(y)
+            if inner not in values:
+                stack.append((node.f2, y))
+                continue
+            z = values[inner]
+            outer = id(node.f1), id(z)
+            if outer not in values:
+                stack.append((node.f1, z))
+                continue
+            values[key] = values[outer]
+        else:
+            children = node._children()
+            pending = [(c, y) for c in children if (id(c), id(y)) not in values]
+            if pending:
+                stack.extend(pending)
+                continue
+            if children:
+                values[key] = node._combine(y, [values[id(c), id(y)] for c in children])
+            else:
+                values[key] = node._evaluate(y)
+        stack.pop()
+    return values[id(f), id(x)]
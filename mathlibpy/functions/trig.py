@@ -5,6 +5,7 @@ Author: Jack Romo <sharrackor@gmail.com>
 """
 
 
+import batch
 import function
 import math
 
@@ -16,11 +17,20 @@ class Sin(function.Function):
 
     def _evaluate(self, x):
         # TODO: implement this as Maclaurin series
-        return math.sin(x)
+        try:
+            return math.sin(x)
+        except TypeError:
+            return x.sin()     # Number type math cannot handle, eg. dual.Dual
 
-    def get_derivative(self):
+    def _evaluate_many(self, xs):
+        return batch.sin(xs)
+
+    def _derivative(self):
         return Cos()
 
+    def _compile(self, compiler, arg):
+        return compiler.emit("math.sin({0})".format(arg))
+
     def __eq__(self, other):
         return isinstance(other, Sin)
 
@@ -32,11 +42,20 @@ class Cos(function.Function):
 
     def _evaluate(self, x):
         # TODO: implement this as Maclaurin series
-        return math.cos(x)
+        try:
+            return math.cos(x)
+        except TypeError:
+            return x.cos()     # Number type math cannot handle, eg. dual.Dual
 
-    def get_derivative(self):
+    def _evaluate_many(self, xs):
+        return batch.cos(xs)
+
+    def _derivative(self):
         return function.Constant(-1) * Sin()
 
+    def _compile(self, compiler, arg):
+        return compiler.emit("math.cos({0})".format(arg))
+
     def __eq__(self, other):
         return isinstance(other, Cos)
 
@@ -47,14 +66,29 @@ class Tan(function.Function):
     """
 
     def _evaluate(self, x):
-        sin = Sin()
-        cos = Cos()
-        if cos(x) == 0:
+        try:
+            cos = math.cos(x)
+            sin = math.sin(x)
+        except TypeError:
+            cos = x.cos()      # Number type math cannot handle, eg. dual.Dual
+            sin = x.sin()
+        if cos == 0:
             raise ZeroDivisionError()
-        return sin(x) / cos(x)
+        return sin / cos
 
-    def get_derivative(self):
+    def _evaluate_many(self, xs):
+        cos = batch.cos(xs)
+        if batch.any_zero(cos):
+            raise ZeroDivisionError()
+        return batch.div(batch.sin(xs), cos)
+
+    def _derivative(self):
         return function.Constant(1) / (Cos() * Cos())
 
+    def _compile(self, compiler, arg):
+        cos = compiler.emit("math.cos({0})".format(arg))
+        compiler.emit_statement("if {0} == 0: raise ZeroDivisionError()".format(cos))
+        return compiler.emit("math.sin({0}) / {1}".format(arg, cos))
+
     def __eq__(self, other):
         return isinstance(other, Tan)
@@ -1 +1 @@
-from matrix import Matrix
+from matrix import Matrix, KroneckerProduct
@@ -6,6 +6,7 @@ Author: Jack Romo <sharrackor@gmail.com>
 
 from __future__ import division  # make division floating-point
 import copy
+import numbers
 
 
 class Matrix(object):
@@ -102,6 +103,89 @@ class Matrix(object):
         """
         return Matrix([[1 if r == c else 0 for c in range(cols)] for r in range(cols)])
 
+    @staticmethod
+    def block_diagonal(*blocks):
+        """
+        Create a block diagonal matrix from a sequence of matrices, with zeros everywhere off the blocks.
+
+        Args:
+            *blocks (Matrix): Matrices placed along the main diagonal, from top-left to bottom-right.
+
+        Returns:
+            Matrix: Block diagonal matrix of size (sum of block rows) * (sum of block columns).
+        """
+        if len(blocks) == 0:
+            raise ValueError("Must provide at least one block")
+        elif not all(isinstance(b, Matrix) for b in blocks):
+            raise TypeError("All blocks must be matrices")
+        total_cols = sum(b.cols for b in blocks)
+        result = []
+        col_offset = 0
+        for b in blocks:
+            for row in b._body:
+                result.append([0]*col_offset + list(row) + [0]*(total_cols - col_offset - b.cols))
+            col_offset += b.cols
+        return Matrix(result)
+
+    @staticmethod
+    def from_blocks(grid):
+        """
+        Assemble a matrix from a grid of matrix blocks.
+
+        Args:
+            grid (list[list[Matrix]]): Rows of blocks. Blocks in the same grid row must have the same number
+                                       of rows, and blocks in the same grid column the same number of columns.
+
+        Returns:
+            Matrix: The assembled matrix.
+        """
+        if not isinstance(grid, list) or len(grid) == 0 or not all(isinstance(r, list) and r for r in grid):
+            raise TypeError("grid must be a non-empty list of non-empty lists of matrices")
+        elif not all(isinstance(b, Matrix) for r in grid for b in r):
+            raise TypeError("All blocks must be matrices")
+        elif any(len(r) != len(grid[0]) for r in grid):
+            raise ValueError("All grid rows must contain the same number of blocks")
+        col_widths = [b.cols for b in grid[0]]
+        result = []
+        for grid_row in grid:
+            height = grid_row[0].rows
+            if any(b.rows != height for b in grid_row):
+                raise ValueError("Blocks in the same grid row must have the same number of rows")
+            elif [b.cols for b in grid_row] != col_widths:
+                raise ValueError("Blocks in the same grid column must have the same number of columns")
+            for r in range(height):
+                result.append([v for b in grid_row for v in b._body[r]])
+        return Matrix(result)
+
+    def hadamard(self, other):
+        """
+        Elementwise (Hadamard) product of two matrices of the same dimensions.
+
+        Args:
+            other (Matrix): Matrix to multiply elementwise with self.
+
+        Returns:
+            Matrix: Matrix whose entries are the products of the corresponding entries of self and other.
+        """
+        if not isinstance(other, Matrix):
+            raise TypeError("Can only take Hadamard product with another matrix")
+        elif self.rows != other.rows or self.cols != other.cols:
+            raise ValueError("Matrices do not have same dimensions")
+        return Matrix([[a*b for a, b in zip(row1, row2)] for row1, row2 in zip(self._body, other._body)])
+
+    def kronecker(self, other):
+        """
+        Kronecker product of self and another matrix.
+        The product is not expanded; see KroneckerProduct.
+
+        Args:
+            other (Matrix): Right-hand factor of the product.
+
+        Returns:
+            KroneckerProduct: Lazy representation of self (x) other.
+        """
+        return KroneckerProduct(self, other)
+
     def _mul_scalar(self, other):
         return Matrix([[self[x, y]*other for x in range(self.cols)] for y in range(self.rows)])
 
@@ -244,3 +328,97 @@ class Matrix(object):
         for row in range(result.rows):
             result._body[row] = rref_temp_self._body[row][self.rows:]
         return result
+
+
+class KroneckerProduct(object):
+    """
+    Lazy Kronecker product A (x) B of two matrices.
+    The (m*p)*(n*q) product is never stored; entries and products are computed from the factors.
+    """
+
+    def __init__(self, a, b):
+        """
+        Args:
+            a (Matrix): Left factor, of size m*n.
+            b (Matrix): Right factor, of size p*q.
+        """
+        if not (isinstance(a, Matrix) and isinstance(b, Matrix)):
+            raise TypeError("Both factors must be matrices")
+        self.a = a
+        self.b = b
+
+    @property
+    def rows(self):
+        return self.a.rows * self.b.rows
+
+    @property
+    def cols(self):
+        return self.a.cols * self.b.cols
+
+    def __getitem__(self, key):
+        """
+        Index product as prod[x, y], as with Matrix.
+
+        Args:
+            key (tuple(int, int)): Pair of x-y coordinates in product; x is column, y is row. 0-indexed.
+        """
+        x, y = key
+        return self.a[x // self.b.cols, y // self.b.rows] * self.b[x % self.b.cols, y % self.b.rows]
+
+    def __str__(self):
+        return str(self.to_matrix())
+
+    def __eq__(self, other):
+        if isinstance(other, KroneckerProduct):
+            return (self.a == other.a) and (self.b == other.b)
+        elif isinstance(other, Matrix):
+            return self.to_matrix() == other
+        return False
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __mul__(self, other):
+        """
+        Can multiply with scalar, Matrix or another KroneckerProduct.
+
+        Notes:
+            Multiplying with a Matrix uses (A (x) B) vec(X) = vec(A X B^T), where vec stacks the rows of X.
+            Each column of other is reshaped into X, so the product costs O(mnq + mpq) per column
+            instead of O(mnpq).
+            Multiplying with a KroneckerProduct uses (A (x) B)(C (x) D) = (AC) (x) (BD) and stays lazy.
+        """
+        if isinstance(other, KroneckerProduct):
+            return KroneckerProduct(self.a * other.a, self.b * other.b)
+        elif isinstance(other, Matrix):
+            return self._mul_matrix(other)
+        elif isinstance(other, numbers.Number):
+            return KroneckerProduct(self.a._mul_scalar(other), self.b)
+        else:
+            raise TypeError("Can only multiply Kronecker product with scalar, matrix or Kronecker product")
+
+    def _mul_matrix(self, other):
+        if self.cols != other.rows:
+            raise ValueError("Kronecker product must have same number of columns as rows of matrix")
+        a = self.a._body
+        b = self.b._body
+        n, p, q = self.a.cols, self.b.rows, self.b.cols
+        result = [[0]*other.cols for _ in range(self.rows)]
+        for c in range(other.cols):
+            # Reshape column c into the n*q matrix X, row by row
+            x = [[other._body[i*q + j][c] for j in range(q)] for i in range(n)]
+            # X B^T is n*p
+            xbt = [[sum(x_row[j]*b_row[j] for j in range(q)) for b_row in b] for x_row in x]
+            # A (X B^T) is m*p, and its rows stacked are the result column
+            for i, a_row in enumerate(a):
+                for k in range(p):
+                    result[i*p + k][c] = sum(a_row[j]*xbt[j][k] for j in range(n))
+        return Matrix(result)
+
+    def to_matrix(self):
+        """
+        Returns:
+            Matrix: Dense expansion of the product.
+        """
+        return Matrix([[a_val*b_val for a_val in a_row for b_val in b_row]
+                       for a_row in self.a._body for b_row in self.b._body])
@@ -0,0 +1,19 @@
+from mathlibpy.functions import *
+
+
+def sample_functions():
+    """
+    Returns:
+        list[Function]: New instances of one Function of each kind and of each combination, all defined on (0, 3].
+    """
+    return [
+        Constant(3),
+        Polynomial([2, 3, 4]),
+        Sin(), Cos(), Tan(), Exp(), Log(),
+        Power(Polynomial([0, 1]), Constant(2)),
+        Power(Constant(2), Polynomial([0, 1])),
+        Power(Polynomial([1, 1]), Sin()),
+        LogBase(2), LogBase(Polynomial([0, 0, 1])),
+        Sin() + Cos(), Sin() - Exp(), Sin() * Polynomial([1, 1]), Exp() / Polynomial([1, 1]),
+        Sin()(Polynomial([1, 2, 3])),
+    ]
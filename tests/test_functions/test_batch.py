@@ -0,0 +1,47 @@
+from mathlibpy.functions import *
+from mathlibpy.functions import batch
+from tests.test_functions.samples import sample_functions
+import array
+import unittest
+
+
+class EvaluateManyTester(unittest.TestCase):
+
+    def setUp(self):
+        self.xs = [0.5, 1.5, 2.5, 3.0]
+        self.funcs = sample_functions()
+
+    def assertMatches(self, f, xs, results):
+        self.assertEqual(len(results), len(xs))
+        for x, y in zip(xs, results):
+            self.assertAlmostEqual(y, f(x), places=10)
+
+    def test_sequence(self):
+        for f in self.funcs:
+            self.assertMatches(f, self.xs, f.evaluate_many(self.xs))
+
+    def test_array(self):
+        xs = array.array("d", self.xs)
+        for f in self.funcs:
+            self.assertMatches(f, self.xs, f.evaluate_many(xs))
+
+    def test_empty(self):
+        self.assertEqual(len(Sin().evaluate_many([])), 0)
+
+    def test_div_zero(self):
+        self.assertRaises(Exception, (Constant(1) / Polynomial([-1, 1])).evaluate_many, [0, 1, 2])
+
+    def test_log_domain(self):
+        self.assertRaises(ValueError, Log().evaluate_many, [1, 0])
+
+    @unittest.skipIf(batch.numpy is None, "NumPy not installed")
+    def test_numpy(self):
+        xs = batch.numpy.array(self.xs)
+        for f in self.funcs:
+            results = f.evaluate_many(xs)
+            self.assertTrue(isinstance(results, batch.numpy.ndarray))
+            self.assertMatches(f, self.xs, results)
+
+
+if __name__ == "__main__":
+    unittest.main()
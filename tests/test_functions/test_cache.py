@@ -0,0 +1,183 @@
+from mathlibpy.functions import *
+from mathlibpy.functions import optimize
+from fractions import Fraction
+import unittest
+
+
+class Counted(Function):
+    """
+    Identity counting its evaluations, and those of all its copies.
+    """
+
+    total = 0
+
+    def __init__(self):
+        self._count = 0     # Private, as reassigning a public attribute counts as mutating the Function
+
+    @property
+    def count(self):
+        return self._count
+
+    def _evaluate(self, x):
+        self._count += 1
+        Counted.total += 1
+        return x
+
+    def _derivative(self):
+        return Constant(1)
+
+    def __eq__(self, other):
+        return self is other
+
+    __hash__ = Function.__hash__
+
+
+class CachedFunctionTester(unittest.TestCase):
+
+    def setUp(self):
+        self.inner = Counted()
+        self.f = Sin()(self.inner) + Polynomial([1, 2])(self.inner)
+
+    def test_values(self):
+        g = self.f.cached()
+        for x in [0.5, 2, Fraction(1, 3)]:
+            self.assertEqual(g(x), self.f(x))
+            self.assertEqual(g(x), self.f(x))
+        self.assertEqual(g, CachedFunction(self.f))
+        self.assertNotEqual(g, self.f)
+        self.assertEqual(hash(g), hash(CachedFunction(self.f)))
+        h = (Variable(0) * Variable(1)).cached()
+        self.assertEqual(h((2, 3)), 6)
+        self.assertEqual(h((2, 3)), 6)
+        self.assertEqual(h.cache_info().hits, 1)
+
+    def test_statistics(self):
+        g = self.f.cached()
+        for x in [0.5, 1.5, 0.5, 0.5]:
+            g(x)
+        self.assertEqual(self.inner.count, 4)     # Two evaluations of f, each evaluating inner twice
+        info = g.cache_info()
+        self.assertEqual((info.hits, info.misses, info.size, info.maxsize), (2, 2, 2, 1024))
+        self.assertTrue(info.bytes > 0)
+        g.cache_clear()
+        self.assertEqual(g.cache_info(), (0, 0, 0, 1024, 0, None))
+
+    def test_types_distinguished(self):
+        g = Polynomial([0, 1]).cached()
+        self.assertTrue(isinstance(g(1), int))
+        self.assertTrue(isinstance(g(1.0), float))
+        self.assertEqual(g.cache_info().size, 2)
+
+    def test_uncached_inputs(self):
+        g = self.f.cached()
+        g(float("nan"))
+        g(Interval(0, 1))
+        self.assertEqual(g.cache_info().size, 0)
+        self.assertEqual(g.cache_info().misses, 0)
+        self.assertTrue(isinstance(Sin().cached()(Exp()), Function))
+
+    def test_lru(self):
+        g = self.f.cached(maxsize=2)
+        for x in [1, 2, 1, 3]:
+            g(x)
+        count = self.inner.count
+        g(1)
+        self.assertEqual(self.inner.count, count)     # 1 was used more recently than 2
+        g(2)
+        self.assertEqual(self.inner.count, count + 2)
+        self.assertEqual(g.cache_info().size, 2)
+        g = self.f.cached(maxsize=0)
+        g(1)
+        self.assertEqual(g.cache_info().size, 0)
+
+    def test_maxbytes(self):
+        g = self.f.cached(maxsize=None, maxbytes=200)
+        for i in range(100):
+            g(float(i))
+        info = g.cache_info()
+        self.assertTrue(0 < info.bytes <= 200)
+        self.assertTrue(0 < info.size < 100)
+        g = self.f.cached(maxbytes=10)
+        g(1.0)
+        self.assertEqual(g.cache_info().size, 0)
+
+    def test_per_node(self):
+        g = self.f.cached(per_node=True)
+        total = Counted.total
+        value = g(0.5)
+        self.assertEqual(Counted.total - total, 1)    # Shared by both terms, so evaluated once
+        self.assertEqual(value, self.f(0.5))
+
+    def test_evaluate_many(self):
+        g = self.f.cached()
+        values = g.evaluate_many([0.5, 1.5, 0.5])
+        self.assertEqual(self.inner.count, 4)     # Two points, each evaluating inner twice; repeat not evaluated
+        self.assertEqual(list(values), list(self.f.evaluate_many([0.5, 1.5, 0.5])))
+        count = self.inner.count
+        self.assertEqual(g(0.5), values[0])
+        self.assertEqual(list(g.evaluate_many([1.5, 2.5]))[0], values[1])
+        self.assertEqual(self.inner.count - count, 2)
+        info = g.cache_info()
+        self.assertEqual((info.hits, info.misses, info.size), (3, 3, 3))
+        g.evaluate_many([float("nan")])
+        self.assertEqual(g.cache_info().size, 3)
+
+    def test_minimize(self):
+        g = (Polynomial([0, 0, 1]) - Constant(2) * Cos()).cached()
+        x, _ = g.minimize(-1, 2)
+        self.assertAlmostEqual(x, 0, places=4)
+        misses = g.cache_info().misses
+        self.assertTrue(misses > 0)
+        self.assertEqual(g.minimize(-1, 2)[0], x)
+        self.assertEqual(g.cache_info().misses, misses)     # Every point evaluated again was cached
+        self.assertTrue(g.cache_info().hits >= misses)
+
+    def test_repr(self):
+        g = Polynomial([1, 2]).cached(maxsize=8)
+        self.assertEqual(repr(g), "CachedFunction({0!r}, maxsize=8, maxbytes=None, per_node=False)".format(g.f))
+        self.assertEqual(str(g), str(Polynomial([1, 2])))
+
+    def test_mutation(self):
+        p = Polynomial([1, 2])
+        g = p.cached()
+        self.assertEqual(g(2), 5)
+        p[0] = 3
+        self.assertEqual(g(2), 7)
+        self.assertEqual(list(g.evaluate_many([2.0])), [7])
+        g.f = Polynomial([0, 0, 1])
+        self.assertEqual(g.cache_info().size, 0)
+        self.assertEqual(g(2), 4)
+        h = Sin()(p).cached(per_node=True)
+        self.assertEqual(h(0.5), Sin()(p)(0.5))
+        p[1] = 5
+        self.assertEqual(h(0.5), Sin()(p)(0.5))
+        self.assertEqual(h.cache_info().misses, 2)
+
+    def test_errors_not_cached(self):
+        g = (Constant(1) / Polynomial([0, 1])).cached()
+        self.assertRaises(Exception, g, 0)
+        self.assertEqual(g.cache_info().size, 0)
+
+    def test_invalid(self):
+        self.assertRaises(TypeError, CachedFunction, 2)
+        self.assertRaises(ValueError, Sin().cached, -1)
+        self.assertRaises(TypeError, Sin().cached, 2.5)
+
+    def test_function_protocol(self):
+        g = self.f.cached()
+        self.assertEqual(g.get_derivative(), self.f.get_derivative())
+        self.assertEqual(g.evaluate_iterative(0.5), self.f(0.5))
+        self.assertEqual(g.evaluate_shared(0.5), self.f(0.5))
+        self.assertEqual(list(g.evaluate_many([0.5, 1.5])), list(self.f.evaluate_many([0.5, 1.5])))
+        self.assertEqual(g.compile()(0.5), self.f(0.5))
+
+    def test_optimizer(self):
+        g = (Polynomial([0, 0, 1]) - Constant(2) * Cos()).cached()
+        optimize.brent(g, -1, 2)
+        x, _ = optimize.brent(g, -1, 2)
+        self.assertAlmostEqual(x, 0, places=7)
+        self.assertEqual(g.cache_info().hits, g.cache_info().misses)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+from mathlibpy.functions import *
+from tests.test_functions.samples import sample_functions
+import unittest
+
+
+class Square(Function):
+    """
+    Function without its own _compile, to test the fallback.
+    """
+
+    def _evaluate(self, x):
+        return x * x
+
+    def get_derivative(self):
+        return Polynomial([0, 2])
+
+    def __eq__(self, other):
+        return isinstance(other, Square)
+
+
+class CompileTester(unittest.TestCase):
+
+    def setUp(self):
+        self.funcs = sample_functions() + [Square() + Sin()]
+
+    def test_call(self):
+        for f in self.funcs:
+            g = f.compile()
+            for x in [0.5, 1.5, 2.5]:
+                self.assertEqual(round(g(x), 10), round(f(x), 10))
+
+    def test_div_zero(self):
+        self.assertRaises(Exception, (Constant(3) / Constant(0)).compile(), 1)
+
+    def test_shared_node_emitted_once(self):
+        s = Sin()
+        g = (s * s).compile()
+        self.assertEqual(g.source.count("math.sin"), 1)
+        self.assertEqual(g(1.5), Sin()(1.5) ** 2)
+
+    def test_high_degree_polynomial(self):
+        p = Polynomial([(-1) ** i for i in range(500)])
+        self.assertAlmostEqual(p.compile()(0.5), p(0.5), places=12)
+
+    def test_compose_constant(self):
+        self.assertEqual(Exp()(Constant(-2)).compile()(5), Exp()(-2))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+from mathlibpy.functions import *
+from mathlibpy.functions import dag
+import unittest
+
+
+class CountingSin(Sin):
+    """
+    Sine that counts its evaluations.
+    """
+
+    calls = 0
+
+    def _evaluate(self, x):
+        CountingSin.calls += 1
+        return Sin._evaluate(self, x)
+
+
+def distinct_nodes(f):
+    seen = {}
+    stack = [f]
+    while stack:
+        node = stack.pop()
+        if id(node) not in seen:
+            seen[id(node)] = node
+            stack.extend(node._children())
+    return len(seen)
+
+
+class InternTableTester(unittest.TestCase):
+
+    def setUp(self):
+        self.table = dag.InternTable()
+
+    def test_identical_leaves_shared(self):
+        self.assertTrue(self.table.intern(Sin()) is self.table.intern(Sin()))
+        self.assertTrue(self.table.intern(Constant(2)) is self.table.intern(Constant(2)))
+        self.assertFalse(self.table.intern(Constant(2)) is self.table.intern(Constant(3)))
+        self.assertFalse(self.table.intern(LogBase(2)) is self.table.intern(LogBase(3)))
+
+    def test_parameter_types_distinguished(self):
+        self.assertFalse(self.table.intern(Constant(1)) is self.table.intern(Constant(1.0)))
+        self.assertFalse(self.table.intern(Polynomial([1, 2])) is self.table.intern(Polynomial([1.0, 2])))
+        self.assertTrue(isinstance(self.table.intern(Constant(1.0))(0), float))
+
+    def test_table_isolated_from_mutation(self):
+        q = Polynomial([1, 2])
+        shared = self.table.intern(q + Sin())
+        self.assertFalse(shared.f1 is q)
+        q[0] = 7
+        self.assertEqual(self.table.intern(Polynomial([1, 2])).coeffs, [1, 2])
+        self.assertEqual(shared(0), 1)
+
+    def test_identical_subtrees_shared(self):
+        f = self.table.intern((Sin() * Cos()) + (Sin() * Cos()))
+        self.assertTrue(f.f1 is f.f2)
+        self.assertEqual(distinct_nodes(f), 4)
+
+    def test_structure_preserved(self):
+        f = Power(Polynomial([1, 2]), Sin()) / LogBase(Polynomial([0, 0, 1]))
+        shared = self.table.intern(f)
+        self.assertEqual(shared, f)
+        self.assertEqual(shared(1.5), f(1.5))
+
+    def test_quotient_rule(self):
+        f = (Sin() / Cos()).get_derivative()
+        self.assertLess(distinct_nodes(self.table.intern(f)), distinct_nodes(f))
+
+
+class EvaluateSharedTester(unittest.TestCase):
+
+    def test_call(self):
+        funcs = [
+            Sin() * Polynomial([1, 2]) + Exp()(Cos()),
+            (Sin() / Cos()).get_derivative(),
+            Power(Polynomial([1, 1]), Constant(2)) - LogBase(2),
+            LogBase(Polynomial([0, 0, 1])),
+            Tan()(Sin()(Polynomial([0, 2]))),
+        ]
+        for f in funcs:
+            self.assertEqual(f.evaluate_shared(0.7), f(0.7))
+            self.assertEqual(f.share().evaluate_shared(0.7), f(0.7))
+
+    def test_shared_node_evaluated_once(self):
+        s = CountingSin()
+        f = (s * s + s)(Polynomial([0, 2])) + s(Polynomial([0, 2]))
+        expected = f(0.3)
+        CountingSin.calls = 0
+        self.assertEqual(f.evaluate_shared(0.3), expected)
+        self.assertEqual(CountingSin.calls, 1)
+
+    def test_div_zero(self):
+        self.assertRaises(Exception, (Constant(1) / Polynomial([0, 1])).evaluate_shared, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+from mathlibpy.functions import *
+from mathlibpy.functions.dual import Dual
+from tests.test_functions.samples import sample_functions
+import math
+import unittest
+
+
+class DualTester(unittest.TestCase):
+
+    def setUp(self):
+        self.a = Dual(2, 1)
+        self.b = Dual(3, -2)
+
+    def test_arithmetic(self):
+        self.assertEqual((self.a + self.b).dual, -1)
+        self.assertEqual((self.a - 1).real, 1)
+        self.assertEqual((1 - self.a).dual, -1)
+        self.assertEqual((self.a * self.b).dual, 3*1 + 2*(-2))
+        self.assertEqual((self.a / self.b).dual, (1*3 - 2*(-2)) / 9.0)
+        self.assertEqual((1 / self.a).dual, -0.25)
+        self.assertEqual((self.a ** 3).dual, 12)
+        self.assertEqual((2 ** self.a).dual, 4 * math.log(2))
+
+    def test_comparison(self):
+        self.assertEqual(Dual(0, 5), 0)
+        self.assertLess(self.a, self.b)
+        self.assertGreater(self.a, 1)
+
+    def test_elementary(self):
+        self.assertEqual(self.a.sin().dual, math.cos(2))
+        self.assertEqual(self.a.cos().dual, -math.sin(2))
+        self.assertEqual(self.a.log().dual, 0.5)
+        self.assertEqual(self.a.exp().dual, math.exp(2))
+
+
+class ValueAndDerivativeTester(unittest.TestCase):
+
+    def test_matches_get_derivative(self):
+        for f in sample_functions():
+            for x in [0.5, 1.5, 2.5]:
+                value, derivative = f.value_and_derivative(x)
+                self.assertAlmostEqual(value, f(x), places=10)
+                self.assertAlmostEqual(derivative, f.get_derivative()(x), places=8)
+
+    def test_constant(self):
+        self.assertEqual(Constant(4).value_and_derivative(1), (4, 0))
+
+    def test_div_zero(self):
+        self.assertRaises(Exception, (Constant(1) / Polynomial([0, 1])).value_and_derivative, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
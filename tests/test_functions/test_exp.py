@@ -58,6 +58,45 @@ class PowerTester(unittest.TestCase):
         self.assertEqual(self.pow2.get_derivative()(3), 6)
         self.assertEqual(round(self.pow3.get_derivative()(3), 10), round(math.log(2)*8, 10))
 
+    def test_integer_exponent(self):
+        self.assertEqual(self.pow2(-3), 9)      # Applied by **, so negative bases are allowed
+        self.assertEqual(self.pow2.get_derivative()(0), 0)
+        self.assertEqual(Power(Polynomial([0, 1]), Constant(-1))(4), 0.25)
+        self.assertEqual(Power(Sin(), 3.0).value_and_derivative(1), (math.sin(1) ** 3, 3 * math.sin(1) ** 2 * math.cos(1)))
+
+    def test_general_exponent(self):
+        root = Power(Polynomial([0, 1]), Constant(0.5))
+        self.assertAlmostEqual(root(4), 2)
+        self.assertAlmostEqual(root.get_derivative()(4), 0.25)
+        self.assertRaises(ValueError, root, -4)
+
+    def test_fast_paths_agree(self):
+        xs = [0.5, 1.5, 2.5]
+        for f in [self.pow2, self.pow3, Power(Polynomial([0, 1]), Sin())]:
+            compiled = f.compile()
+            for x, y in zip(xs, f.evaluate_many(xs)):
+                self.assertAlmostEqual(f(x), y)
+                self.assertAlmostEqual(f(x), compiled(x))
+                self.assertAlmostEqual(f(x), f.evaluate_shared(x))
+
+    def test_compile_negative_base(self):
+        f = Power(Constant(-2), Constant(2))
+        self.assertEqual(f.compile()(1), f(1))
+        self.assertEqual(f.compile()(1), 4)
+
+    def test_set_base_and_exponent(self):
+        f = Power(Polynomial([0, 1]), Constant(2))
+        self.assertEqual(f(3), 9)
+        f.f2 = Constant(0.5)
+        self.assertAlmostEqual(f(4), 2)
+        self.assertAlmostEqual(f.get_derivative()(4), 0.25)
+        f.f1 = 9
+        self.assertAlmostEqual(f(4), 3)
+        f.f2 = Polynomial([0, 1])
+        self.assertAlmostEqual(f(2), 81)
+        self.assertAlmostEqual(f.compile()(2), 81)
+        self.assertAlmostEqual(f.get_derivative()(2), 81*math.log(9))
+
 
 class LogBaseTester(unittest.TestCase):
 
@@ -82,6 +121,29 @@ class LogBaseTester(unittest.TestCase):
         self.assertEqual(round(self.ln.get_derivative()(math.e), 10), round((1 / math.e), 10))
         self.assertEqual(round(self.log_x_squared.get_derivative()(3), 10), 0)
 
+    def test_set_base(self):
+        log = LogBase(2)
+        self.assertEqual(log(8), 3)
+        log.b = 10
+        self.assertAlmostEqual(log(1000), 3)
+        self.assertEqual(log, LogBase(10))
+        log.b = Polynomial([0, 0, 1])
+        self.assertEqual(log(2), 0.5)
+        self.assertRaises(TypeError, LogBase, "2")
+
+    def test_nonpositive_base(self):
+        for b in [0, -2]:
+            log = LogBase(b)        # Only fails once evaluated, as the log of b is undefined
+            derivative = log.get_derivative()
+            self.assertRaises(ValueError, log, 2)
+            self.assertRaises(ValueError, log.compile(), 2)
+            self.assertRaises(ValueError, derivative, 2)
+        f = LogBase(-2) + Sin()
+        self.assertEqual(f, LogBase(-2) + Sin())
+        log = LogBase(-2)
+        log.b = 4
+        self.assertEqual(log(2), 0.5)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,4 +1,5 @@
 from mathlibpy.functions import *
+import math
 import unittest
 
 
@@ -8,6 +9,113 @@ class FunctionTester(unittest.TestCase):
         self.assertRaises(Exception, Function.__init__)
 
 
+class FunctionHashTester(unittest.TestCase):
+
+    def setUp(self):
+        self.f = Sin() * Polynomial([1, 2]) + Power(Exp(), Constant(2)) / LogBase(3)
+        self.g = Sin() * Polynomial([1, 2]) + Power(Exp(), Constant(2)) / LogBase(3)
+
+    def test_equal_hash(self):
+        self.assertEqual(hash(self.f), hash(self.g))
+        self.assertEqual(hash(Constant(1)), hash(Constant(1.0)))
+        self.assertEqual(hash(LogBase(Polynomial([0, 1]))), hash(LogBase(Polynomial([0, 1]))))
+
+    def test_dict_key(self):
+        cache = {self.f: 1}
+        self.assertEqual(cache[self.g], 1)
+        self.assertEqual(len(set([Sin(), Sin(), Cos()])), 2)
+
+    def test_different_operators(self):
+        self.assertNotEqual(FunctionAddNode(Sin(), Cos()), FunctionMulNode(Sin(), Cos()))
+        self.assertNotEqual(self.f, self.f.get_derivative())
+
+    def test_mutation_rehashes(self):
+        p = Polynomial([1, 2])
+        h = hash(p)
+        p[1] = 3
+        self.assertNotEqual(hash(p), h)
+        self.assertEqual(hash(p), hash(Polynomial([1, 3])))
+
+    def test_mutation_rehashes_containing(self):
+        p = Polynomial([1, 2])
+        f = Sin() * p
+        hash(f)
+        p[0] = 5
+        self.assertEqual(f, Sin() * Polynomial([5, 2]))
+        self.assertEqual(hash(f), hash(Sin() * Polynomial([5, 2])))
+        hash(f)
+        f.f1 = Cos()
+        self.assertEqual(f, Cos() * Polynomial([5, 2]))
+        c = Constant(1)
+        g = Sin() + c
+        hash(g)
+        c.val = 2
+        self.assertEqual(g, Sin() + Constant(2))
+
+
+class DerivativeCacheTester(unittest.TestCase):
+
+    def setUp(self):
+        self.f = Power(Polynomial([1, 1]), Sin()) * Cos()
+
+    def test_get_derivative_cached(self):
+        self.assertTrue(self.f.get_derivative() is self.f.get_derivative())
+
+    def test_nth_derivative_reuses_lower(self):
+        d3 = self.f.get_nth_derivative(3)
+        self.assertTrue(self.f.get_nth_derivative(3) is d3)
+        self.assertTrue(self.f.get_nth_derivative(2).get_derivative() is d3)
+
+    def test_simplified_nth_derivative_cached(self):
+        d3 = self.f.get_nth_derivative(3, simplify=True)
+        self.assertTrue(self.f.get_nth_derivative(3, simplify=True) is d3)
+
+    def test_mutation_clears_cache(self):
+        p = Polynomial([1, 2, 3])
+        self.assertEqual(p.get_derivative(), Polynomial([2, 6]))
+        p[2] = 1
+        self.assertEqual(p.get_derivative(), Polynomial([2, 2]))
+
+    def test_mutation_clears_containing_cache(self):
+        p = Polynomial([1, 2, 3])
+        f = Sin() * p
+        f.get_derivative()
+        f.simplify()
+        p[2] = 1
+        g = Sin() * Polynomial([1, 2, 1])
+        self.assertAlmostEqual(f.get_derivative()(1.0), g.get_derivative()(1.0))
+        self.assertAlmostEqual(f.simplify()(1.0), g(1.0))
+
+    def test_mutating_derivative(self):
+        q = Polynomial([1, 2, 3])
+        dq = q.get_derivative()
+        dq[0] = 100
+        self.assertEqual(q.get_derivative(), Polynomial([2, 6]))
+
+    def test_no_derivative(self):
+        class NoDerivative(Function):
+            def _evaluate(self, x):
+                return x
+
+            def __eq__(self, other):
+                return self is other
+        self.assertRaises(NotImplementedError, NoDerivative().get_derivative)
+
+    def test_overridden_get_derivative(self):
+        class Square(Function):
+            def _evaluate(self, x):
+                return x * x
+
+            def get_derivative(self):
+                return Polynomial([0, 2])
+
+            def __eq__(self, other):
+                return isinstance(other, Square)
+        self.assertEqual(Square().get_derivative()(3), 6)
+        self.assertEqual((Sin() + Square()).get_derivative()(3), math.cos(3) + 6)
+        self.assertEqual(Square()(Sin()).get_derivative()(3), 2*math.sin(3)*math.cos(3))
+
+
 class ConstantTester(unittest.TestCase):
 
     def setUp(self):
@@ -0,0 +1,128 @@
+from mathlibpy.functions import *
+from mathlibpy.functions import interpolation
+from mathlibpy.functions import solvers
+from fractions import Fraction
+import math
+import unittest
+
+
+class InterpolationTester(unittest.TestCase):
+
+    def setUp(self):
+        self.p = Polynomial([Fraction(c) for c in [3, -1, 0, 2, 5, -4, 1]])
+        self.xs = [Fraction(x, 3) for x in range(-10, 11)]
+
+    def test_subproduct_tree(self):
+        tree = interpolation.subproduct_tree([1, 2, 3])
+        self.assertEqual(tree[0], [[-1, 1], [-2, 1], [-3, 1]])
+        self.assertEqual(tree[-1], [[-6, 11, -6, 1]])
+
+    def test_evaluate_at(self):
+        expected = [self.p(x) for x in self.xs]
+        self.assertEqual(self.p.evaluate_at(self.xs), expected)
+        self.assertEqual(self.p.evaluate_at(self.xs, method="subproduct"), expected)
+        self.assertEqual(self.p.evaluate_at([], method="subproduct"), [])
+        self.assertRaises(ValueError, self.p.evaluate_at, self.xs, "fft")
+
+    def test_evaluate_at_large(self):
+        # Large enough for Newton division in the subproduct tree
+        p = Polynomial([(i * 7) % 11 - 5 for i in range(160)])
+        xs = range(-80, 80)
+        self.assertEqual(p.evaluate_at(xs, method="subproduct"), p.evaluate_at(xs))
+
+    def test_interpolate(self):
+        ys = [self.p(x) for x in self.xs[:7]]
+        self.assertEqual(Polynomial.interpolate(self.xs[:7], ys), self.p)
+        self.assertEqual(Polynomial.interpolate(self.xs[:7], ys, method="subproduct"), self.p)
+        q = Polynomial.interpolate([0.0, 1.0, 2.0], [1.0, 2.0, 5.0])   # 1 + x^2
+        for c, e in zip(q.coeffs, [1, 0, 1]):
+            self.assertAlmostEqual(c, e)
+        self.assertEqual(Polynomial.interpolate([2], [7]), Polynomial([7]))
+
+    def test_interpolate_large(self):
+        p = Polynomial([Fraction((i * 5) % 13 - 6) for i in range(80)])
+        xs = [Fraction(x) for x in range(-40, 40)]
+        self.assertEqual(Polynomial.interpolate(xs, p.evaluate_at(xs), method="subproduct"), p)
+
+    def test_interpolate_invalid(self):
+        self.assertRaises(ValueError, Polynomial.interpolate, [1, 1], [2, 3])
+        self.assertRaises(ValueError, Polynomial.interpolate, [1, 1], [2, 3], "subproduct")
+        self.assertRaises(ValueError, Polynomial.interpolate, [1, 2], [2])
+        self.assertRaises(ValueError, Polynomial.interpolate, [], [])
+
+
+class BarycentricTester(unittest.TestCase):
+
+    def setUp(self):
+        self.xs = [-1.0, -0.5, 0.0, 0.5, 1.0]
+        self.f = Barycentric(self.xs, [x**4 - x for x in self.xs])
+
+    def test_call(self):
+        self.assertEqual(self.f(0.5), 0.5**4 - 0.5)
+        for x in [-0.9, -0.2, 0.3, 0.77]:
+            self.assertAlmostEqual(self.f(x), x**4 - x)
+
+    def test_to_polynomial(self):
+        p = self.f.to_polynomial()
+        for c, e in zip(p.coeffs, [0, -1, 0, 0, 1]):
+            self.assertAlmostEqual(c, e)
+
+    def test_get_derivative(self):
+        self.assertAlmostEqual(self.f.get_derivative()(0.3), 4*0.3**3 - 1)
+
+    def test_eq(self):
+        self.assertEqual(self.f, Barycentric(self.xs, [x**4 - x for x in self.xs]))
+        self.assertNotEqual(self.f, Barycentric(self.xs, [0]*5))
+
+    def test_invalid(self):
+        self.assertRaises(ValueError, Barycentric, [1, 1], [2, 3])
+        self.assertRaises(ValueError, Barycentric, [], [])
+
+
+class ChebyshevTester(unittest.TestCase):
+
+    def setUp(self):
+        self.f = Power(Sin() + Constant(2), Cos()) * Exp()
+        self.approx = self.f.approximate((0, 3), 1e-12)
+        self.xs = [0, 0.01, 0.5, 1.234, 2.9, 3]
+
+    def test_call(self):
+        self.assertTrue(isinstance(self.approx, Chebyshev))
+        self.assertTrue(self.approx.error <= 1e-12)
+        for x in self.xs:
+            self.assertAlmostEqual(self.approx(x), self.f(x), places=11)
+
+    def test_evaluate_many(self):
+        for y, x in zip(self.approx.evaluate_many(self.xs), self.xs):
+            self.assertAlmostEqual(y, self.approx(x), places=13)
+
+    def test_outside_interval(self):
+        self.assertRaises(ValueError, self.approx, 3.5)
+        self.assertRaises(ValueError, self.approx.evaluate_many, [1, -1])
+
+    def test_clenshaw(self):
+        g = Chebyshev([1, 2, 3], -1, 1)     # 1 + 2x + 3(2x^2 - 1)
+        for x in [-1, -0.3, 0.8]:
+            self.assertAlmostEqual(g(x), 1 + 2*x + 3*(2*x*x - 1))
+        self.assertAlmostEqual(Chebyshev([1, 2, 3], 1, 3)(1.7), g(-0.3))
+
+    def test_polynomial(self):
+        approx = Polynomial([1, 2, 3]).approximate((-1, 1))
+        self.assertEqual(approx.degree, 2)
+        for c, e in zip(approx.coeffs, [2.5, 2, 1.5]):
+            self.assertAlmostEqual(c, e)
+
+    def test_get_derivative(self):
+        derivative = self.approx.get_derivative()
+        for x in self.xs:
+            self.assertAlmostEqual(derivative(x), self.f.get_derivative()(x), places=8)
+        self.assertEqual(Chebyshev([4], 0, 1).get_derivative()(0.5), 0)
+
+    def test_not_smooth(self):
+        sqrt = Power(Polynomial([0, 1]), Constant(0.5))
+        self.assertRaises(solvers.ConvergenceError, sqrt.approximate, (1e-6, 1), 1e-12, 64)
+        self.assertRaises(ValueError, sqrt.approximate, (1, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,126 @@
+from mathlibpy.functions import *
+import math
+import unittest
+
+
+class IntervalTester(unittest.TestCase):
+
+    def setUp(self):
+        self.a = Interval(1, 2)
+        self.b = Interval(-3, 4)
+
+    def test_arithmetic(self):
+        self.assertEqual(self.a + self.b, Interval(-2, 6))
+        self.assertEqual(self.a - self.b, Interval(-3, 5))
+        self.assertEqual(1 - self.a, Interval(-1, 0))
+        self.assertEqual(self.a * self.b, Interval(-6, 8))
+        self.assertEqual(-self.b * 2, Interval(-8, 6))
+        self.assertEqual(abs(self.b), Interval(0, 4))
+        quotient = Interval(2, 4) / Interval(1, 2)
+        self.assertTrue(Interval(1, 4) in quotient)
+        self.assertAlmostEqual(quotient.width, 3)
+
+    def test_rounded_outwards(self):
+        third = Interval(1) / 3
+        self.assertTrue(third.lo < third.hi)
+        self.assertTrue(third.lo <= 1.0 / 3 <= third.hi)
+        self.assertTrue(0.1 + 0.2 in Interval(0.1) + 0.2)
+
+    def test_division_by_zero(self):
+        self.assertEqual(self.a / self.b, Interval(-float("inf"), float("inf")))
+        self.assertEqual((self.a / Interval(0, 2)).hi, float("inf"))
+        self.assertTrue((self.a / Interval(0, 2)).lo <= 0.5)
+        self.assertEqual((self.a / Interval(-2, 0)).lo, -float("inf"))
+        self.assertRaises(ZeroDivisionError, self.a.__truediv__, Interval(0))
+
+    def test_power(self):
+        self.assertEqual(self.b ** 2, Interval(0, 16))
+        self.assertEqual(self.b ** 3, Interval(-27, 64))
+        self.assertEqual(Interval(-3, -2) ** 2, Interval(4, 9))
+        self.assertEqual(self.a ** 0, 1)
+        self.assertTrue(0.5 in self.a ** -1 and 1 in self.a ** -1)
+        self.assertTrue(math.sqrt(2) in self.a ** 0.5)
+        self.assertTrue(4 in 2 ** self.a and 2 in 2 ** self.a)
+        self.assertRaises(ValueError, Interval(-2, -1).__pow__, 0.5)
+
+    def test_comparison(self):
+        self.assertEqual(Interval(3), 3)
+        self.assertNotEqual(self.a, 1)
+        self.assertLess(self.a, 3)
+        self.assertFalse(self.a < 2)
+        self.assertFalse(self.a >= 2)
+        self.assertGreater(Interval(5, 6), self.b)
+        self.assertRaises(ValueError, Interval, 2, 1)
+
+    def test_sin_cos(self):
+        self.assertEqual(Interval(0, 7).sin(), Interval(-1, 1))
+        s = Interval(0, 2).sin()
+        self.assertEqual(s.hi, 1)
+        self.assertTrue(s.lo <= 0 and s.lo > -1e-300)
+        c = Interval(2, 4).cos()
+        self.assertEqual(c.lo, -1)
+        self.assertTrue(math.cos(2) <= c.hi < math.cos(2) + 1e-15)
+        s = Interval(100, 101).sin()
+        self.assertTrue(s.lo <= math.sin(101) and s.hi >= math.sin(100) and s.hi < 1)
+
+    def test_exp_log(self):
+        e = self.a.exp()
+        self.assertTrue(e.lo <= math.exp(1) and math.exp(2) <= e.hi)
+        self.assertEqual(Interval(-1000, 1000).exp(), Interval(0, float("inf")))
+        self.assertEqual(Interval(0, 1).log().lo, -float("inf"))
+        self.assertRaises(ValueError, Interval(-1, 0).log)
+
+    def test_split_hull(self):
+        left, right = self.b.split()
+        self.assertEqual(left, Interval(-3, 0.5))
+        self.assertEqual(left.hull(right), self.b)
+        self.assertEqual(self.b.width, 7)
+
+
+class BoundTester(unittest.TestCase):
+
+    def _check(self, f, lo, hi, pieces=1):
+        bound = f.bound(lo, hi, pieces)
+        for i in range(101):
+            self.assertTrue(f(lo + (hi - lo) * i / 100.0) in bound)
+        return bound
+
+    def test_contains_values(self):
+        funcs = [
+            Sin() * Cos() + Exp(),
+            Power(Sin() + Constant(2), Cos()),
+            Power(Polynomial([0, 1]), Constant(3)) - Polynomial([0, 2]),
+            Power(Constant(2), Sin()),
+            LogBase(10)(Polynomial([2, 0, 1])),
+            Tan()(Polynomial([0, 0.5])),
+            SparsePolynomial({0: 1, 7: -2, 12: 1}),
+            Constant(1) / (Polynomial([1, 0, 1])),
+        ]
+        for f in funcs:
+            self._check(f, -2, 1.5)
+
+    def test_tight(self):
+        self.assertEqual(Sin().bound(0, math.pi).hi, 1)
+        bound = Exp().bound(0, 1)
+        self.assertAlmostEqual(bound.lo, 1)
+        self.assertAlmostEqual(bound.hi, math.e)
+        self.assertEqual(Constant(5).bound(0, 1), 5)
+
+    def test_pieces(self):
+        f = Polynomial([0, 1]) * (Constant(1) - Polynomial([0, 1]))     # x(1 - x) <= 1/4
+        loose = f.bound(0, 1)
+        tight = self._check(f, 0, 1, 16)
+        self.assertTrue(tight.width < loose.width)
+        self.assertTrue(tight.hi < 0.35)
+        self.assertRaises(ValueError, f.bound, 0, 1, 0)
+
+    def test_division_by_zero(self):
+        bound = (Constant(1) / Polynomial([0, 1])).bound(-1, 1)
+        self.assertEqual(bound, Interval(-float("inf"), float("inf")))
+
+    def test_log_of_negative(self):
+        self.assertRaises(ValueError, Log().bound, -2, -1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+from mathlibpy.functions import *
+from mathlibpy.functions import optimize
+from mathlibpy.functions import solvers
+import math
+import unittest
+
+
+class LocalTester(unittest.TestCase):
+
+    def setUp(self):
+        # x^2 - 2cos(x), least value -2 at 0
+        self.f = Polynomial([0, 0, 1]) - Constant(2) * Cos()
+        self.g = Polynomial([5, -4, 1])     # (x - 2)^2 + 1
+
+    def test_golden_section(self):
+        x, value = optimize.golden_section(self.f, -1, 2)
+        self.assertAlmostEqual(x, 0, places=7)
+        self.assertAlmostEqual(value, -2)
+        x, value = optimize.golden_section(self.g, 10, -3)
+        self.assertAlmostEqual(x, 2, places=7)
+        self.assertAlmostEqual(value, 1)
+
+    def test_brent(self):
+        x, value = optimize.brent(self.f, -1, 2)
+        self.assertAlmostEqual(x, 0, places=7)
+        self.assertAlmostEqual(value, -2)
+        x, value = optimize.brent(self.g, -3, 10)
+        self.assertAlmostEqual(x, 2, places=7)
+        x, _ = optimize.brent(lambda t: math.exp(t) - 3*t, 0, 3)
+        self.assertAlmostEqual(x, math.log(3), places=7)
+
+    def test_brent_fewer_evaluations(self):
+        counts = {"golden": 0, "brent": 0}
+
+        def counted(name):
+            def h(x):
+                counts[name] += 1
+                return self.f(x)
+            return h
+        optimize.golden_section(counted("golden"), -1, 2)
+        optimize.brent(counted("brent"), -1, 2)
+        self.assertLess(counts["brent"], counts["golden"])
+
+    def test_newton(self):
+        for mode in ["ad", "symbolic"]:
+            x, value = optimize.newton(self.f, 0.7, mode=mode)
+            self.assertAlmostEqual(x, 0)
+            self.assertAlmostEqual(value, -2)
+        self.assertRaises(solvers.ConvergenceError, optimize.newton, Sin(), math.pi / 2 - 0.1)
+
+    def test_not_converged(self):
+        self.assertRaises(solvers.ConvergenceError, optimize.brent, self.f, -1, 2, 1e-10, 1e-10, 3)
+        self.assertRaises(solvers.ConvergenceError, optimize.golden_section, self.f, -1, 2, 1e-10, 1e-10, 3)
+
+
+class GlobalTester(unittest.TestCase):
+
+    def setUp(self):
+        # sin(3x) + x^2/10, with many local minima; global minimum near -pi/6
+        self.f = Sin()(Polynomial([0, 3])) + Polynomial([0, 0, 0.1])
+        xs = [-10 + 20 * i / 20000.0 for i in range(20001)]
+        self.least = min(self.f(x) for x in xs)
+        self.greatest = max(self.f(x) for x in xs)
+
+    def test_global_minimum(self):
+        x, value, error = optimize.global_minimum(self.f, -10, 10)
+        self.assertTrue(error <= 1e-8)
+        self.assertTrue(value <= self.least)
+        self.assertAlmostEqual(value, self.least, places=5)
+        self.assertAlmostEqual(x, -0.5122, places=3)
+        self.assertEqual(self.f(x), value)
+
+    def test_global_maximum(self):
+        x, value, error = optimize.global_maximum(self.f, -10, 10)
+        self.assertEqual(x, -10)
+        self.assertAlmostEqual(value, self.greatest)
+
+    def test_max_boxes(self):
+        x, value, error = optimize.global_minimum(self.f, -10, 10, max_boxes=20)
+        self.assertTrue(error > 1e-8)
+        self.assertTrue(value - error <= self.least <= value)
+
+    def test_pole(self):
+        f = Constant(1) / Polynomial([0, 1])
+        x, value, error = optimize.global_minimum(f, 0.5, 2)
+        self.assertAlmostEqual(x, 2)
+        self.assertTrue(error <= 1e-8)
+        # Undefined at the midpoint 0, whose neighbouring boxes are bounded below
+        x, value, error = optimize.global_minimum(Polynomial([0, 0, 1]) + f * f, -1, 1)
+        self.assertAlmostEqual(abs(x), 1)
+        self.assertAlmostEqual(value, 2)
+        # Interval bounds of boxes containing the pole are unbounded, so are split only down to xtol
+        x, value, error = optimize.global_minimum(Polynomial([0, 0, 1]) + f * f, -1, 1.5, xtol=1e-6)
+        self.assertAlmostEqual(value, 2)
+        self.assertEqual(error, float("inf"))
+
+    def test_partially_undefined(self):
+        # Defined only for x >= 0, where the minimum is 0 at 0; boxes reaching below 0 are split down to xtol
+        f = Power(Polynomial([0, 1]), Constant(0.5))
+        x, value, error = optimize.global_minimum(f, -1, 4, xtol=1e-6)
+        self.assertTrue(0 <= x < 1e-3)
+        self.assertTrue(0 <= value < 0.01)
+        self.assertEqual(error, float("inf"))
+        x, value, error = optimize.global_minimum(Log(), -1, 1)
+        self.assertTrue(0 < x <= 1)
+        self.assertEqual(value, math.log(x))
+
+    def test_invalid(self):
+        self.assertRaises(ValueError, optimize.global_minimum, self.f, 1, 0)
+
+
+class MinimizeTester(unittest.TestCase):
+
+    def test_methods(self):
+        f = Power(Sin() + Constant(2), Cos()) * Exp()
+        x, value = f.minimize(-6, 3)
+        self.assertAlmostEqual(x, -6)
+        f = Exp() - Polynomial([0, 2])
+        for method in ["global", "brent", "golden-section"]:
+            x, value = f.minimize(-3, 3, method=method)
+            self.assertAlmostEqual(x, math.log(2), places=4)
+            self.assertAlmostEqual(value, 2 - 2*math.log(2))
+        self.assertRaises(ValueError, f.minimize, 0, 1, 1e-8, "newton")
+
+    def test_maximize(self):
+        x, value = Sin().maximize(0, 3)
+        self.assertAlmostEqual(x, math.pi / 2, places=3)
+        self.assertAlmostEqual(value, 1)
+        x, value = Sin().maximize(0, 3, method="brent")
+        self.assertAlmostEqual(x, math.pi / 2, places=7)
+
+
+if __name__ == "__main__":
+    unittest.main()
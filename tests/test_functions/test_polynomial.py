@@ -1,4 +1,5 @@
 from mathlibpy.functions import *
+from fractions import Fraction
 import unittest
 
 
@@ -27,6 +28,11 @@ class PolynomialTester(unittest.TestCase):
     def test_eq(self):
         self.assertEqual(self.p2, Polynomial([2, 3, 4]))
         self.assertEqual(self.p2, self.p3)
+        self.assertNotEqual(self.p2, Polynomial([2, 3, 5]))
+
+    def test_zero(self):
+        self.assertEqual(Polynomial([0, 0]).coeffs, [0])
+        self.assertEqual(Polynomial([0])(5), 0)
 
     def test_getitem(self):
         self.assertEqual(self.p1[0], 1)
@@ -42,9 +48,72 @@ class PolynomialTester(unittest.TestCase):
     def test_call(self):
         self.assertEqual(self.p1(0), 1)
         self.assertEqual(self.p2(1), 9)
+        self.assertEqual(self.p2(-2), 12)
+        self.assertEqual(self.p2(0.5), 4.5)
+        self.assertEqual(Polynomial([0, 0, 0, 1])(3), 27)
 
     def test_add(self):
-        self.assertTrue(isinstance(self.p1 + self.p1, FunctionAddNode))
+        self.assertEqual(self.p1 + self.p1, Polynomial([2]))
+        self.assertEqual(self.p1 + self.p2, Polynomial([3, 3, 4]))
+        self.assertEqual(self.p2 + Constant(1), Polynomial([3, 3, 4]))
+        self.assertEqual(Constant(1) + self.p2, Polynomial([3, 3, 4]))
+        self.assertTrue(isinstance(self.p1 + Sin(), FunctionAddNode))
+
+    def test_sub(self):
+        self.assertEqual(self.p2 - self.p1, Polynomial([1, 3, 4]))
+        self.assertEqual(self.p2 - self.p3, Polynomial([0]))
+        self.assertEqual(Constant(1) - self.p2, Polynomial([-1, -3, -4]))
+        self.assertTrue(isinstance(self.p1 - Sin(), FunctionSubNode))
+
+    def test_mul(self):
+        self.assertEqual(self.p2 * Polynomial([1, 1]), Polynomial([2, 5, 7, 4]))
+        self.assertEqual(self.p2 * Constant(2), Polynomial([4, 6, 8]))
+        self.assertEqual(Constant(2) * self.p2, Polynomial([4, 6, 8]))
+        self.assertTrue(isinstance(Constant(2) * self.p2, Polynomial))
+        self.assertTrue(isinstance(Constant(2) * Sin(), FunctionMulNode))
+        self.assertTrue(isinstance(self.p1 * Sin(), FunctionMulNode))
+
+    def test_mul_large(self):
+        a = [(i * 7) % 11 - 5 for i in range(300)]
+        b = [(i * 5) % 13 - 6 for i in range(280)]
+        expected = [0] * (len(a) + len(b) - 1)
+        for i, x in enumerate(a):
+            for j, y in enumerate(b):
+                expected[i + j] += x * y
+        self.assertEqual((Polynomial(a) * Polynomial(b)).coeffs, expected)     # Karatsuba, exact
+        product = Polynomial([float(x) for x in a]) * Polynomial([float(y) for y in b])     # FFT
+        for c, e in zip(product.coeffs, expected):
+            self.assertAlmostEqual(c, e, places=6)
+
+    def test_divmod(self):
+        q, r = divmod(Polynomial([-1, 0, 0, 1]), Polynomial([-1, 1]))
+        self.assertEqual(q, Polynomial([1, 1, 1]))
+        self.assertEqual(r, Polynomial([0]))
+        q, r = divmod(self.p2, Polynomial([1, 1]))
+        self.assertEqual(q * Polynomial([1, 1]) + r, self.p2)
+        self.assertEqual(r.degree, 0)
+        self.assertEqual(self.p2 // Polynomial([0, 2]), Polynomial([1.5, 2]))
+        self.assertEqual(self.p2 % Polynomial([0, 2]), Polynomial([2]))
+        self.assertRaises(ZeroDivisionError, divmod, self.p2, Polynomial([0]))
+
+    def test_divmod_large(self):
+        a = Polynomial([(i * 7) % 11 - 5 for i in range(300)])
+        b = Polynomial([(i * 5) % 13 - 6 for i in range(120)] + [1])
+        q, r = divmod(a, b)      # Newton division
+        self.assertEqual(q * b + r, a)
+        self.assertTrue(r.degree < b.degree)
+
+    def test_gcd(self):
+        a = Polynomial([-1, 1]) * Polynomial([2, 1]) * Polynomial([3, 0, 1])
+        b = Polynomial([-1, 1]) * Polynomial([2, 1]) * Polynomial([-5, 1])
+        g = a.gcd(b)
+        for c, e in zip(g.coeffs, (Polynomial([-1, 1]) * Polynomial([2, 1])).coeffs):
+            self.assertAlmostEqual(c, e)
+        self.assertEqual(self.p2.gcd(Polynomial([0])), Polynomial([0.5, 0.75, 1]))
+        self.assertEqual(Polynomial([0, 1]).gcd(Polynomial([1, 1])), Polynomial([1]))
+        # Exact coefficients of very different sizes are not rounded away
+        a = Polynomial([1, 0, 10**10])
+        self.assertEqual(a.gcd(a * Polynomial([1, 1])), Polynomial([Fraction(1, 10**10), 0, 1]))
 
     def test_add_call(self):
         self.assertEqual((self.p1+self.p2)(1), 10)
@@ -69,5 +138,132 @@ class PolynomialTester(unittest.TestCase):
         self.assertEqual(self.p2.get_derivative()(1), 11)
         self.assertEqual(self.p1.get_derivative()(1), 0)
 
+
+class SparsePolynomialTester(unittest.TestCase):
+
+    def setUp(self):
+        self.s1 = SparsePolynomial({1000000: 1, 0: 1})   # s = 1 + x^1000000
+        self.s2 = SparsePolynomial({3: 2, 1: -1})        # s = -x + 2x^3
+
+    def test_terms(self):
+        self.assertEqual(self.s2.terms, [(1, -1), (3, 2)])
+        self.assertEqual(SparsePolynomial([(2, 1), (2, -1)]).terms, [(0, 0)])
+        self.assertEqual(self.s1.degree, 1000000)
+        self.assertRaises(ValueError, SparsePolynomial, {-1: 1})
+
+    def test_str(self):
+        self.assertEqual(str(self.s2), "-1x^1 + 2x^3")
+        self.assertEqual(str(self.s1), "1 + 1x^1000000")
+
+    def test_eq(self):
+        self.assertEqual(self.s2, SparsePolynomial([(1, -1), (3, 2), (5, 0)]))
+        self.assertNotEqual(self.s1, self.s2)
+
+    def test_getitem(self):
+        self.assertEqual(self.s1[1000000], 1)
+        self.assertEqual(self.s1[5], 0)
+        self.assertEqual(self.s1[0], 1)
+        self.assertEqual(self.s1[2000000], 0)
+        s = SparsePolynomial({3*e: e for e in range(1, 20000)})
+        self.assertEqual([s[e] for e in range(60000)], [e // 3 if e % 3 == 0 else 0 for e in range(60000)])
+
+    def test_call(self):
+        self.assertEqual(self.s1(1), 2)
+        self.assertEqual(self.s1(-1), 2)
+        self.assertEqual(self.s2(2), 14)
+        self.assertAlmostEqual(self.s1(0.999999), 1 + 0.999999 ** 1000000)
+        self.assertEqual(SparsePolynomial({})(3), 0)
+
+    def test_evaluate_many(self):
+        self.assertEqual(list(self.s2.evaluate_many([0, 1, 2])), [0, 1, 14])
+
+    def test_compile(self):
+        f = self.s2.compile()
+        self.assertEqual(f(2), 14)
+
+    def test_dense(self):
+        self.assertEqual(self.s2.to_dense(), Polynomial([0, -1, 0, 2]))
+        self.assertEqual(SparsePolynomial.from_dense(Polynomial([0, -1, 0, 2])), self.s2)
+
+    def test_arithmetic(self):
+        self.assertEqual(self.s1 + self.s2, SparsePolynomial({0: 1, 1: -1, 3: 2, 1000000: 1}))
+        self.assertEqual(self.s2 - self.s2, SparsePolynomial({}))
+        self.assertEqual(self.s2 * SparsePolynomial({2: 1}), SparsePolynomial({3: -1, 5: 2}))
+        self.assertEqual(self.s2 + Constant(3), SparsePolynomial({0: 3, 1: -1, 3: 2}))
+        self.assertEqual(Constant(3) + self.s2, SparsePolynomial({0: 3, 1: -1, 3: 2}))
+        self.assertTrue(isinstance(self.s2 + Sin(), FunctionAddNode))
+
+    def test_dense_interop(self):
+        self.assertEqual(self.s2 + Polynomial([1, 1]), SparsePolynomial({0: 1, 3: 2}))
+        self.assertEqual(Polynomial([1, 1]) + self.s2, SparsePolynomial({0: 1, 3: 2}))
+        self.assertEqual(Polynomial([1, 1]) - self.s2, SparsePolynomial({0: 1, 1: 2, 3: -2}))
+        self.assertEqual(Polynomial([0, 1]) * self.s1, SparsePolynomial({1: 1, 1000001: 1}))
+
+    def test_get_derivative(self):
+        self.assertEqual(self.s1.get_derivative(), SparsePolynomial({999999: 1000000}))
+        self.assertEqual(SparsePolynomial({0: 4}).get_derivative(), Constant(0))
+        self.assertEqual(self.s2.get_derivative()(1), 5)
+
+    def test_compile_negative_argument(self):
+        f = SparsePolynomial({2: 1})(Constant(-2))
+        self.assertEqual(f.compile()(0), f(0))
+        f = SparsePolynomial({3: 1, 1: 2})(Constant(-2))
+        self.assertEqual(f.compile()(0), f(0))
+
+
+class ShiftedPolynomialTester(unittest.TestCase):
+
+    def setUp(self):
+        self.p = ShiftedPolynomial([1, -2, 3], 2)       # p = 1 - 2(x - 2) + 3(x - 2)^2
+
+    def test_coeffs(self):
+        self.assertEqual(self.p.coeffs, [1, -2, 3])
+        self.assertEqual((self.p.degree, self.p.center, self.p[1], self.p[5]), (2, 2, -2, 0))
+        self.assertEqual(ShiftedPolynomial([4, 0, 0]).coeffs, [4])
+
+    def test_str(self):
+        self.assertEqual(str(self.p), "1 - 2(x - 2)^1 + 3(x - 2)^2")
+
+    def test_eq(self):
+        self.assertEqual(self.p, ShiftedPolynomial([1, -2, 3, 0], 2))
+        self.assertNotEqual(self.p, ShiftedPolynomial([1, -2, 3], 1))
+        self.assertNotEqual(self.p, self.p.to_dense())
+
+    def test_call(self):
+        self.assertEqual(self.p(2), 1)
+        self.assertEqual(self.p(3), 2)
+        self.assertEqual(list(self.p.evaluate_many([2, 3])), [1, 2])
+        self.assertEqual(self.p.compile()(3), 2)
+
+    def test_dense(self):
+        self.assertEqual(self.p.to_dense(), Polynomial([17, -14, 3]))
+        self.assertEqual(ShiftedPolynomial([1, 1], Fraction(1, 3)).to_dense(), Polynomial([Fraction(2, 3), 1]))
+
+    def test_arithmetic(self):
+        q = ShiftedPolynomial([0, 1], 2)
+        self.assertEqual(self.p + q, ShiftedPolynomial([1, -1, 3], 2))
+        self.assertEqual(self.p - self.p, ShiftedPolynomial([0], 2))
+        self.assertEqual(self.p * q, ShiftedPolynomial([0, 1, -2, 3], 2))
+        self.assertEqual(Constant(2) * self.p, ShiftedPolynomial([2, -4, 6], 2))
+        self.assertEqual(self.p - Constant(1), ShiftedPolynomial([0, -2, 3], 2))
+        self.assertTrue(isinstance(self.p + ShiftedPolynomial([0, 1], 1), FunctionAddNode))
+
+    def test_roots(self):
+        p = ShiftedPolynomial([-1, 0, 1], 1e6)      # Roots 1e6 - 1 and 1e6 + 1
+        self.assertEqual(p.real_roots(), [1e6 - 1, 1e6 + 1])
+        self.assertEqual(sorted(r.real for r in p.roots()), [1e6 - 1, 1e6 + 1])
+
+    def test_get_derivative(self):
+        self.assertEqual(self.p.get_derivative(), ShiftedPolynomial([-2, 6], 2))
+        self.assertEqual(ShiftedPolynomial([4], 2).get_derivative(), Constant(0))
+
+    def test_set_coeffs(self):
+        self.p.coeffs = [0, 1]
+        self.assertEqual(self.p(3), 1)
+        self.assertEqual(self.p.get_derivative(), ShiftedPolynomial([1], 2))
+        self.p.center = 0
+        self.assertEqual(self.p(3), 3)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,70 @@
+from mathlibpy.functions import *
+from mathlibpy.functions import function
+import unittest
+
+
+class ProfilerTester(unittest.TestCase):
+
+    def setUp(self):
+        self.sin = Sin()
+        self.poly = Polynomial([1, 2, 3])
+        self.f = (self.sin + Constant(2)) * Exp()(self.poly)
+
+    def test_counts(self):
+        with Profiler() as profiler:
+            for x in range(5):
+                self.f(x)
+            self.sin(1)
+        self.assertEqual(profiler[self.f].calls, 5)
+        self.assertEqual(profiler[self.sin].calls, 6)
+        self.assertEqual(profiler[self.poly].calls, 5)
+        self.assertEqual(profiler[Cos()].calls, 0)
+
+    def test_times(self):
+        with Profiler() as profiler:
+            for x in range(100):
+                self.f(x / 100.0)
+        root = profiler[self.f]
+        self.assertTrue(root.total >= root.own > 0)
+        children = sum(profiler[c].total for c in self.f._children())
+        self.assertAlmostEqual(root.total, root.own + children)
+        self.assertEqual(profiler[self.sin].total, profiler[self.sin].own)
+        nodes = profiler.nodes()
+        self.assertEqual(len(nodes), 7)
+        self.assertTrue(all(a[1].own >= b[1].own for a, b in zip(nodes, nodes[1:])))
+
+    def test_results_unchanged(self):
+        expected = [self.f(x) for x in range(5)]
+        with Profiler():
+            self.assertEqual([self.f(x) for x in range(5)], expected)
+            self.assertTrue(isinstance(self.sin(self.poly), function.FunctionCompNode))
+
+    def test_restored(self):
+        call = function.Function.__dict__["__call__"]
+        with Profiler():
+            self.assertFalse(function.Function.__dict__["__call__"] is call)
+        self.assertTrue(function.Function.__dict__["__call__"] is call)
+        try:
+            with Profiler():
+                (Constant(1) / Polynomial([0, 1]))(0)
+        except Exception:
+            pass
+        self.assertTrue(function.Function.__dict__["__call__"] is call)
+
+    def test_nested(self):
+        with Profiler():
+            self.assertRaises(RuntimeError, Profiler().__enter__)
+
+    def test_report(self):
+        with Profiler() as profiler:
+            self.f(0.5)
+        lines = profiler.report(self.f).split("\n")
+        self.assertEqual(len(lines), 7)
+        self.assertTrue(lines[0].startswith("FunctionMulNode  calls=1"))
+        self.assertTrue(lines[2].startswith("        Sin  calls=1"))
+        self.assertTrue(lines[3].startswith("        Constant(2)  calls=1"))
+        self.assertTrue(lines[6].startswith("        Polynomial(1, 2, 3)  calls=1"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+from mathlibpy.functions import *
+from mathlibpy.functions import quadrature, solvers
+import math
+import multiprocessing
+import unittest
+
+
+class GaussKronrodTester(unittest.TestCase):
+
+    def test_smooth(self):
+        value, error = quadrature.gauss_kronrod(Sin(), 0, math.pi)
+        self.assertAlmostEqual(value, 2, places=12)
+        self.assertTrue(error < 1e-10)
+
+    def test_adaptive(self):
+        value, error = quadrature.gauss_kronrod(lambda x: abs(x - 0.3), 0, 1)
+        self.assertAlmostEqual(value, 0.29, places=10)
+        value, error = quadrature.gauss_kronrod(lambda x: math.sqrt(x), 0, 1)
+        self.assertAlmostEqual(value, 2 / 3.0, places=10)
+
+    def test_reversed_limits(self):
+        self.assertAlmostEqual(quadrature.gauss_kronrod(Polynomial([0, 0, 1]), 3, 0)[0], -9)
+        self.assertEqual(quadrature.gauss_kronrod(Sin(), 1, 1), (0.0, 0.0))
+
+    def test_max_intervals(self):
+        value, error = quadrature.gauss_kronrod(lambda x: abs(x - 0.3), 0, 1, 0, 0, max_intervals=4)
+        self.assertTrue(error > 0)
+        self.assertAlmostEqual(value, 0.29, places=2)
+
+    def test_not_finite(self):
+        nan, inf = float("nan"), float("inf")
+        self.assertRaises(solvers.ConvergenceError, quadrature.gauss_kronrod, lambda x: nan if x > 0.5 else 1.0, 0, 1)
+        self.assertRaises(solvers.ConvergenceError, quadrature.gauss_kronrod, lambda x: inf, 0, 1)
+
+
+class TanhSinhTester(unittest.TestCase):
+
+    def test_smooth(self):
+        value, error = quadrature.tanh_sinh(Exp(), 0, 1)
+        self.assertAlmostEqual(value, math.e - 1, places=12)
+
+    def test_endpoint_singularity(self):
+        self.assertAlmostEqual(quadrature.tanh_sinh(lambda x: 1 / math.sqrt(x), 0, 1)[0], 2, places=12)
+        self.assertAlmostEqual(quadrature.tanh_sinh(Log(), 0, 1)[0], -1, places=12)
+        self.assertAlmostEqual(quadrature.tanh_sinh(lambda x: math.sqrt(1 - x*x), -1, 1)[0], math.pi / 2, places=10)
+
+    def test_reversed_limits(self):
+        self.assertAlmostEqual(quadrature.tanh_sinh(Cos(), math.pi / 2, 0)[0], -1, places=12)
+
+
+class IntegrateTester(unittest.TestCase):
+
+    def test_integrate(self):
+        f = Sin() * Exp()
+        expected = (math.exp(2) * (math.sin(2) - math.cos(2)) + 1) / 2
+        self.assertAlmostEqual(f.integrate(0, 2)[0], expected, places=10)
+        self.assertAlmostEqual(f.integrate(0, 2, method="tanh-sinh")[0], expected, places=10)
+        self.assertRaises(ValueError, f.integrate, 0, 2, 1e-10, "simpson")
+
+    def test_pool(self):
+        pool = multiprocessing.Pool(2)
+        try:
+            f = Sin() * Exp()
+            self.assertEqual(f.integrate(0, 10, pool=pool), f.integrate(0, 10))
+            self.assertEqual(f.integrate(0, 10, method="tanh-sinh", pool=pool), f.integrate(0, 10, method="tanh-sinh"))
+        finally:
+            pool.close()
+            pool.join()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+from mathlibpy.functions import *
+from mathlibpy.functions.reverse import Tape
+import math
+import unittest
+
+
+class TapeTester(unittest.TestCase):
+
+    def test_gradient(self):
+        tape = Tape()
+        x = tape.variable(2)
+        y = tape.variable(3)
+        z = x * y + x.sin() - y / x + 2 ** x
+        self.assertEqual(z.value, 6 + math.sin(2) - 1.5 + 4)
+        dx, dy = tape.gradient(z, [x, y])
+        self.assertAlmostEqual(dx, 3 + math.cos(2) + 3 / 4.0 + 4 * math.log(2))
+        self.assertAlmostEqual(dy, 2 - 0.5)
+
+    def test_shared_operand(self):
+        tape = Tape()
+        x = tape.variable(3)
+        self.assertEqual(tape.gradient(x * x * x, [x]), [27])
+
+    def test_independent_output(self):
+        tape = Tape()
+        x = tape.variable(3)
+        self.assertEqual(tape.gradient(5, [x]), [0])
+
+
+class VariableTester(unittest.TestCase):
+
+    def test_call(self):
+        self.assertEqual(Variable(1)((4, 5, 6)), 5)
+        self.assertEqual(Variable(0)(4), 4)
+        self.assertRaises(TypeError, Variable(1), 4)
+
+    def test_eq(self):
+        self.assertEqual(Variable(1), Variable(1))
+        self.assertNotEqual(Variable(1), Variable(2))
+
+    def test_multivariate_call(self):
+        f = Sin()(Variable(0) * Variable(1)) + Variable(2)
+        self.assertEqual(f((1, 2, 3)), math.sin(2) + 3)
+
+
+class GradientTester(unittest.TestCase):
+
+    def setUp(self):
+        x, y, z = Variable(0), Variable(1), Variable(2)
+        self.f = (Sin()(x * y) + Exp()(z) / (x + Constant(1)) + Power(y, Constant(3)) - LogBase(2)(z)
+                  + Polynomial([1, 2, 3])(x) - Cos()(Tan()(y)))
+        self.point = (0.5, 1.5, 2.0)
+
+    def test_value(self):
+        self.assertAlmostEqual(self.f.value_and_gradient(self.point)[0], self.f(self.point), places=12)
+
+    def test_matches_finite_differences(self):
+        h = 1e-6
+        gradient = self.f.gradient(self.point)
+        for i in range(3):
+            above = tuple(p + h if j == i else p for j, p in enumerate(self.point))
+            below = tuple(p - h if j == i else p for j, p in enumerate(self.point))
+            self.assertAlmostEqual(gradient[i], (self.f(above) - self.f(below)) / (2 * h), places=5)
+
+    def test_single_variable(self):
+        f = Sin() * Polynomial([1, 2, 3])
+        self.assertAlmostEqual(f.gradient(0.7)[0], f.get_derivative()(0.7), places=12)
+
+    def test_constant(self):
+        self.assertEqual(Constant(3).value_and_gradient((1, 2)), (3, [0, 0]))
+
+
+if __name__ == "__main__":
+    unittest.main()
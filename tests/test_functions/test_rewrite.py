@@ -0,0 +1,79 @@
+from mathlibpy.functions import *
+import unittest
+
+
+def count_nodes(f):
+    if isinstance(f, (FunctionBinaryTreeNode, Power)):
+        return 1 + count_nodes(f.f1) + count_nodes(f.f2)
+    return 1
+
+
+class SimplifyTester(unittest.TestCase):
+
+    def test_constant_folding(self):
+        self.assertEqual((Constant(2) * Constant(3) + Constant(1)).simplify(), Constant(7))
+        self.assertEqual((Constant(1) / Constant(4)).simplify(), Constant(0.25))
+
+    def test_identities(self):
+        self.assertEqual((Constant(0) * Sin()).simplify(), Constant(0))
+        self.assertEqual((Sin() * Constant(1)).simplify(), Sin())
+        self.assertEqual((Sin() + Constant(0)).simplify(), Sin())
+        self.assertEqual((Sin() / Constant(1)).simplify(), Sin())
+        self.assertEqual(Power(Sin(), Constant(1)).simplify(), Sin())
+        self.assertEqual(Power(Sin(), Constant(0)).simplify(), Constant(1))
+
+    def test_merge_polynomials(self):
+        p = Polynomial([1, 1])
+        self.assertEqual((p + Polynomial([0, 0, 2])).simplify(), Polynomial([1, 1, 2]))
+        self.assertEqual((p * p).simplify(), Polynomial([1, 2, 1]))
+        self.assertEqual((p - p).simplify(), Constant(0))
+        self.assertEqual(p(Polynomial([0, 2])).simplify(), Polynomial([1, 2]))
+        self.assertEqual((Constant(3) * p).simplify(), Polynomial([3, 3]))
+
+    def test_like_terms(self):
+        self.assertEqual((Sin() + Constant(2) * Sin() - Constant(3) * Sin()).simplify(), Constant(0))
+        self.assertEqual((Sin() + Sin()).simplify(), Constant(2) * Sin())
+        # Different node types over the same children are not like terms
+        f = Sin() / Cos() + Sin()(Cos())
+        self.assertAlmostEqual(f.simplify()(0.7), f(0.7))
+        f = Sin() * Cos() - Sin() + Cos()
+        self.assertAlmostEqual(f.simplify()(0.7), f(0.7))
+
+    def test_composition(self):
+        self.assertEqual(Sin()(Polynomial([0, 1])).simplify(), Sin())
+        self.assertEqual(Constant(4)(Sin()).simplify(), Constant(4))
+        self.assertEqual(Exp()(Constant(0)).simplify(), Constant(1))
+
+    def test_values_unchanged(self):
+        funcs = [
+            Sin() * Polynomial([0, 0, 1]),
+            Exp()(Sin()) * Polynomial([1, 1]),
+            Sin() / Polynomial([1, 0, 1]),
+            Log() * Log(),
+            Tan(),
+        ]
+        for f in funcs:
+            for n in range(4):
+                self.assertAlmostEqual(f.get_nth_derivative(n, simplify=True)(0.7),
+                                       f.get_nth_derivative(n)(0.7), places=8)
+
+    def test_derivative_growth(self):
+        f = Sin() * Polynomial([0, 0, 1])
+        self.assertEqual(count_nodes(f.get_nth_derivative(5, simplify=True)), 7)
+        self.assertGreater(count_nodes(f.get_nth_derivative(5)), 300)
+
+
+class NthDerivativeTester(unittest.TestCase):
+
+    def test_order(self):
+        self.assertEqual(Sin().get_nth_derivative(0), Sin())
+        self.assertEqual(Polynomial([1, 2, 3]).get_nth_derivative(2), Polynomial([6]))
+        self.assertEqual(Cos().get_nth_derivative(2, simplify=True), Constant(-1) * Cos())
+
+    def test_invalid(self):
+        self.assertRaises(ValueError, Sin().get_nth_derivative, -1)
+        self.assertRaises(TypeError, Sin().get_nth_derivative, 1.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
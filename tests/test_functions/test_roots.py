@@ -0,0 +1,117 @@
+from mathlibpy.functions import *
+from mathlibpy.functions import roots
+from fractions import Fraction
+import random
+import timeit
+import unittest
+
+
+class AberthTester(unittest.TestCase):
+
+    def assertRootsEqual(self, found, expected, places=7):
+        found = sorted(found, key=lambda z: (round(z.real, 5), round(z.imag, 5)))
+        expected = sorted(expected, key=lambda z: (round(z.real, 5), round(z.imag, 5)))
+        self.assertEqual(len(found), len(expected))
+        for z, e in zip(found, expected):
+            self.assertAlmostEqual(abs(z - e), 0, places=places)
+
+    def test_roots(self):
+        p = Polynomial([-1, 1]) * Polynomial([2, 1]) * Polynomial([1, 0, 1])   # (x - 1)(x + 2)(x^2 + 1)
+        self.assertRootsEqual(p.roots(), [1, -2, 1j, -1j])
+
+    def test_zero_roots(self):
+        self.assertRootsEqual(Polynomial([0, 0, -4, 1]).roots(), [0, 0, 4])
+        self.assertEqual(Polynomial([3]).roots(), [])
+        self.assertRaises(ValueError, Polynomial([0]).roots)
+
+    def test_multiple_roots(self):
+        self.assertRootsEqual(Polynomial([1, -2, 1]).roots(), [1, 1], places=5)
+
+    def test_high_degree(self):
+        random.seed(0)
+        coeffs = [random.uniform(-1, 1) for _ in range(151)]
+        p = Polynomial(coeffs)
+        q = Polynomial([abs(c) for c in coeffs])
+        found = p.roots()
+        self.assertEqual(len(found), 150)
+        for z in found:
+            self.assertTrue(abs(p(z)) <= 1e-12 * q(abs(z)))     # Small backward error
+
+    def test_roots_of_unity(self):
+        found = Polynomial([-1] + [0]*99 + [1]).roots()
+        for z in found:
+            self.assertAlmostEqual(abs(z), 1)
+        self.assertEqual(len(set(round(z.real, 6) + 1j*round(z.imag, 6) for z in found)), 100)
+
+
+class SturmTester(unittest.TestCase):
+
+    def setUp(self):
+        self.p = Polynomial([-1, 1]) * Polynomial([-1, 1]) * Polynomial([-2, 0, 1])    # (x - 1)^2 (x^2 - 2)
+
+    def test_sturm_sequence(self):
+        sequence = Polynomial([-1, 0, 1]).sturm_sequence()
+        self.assertEqual(sequence, [Polynomial([-1, 0, 1]), Polynomial([0, 2]), Polynomial([1])])
+        self.assertTrue(all(isinstance(c, (int, long)) for q in sequence for c in q.coeffs))
+        # Rational coefficients are scaled to integers, and remainders to primitive polynomials
+        sequence = Polynomial([Fraction(-1, 2), 0, Fraction(1, 2), Fraction(1, 3)]).sturm_sequence()
+        self.assertEqual(sequence[0], Polynomial([-3, 0, 3, 2]))
+        for q in sequence[2:]:
+            self.assertEqual(reduce(roots._gcd, q.coeffs + [0]), 1)
+        self.assertRaises(ValueError, Polynomial([0]).sturm_sequence)
+
+    def test_count_real_roots(self):
+        self.assertEqual(self.p.count_real_roots(), 3)
+        self.assertEqual(self.p.count_real_roots(0, 2), 2)
+        self.assertEqual(self.p.count_real_roots(-1, 0.5), 0)
+        self.assertEqual(Polynomial([1, 0, 1]).count_real_roots(), 0)
+
+    def test_isolate_real_roots(self):
+        intervals = self.p.isolate_real_roots()
+        self.assertEqual(len(intervals), 3)
+        for (lo, hi), root in zip(intervals, [-2 ** 0.5, 1, 2 ** 0.5]):
+            self.assertTrue(lo < root < hi)
+        for (lo, hi), (next_lo, _) in zip(intervals, intervals[1:]):
+            self.assertTrue(hi <= next_lo)
+
+    def test_real_roots(self):
+        for found, root in zip(self.p.real_roots(), [-2 ** 0.5, 1, 2 ** 0.5]):
+            self.assertAlmostEqual(found, root, places=11)
+        float_p = Polynomial([float(c) for c in self.p.coeffs])
+        for found, root in zip(float_p.real_roots(), [-2 ** 0.5, 1, 2 ** 0.5]):
+            self.assertAlmostEqual(found, root, places=9)
+        self.assertEqual(Polynomial([0, 0, 1]).real_roots(), [0.0])
+        self.assertEqual(Polynomial([1, 0, 1]).real_roots(), [])
+
+    def test_agrees_with_aberth(self):
+        random.seed(3)
+        p = Polynomial([random.randint(-9, 9) for _ in range(12)])
+        real = sorted(z.real for z in p.roots() if abs(z.imag) < 1e-9)
+        found = p.real_roots()
+        self.assertEqual(len(found), len(real))
+        for x, y in zip(found, real):
+            self.assertAlmostEqual(x, y)
+
+    def test_high_degree(self):
+        # Coefficients of primitive remainder sequences grow only polynomially with the degree
+        random.seed(5)
+        p = Polynomial([random.randint(-9, 9) for _ in range(120)] + [1])
+        start = timeit.default_timer()
+        found = p.real_roots()
+        self.assertLess(timeit.default_timer() - start, 1)
+        real = sorted(z.real for z in p.roots() if abs(z.imag) < 1e-7)
+        self.assertEqual(len(found), len(real))
+        for x, y in zip(found, real):
+            self.assertAlmostEqual(x, y)
+
+    def test_many_roots(self):
+        p = Polynomial([1])
+        for i in range(1, 31):
+            p = p * Polynomial([-i, 1])
+        for x, root in zip(p.real_roots(), range(1, 31)):
+            self.assertAlmostEqual(x, root, places=11)
+        self.assertEqual(p.count_real_roots(Fraction(1, 2), Fraction(21, 2)), 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
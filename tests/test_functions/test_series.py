@@ -0,0 +1,115 @@
+from mathlibpy.functions import *
+from mathlibpy.functions import series
+from mathlibpy.functions.series import PowerSeries
+from fractions import Fraction
+import math
+import unittest
+
+
+class PowerSeriesTester(unittest.TestCase):
+
+    def setUp(self):
+        self.a = PowerSeries([1, 2, 3])
+        self.b = PowerSeries([2, -1, 0])
+
+    def test_arithmetic(self):
+        self.assertEqual((self.a + self.b).coeffs, [3, 1, 3])
+        self.assertEqual((self.a - 1).coeffs, [0, 2, 3])
+        self.assertEqual((1 - self.a).coeffs, [0, -2, -3])
+        self.assertEqual((self.a * self.b).coeffs, [2, 3, 4])
+        self.assertEqual((self.a * 2).coeffs, [2, 4, 6])
+        q = PowerSeries([Fraction(2), 3, 4]) / self.a
+        self.assertEqual((q * self.a).coeffs, [2, 3, 4])
+        self.assertEqual((1 / PowerSeries([Fraction(1), -1, 0, 0])).coeffs, [1, 1, 1, 1])     # 1 / (1 - t)
+        self.assertRaises(ZeroDivisionError, self.a.__truediv__, PowerSeries([0, 1, 0]))
+
+    def test_power(self):
+        self.assertEqual((self.a ** 2).coeffs, [1, 4, 10])
+        self.assertEqual((PowerSeries([0, 1, 0]) ** 2).coeffs, [0, 0, 1])
+        self.assertEqual((self.a ** 0).coeffs, [1, 0, 0])
+        for c, e in zip((self.a ** -1).coeffs, (1 / self.a).coeffs):
+            self.assertAlmostEqual(c, e)
+        root = PowerSeries([4, 1, 0]) ** 0.5    # sqrt(4 + t) = 2 + t/4 - t^2/64
+        for c, e in zip(root.coeffs, [2, 0.25, -1 / 64.0]):
+            self.assertAlmostEqual(c, e)
+        self.assertRaises(ValueError, PowerSeries([0, 1]).__pow__, 0.5)
+
+    def test_elementary(self):
+        t = PowerSeries([0, 1, 0, 0, 0])
+        for c, e in zip(t.exp().coeffs, [1, 1, 1 / 2.0, 1 / 6.0, 1 / 24.0]):
+            self.assertAlmostEqual(c, e)
+        for c, e in zip(t.sin().coeffs, [0, 1, 0, -1 / 6.0, 0]):
+            self.assertAlmostEqual(c, e)
+        for c, e in zip(t.cos().coeffs, [1, 0, -1 / 2.0, 0, 1 / 24.0]):
+            self.assertAlmostEqual(c, e)
+        for c, e in zip((t + 1).log().coeffs, [0, 1, -1 / 2.0, 1 / 3.0, -1 / 4.0]):
+            self.assertAlmostEqual(c, e)
+        for c, e in zip((2 ** t).coeffs, [math.log(2) ** k / math.factorial(k) for k in range(5)]):
+            self.assertAlmostEqual(c, e)
+
+    def test_comparison(self):
+        self.assertEqual(PowerSeries([0, 5]), 0)
+        self.assertLess(self.a, self.b)
+        self.assertGreater(self.b, 1)
+
+
+class TaylorTester(unittest.TestCase):
+
+    def test_maclaurin(self):
+        p = Exp().taylor(0, 6)
+        for c, k in zip(p.coeffs, range(7)):
+            self.assertAlmostEqual(c, 1.0 / math.factorial(k))
+        self.assertEqual(Sin().taylor(0, 6).degree, 5)
+        self.assertEqual(Sin().taylor(0, 6).center, 0)
+
+    def test_polynomial_exact(self):
+        p = Polynomial([1, 2, 3, 4])
+        self.assertEqual(p.taylor(Fraction(1, 3), 3).to_dense(), p)
+        self.assertEqual(p.taylor(2, 1), ShiftedPolynomial([49, 62], 2))   # p(2) + p'(2)(x - 2)
+        self.assertEqual(p.taylor(2, 1).to_dense(), Polynomial([49 - 2*62, 62]))
+
+    def test_matches_derivatives(self):
+        f = Power(Sin() + Constant(2), Cos()) * Exp() / (Constant(3) + Tan())
+        coeffs = series.taylor_coefficients(f, 0.5, 3)
+        for k, c in enumerate(coeffs):
+            self.assertAlmostEqual(c * math.factorial(k), f.get_nth_derivative(k, simplify=True)(0.5))
+
+    def test_approximates(self):
+        f = LogBase(10)(Polynomial([1, 0, 1])) + Power(Constant(2), Sin())
+        p = f.taylor(0.7, 12)
+        for x in [0.6, 0.7, 0.75]:
+            self.assertAlmostEqual(p(x), f(x), places=9)
+
+    def test_far_from_origin(self):
+        p = Sin().taylor(100, 20)
+        self.assertEqual((p.center, p.degree), (100, 20))
+        for x in [99.9, 100, 100.1]:
+            self.assertAlmostEqual(p(x), math.sin(x), places=12)
+            self.assertAlmostEqual(p.compile()(x), math.sin(x), places=12)
+        self.assertAlmostEqual(min(p.real_roots(), key=lambda r: abs(r - 100)), 32*math.pi, places=10)
+        self.assertNotAlmostEqual(p.to_dense()(100.1), math.sin(100.1), places=2)     # Expanding loses precision
+
+    def test_float_integer_power(self):
+        p = Power(Polynomial([0, 1]), Constant(2.0)).taylor(0, 4)
+        self.assertEqual(p, ShiftedPolynomial([0, 0, 1]))
+        self.assertEqual((PowerSeries([0, 1, 0]) ** 2.0).coeffs, [0, 0, 1])
+
+    def test_constant(self):
+        self.assertEqual(Constant(4).taylor(1, 3), ShiftedPolynomial([4], 1))
+        self.assertEqual(Exp().taylor(1, 0), ShiftedPolynomial([math.e], 1))
+
+    def test_invalid(self):
+        self.assertRaises(ValueError, Sin().taylor, 0, -1)
+        self.assertRaises(TypeError, Sin().taylor, 0, 2.5)
+
+
+class ShiftTester(unittest.TestCase):
+
+    def test_shift(self):
+        # 1 + (x - 2)^2 = 5 - 4x + x^2
+        self.assertEqual(series.shift([1, 0, 1], 2), [5, -4, 1])
+        self.assertEqual(series.shift([3, 1], 0), [3, 1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+from mathlibpy.functions import *
+from mathlibpy.functions import solvers
+import math
+import unittest
+
+
+class BrentTester(unittest.TestCase):
+
+    def test_polynomial(self):
+        f = Polynomial([-2, 0, 1])
+        self.assertAlmostEqual(solvers.brent(f, 0, 2), 2 ** 0.5, places=11)
+        self.assertAlmostEqual(solvers.brent(f, -2, 0), -2 ** 0.5, places=11)
+
+    def test_composed(self):
+        f = Cos() - Polynomial([0, 1])      # cos(x) = x
+        x = solvers.brent(f, 0, 1)
+        self.assertAlmostEqual(math.cos(x), x, places=11)
+
+    def test_endpoint(self):
+        self.assertEqual(solvers.brent(Polynomial([-1, 1]), 1, 3), 1)
+
+    def test_callable(self):
+        self.assertAlmostEqual(solvers.brent(lambda x: x**3 - 8, 0, 5), 2, places=11)
+
+    def test_not_bracketed(self):
+        self.assertRaises(ValueError, solvers.brent, Polynomial([1, 0, 1]), -1, 1)
+
+    def test_max_iter(self):
+        self.assertRaises(solvers.ConvergenceError, solvers.brent, Sin(), 3, 4, 0, 0, 3)
+
+    def test_brent_many(self):
+        roots = solvers.brent_many(Sin(), [(3, 4), (-1, 0.5), (6, 7)])
+        for x, e in zip(roots, [math.pi, 0, 2*math.pi]):
+            self.assertAlmostEqual(x, e, places=11)
+        self.assertRaises(ValueError, solvers.brent_many, Sin(), [(1, 2)])
+
+
+class NewtonTester(unittest.TestCase):
+
+    def setUp(self):
+        self.f = Exp() - Polynomial([2])    # e^x = 2
+
+    def test_newton(self):
+        self.assertAlmostEqual(solvers.newton(self.f, 1), math.log(2), places=12)
+        self.assertAlmostEqual(solvers.newton(self.f, 1, mode="symbolic"), math.log(2), places=12)
+        self.assertRaises(ValueError, solvers.newton, self.f, 1, 1e-12, 50, "secant")
+
+    def test_halley(self):
+        self.assertAlmostEqual(solvers.halley(self.f, 1), math.log(2), places=12)
+        self.assertAlmostEqual(solvers.halley(self.f, 1, mode="symbolic"), math.log(2), places=12)
+        self.assertAlmostEqual(solvers.halley(Polynomial([-2, 0, 1]), 3), 2 ** 0.5, places=12)
+
+    def test_vanishing_derivative(self):
+        self.assertRaises(solvers.ConvergenceError, solvers.newton, Polynomial([1, 0, 1]), 0)
+
+    def test_max_iter(self):
+        self.assertRaises(solvers.ConvergenceError, solvers.newton, Polynomial([1, 0, 1]), 0.5, 1e-12, 20)
+
+    def test_newton_many(self):
+        roots = solvers.newton_many(Polynomial([-1, 0, 1]), [-3, -0.5, 0.5, 3, 0])
+        for x, e in zip(roots[:4], [-1, -1, 1, 1]):
+            self.assertAlmostEqual(x, e, places=12)
+        self.assertTrue(math.isnan(roots[4]))      # Derivative vanishes at 0
+
+    def test_newton_many_undefined(self):
+        roots = solvers.newton_many(Log() - Constant(1), [2.0, 10.0])
+        self.assertAlmostEqual(roots[0], math.e, places=12)
+        self.assertTrue(math.isnan(roots[1]))      # First step leaves the domain of Log
+        roots = solvers.newton_many(Constant(1)/Polynomial([0, 1]) - Constant(2), [0.3, 0.0])
+        self.assertAlmostEqual(roots[0], 0.5, places=12)
+        self.assertTrue(math.isnan(roots[1]))      # Division by zero at 0
+
+    def test_newton_many_errors_raised(self):
+        class Broken(Function):
+            def _evaluate(self, x):
+                raise TypeError("not a domain error")
+
+            def _derivative(self):
+                return Constant(1)
+
+            def __eq__(self, other):
+                return self is other
+        self.assertRaises(TypeError, solvers.newton_many, Broken(), [1.0, 2.0])
+
+
+class FixedPointTester(unittest.TestCase):
+
+    def test_fixed_point(self):
+        x = solvers.fixed_point(Cos(), 1)
+        self.assertAlmostEqual(math.cos(x), x, places=12)
+        y = solvers.fixed_point(Cos(), 1, accelerate=False)
+        self.assertAlmostEqual(x, y, places=10)
+
+    def test_max_iter(self):
+        self.assertRaises(solvers.ConvergenceError, solvers.fixed_point, Cos(), 1, 1e-12, 5, False)
+
+
+if __name__ == "__main__":
+    unittest.main()
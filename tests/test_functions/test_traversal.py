@@ -0,0 +1,115 @@
+from mathlibpy.functions import *
+from mathlibpy.functions import dual, traversal
+import math
+import sys
+import unittest
+
+
+DEPTH = 3 * sys.getrecursionlimit()
+
+
+def _deep_sum(n):
+    f = Polynomial([0, 1])
+    for _ in range(n):
+        f = f + Sin()
+    return f
+
+
+def _deep_composition(n):
+    f = Polynomial([0, 1])
+    for _ in range(n):
+        f = Sin()(f)
+    return f
+
+
+class PostorderTester(unittest.TestCase):
+
+    def test_children_first(self):
+        sin = Sin()
+        f = (sin + Cos()) * sin
+        order = traversal.postorder(f, lambda n: True)
+        self.assertEqual(len(order), 4)
+        self.assertTrue(order[-1] is f)
+        self.assertTrue(order.index(sin) < order.index(f.f1))
+
+    def test_pending(self):
+        f = Sin() + Cos()
+        self.assertEqual(traversal.postorder(f, lambda n: n is not f), [])
+        self.assertEqual(traversal.postorder(f, lambda n: n is f or isinstance(n, Cos)), [f.f2, f])
+
+
+class EvaluateIterativeTester(unittest.TestCase):
+
+    def test_call(self):
+        f = Power(Sin() + Constant(2), Cos())(Polynomial([1, 2])) / LogBase(Exp())
+        for x in [0.3, 0.7, 2.5]:
+            self.assertAlmostEqual(f.evaluate_iterative(x), f(x))
+
+    def test_multivariate(self):
+        f = Sin()(Variable(0) * Variable(1)) - Variable(1)
+        self.assertAlmostEqual(f.evaluate_iterative((2.0, 0.5)), math.sin(1.0) - 0.5)
+
+    def test_deep_sum(self):
+        f = _deep_sum(DEPTH)
+        self.assertRaises(RuntimeError, f, 0.5)
+        self.assertAlmostEqual(f.evaluate_iterative(0.5), 0.5 + DEPTH*math.sin(0.5), places=6)
+
+    def test_deep_composition(self):
+        x = 0.5
+        for _ in range(DEPTH):
+            x = math.sin(x)
+        self.assertAlmostEqual(_deep_composition(DEPTH).evaluate_iterative(0.5), x)
+
+    def test_shared_node_at_equal_inputs(self):
+        sin = Sin()
+        f = sin(Polynomial([0, 0, 1])) + sin(Polynomial([0, 1]))     # sin evaluated at x^2 and x, equal at 1
+        result = traversal.evaluate(f, dual.Dual(1, 1))
+        self.assertAlmostEqual(result.real, 2*math.sin(1))
+        self.assertAlmostEqual(result.dual, 3*math.cos(1))
+
+    def test_invalid(self):
+        self.assertRaises(TypeError, Sin().evaluate_iterative, "a")
+
+
+class DeepTreeTester(unittest.TestCase):
+
+    def test_hash_and_eq(self):
+        f, g = _deep_sum(DEPTH), _deep_sum(DEPTH)
+        self.assertEqual(hash(f), hash(g))
+        self.assertEqual(f, g)
+        self.assertNotEqual(f, _deep_sum(DEPTH - 1) + Cos())
+
+    def test_get_derivative(self):
+        derivative = _deep_sum(DEPTH).get_derivative()
+        self.assertAlmostEqual(derivative.evaluate_iterative(0.5), 1 + DEPTH*math.cos(0.5), places=6)
+        x, expected = 0.5, 1
+        for _ in range(DEPTH):
+            expected *= math.cos(x)
+            x = math.sin(x)
+        derivative = _deep_composition(DEPTH).get_derivative()
+        self.assertAlmostEqual(derivative.evaluate_shared(0.5) / expected, 1)
+        self.assertAlmostEqual(derivative.evaluate_iterative(0.5) / expected, 1)     # Shared subtrees computed once
+
+    def test_value_and_derivative(self):
+        x, expected = 0.5, 1
+        for _ in range(DEPTH):
+            expected *= math.cos(x)
+            x = math.sin(x)
+        value, derivative = _deep_composition(DEPTH).value_and_derivative(0.5)
+        self.assertAlmostEqual(value, x)
+        self.assertAlmostEqual(derivative / expected, 1)
+
+    def test_simplify(self):
+        f = _deep_composition(DEPTH)
+        self.assertAlmostEqual(f.simplify().evaluate_iterative(0.5), f.evaluate_iterative(0.5))
+        self.assertEqual(_deep_sum(DEPTH).simplify(), Polynomial([0, 1]) + Constant(DEPTH)*Sin())
+
+    def test_get_nth_derivative_simplified(self):
+        f = _deep_composition(DEPTH)
+        derivative = f.get_nth_derivative(1, simplify=True)
+        self.assertAlmostEqual(derivative.evaluate_iterative(0.5) / f.get_derivative().evaluate_iterative(0.5), 1)
+        self.assertEqual(_deep_sum(DEPTH).get_nth_derivative(2, simplify=True), Constant(-DEPTH)*Sin())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,5 @@
 from mathlibpy.functions import *
+import math
 import unittest
 
 
@@ -46,6 +47,11 @@ class TanTester(unittest.TestCase):
     def test_get_derivative(self):
         self.assertEqual(self.tan.get_derivative()(0), 1)
 
+    def test_value_and_derivative(self):
+        value, derivative = self.tan.value_and_derivative(1)
+        self.assertAlmostEqual(value, math.tan(1))
+        self.assertAlmostEqual(derivative, 1 / math.cos(1) ** 2)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -75,5 +75,60 @@ class MatrixTester(unittest.TestCase):
     def test_get_row_reduced_echelon_form(self):
         self.assertEqual(self.m3.get_row_reduced_echelon_form(), Matrix.identity(3))
 
+    def test_hadamard(self):
+        self.assertEqual(self.m2.hadamard(Matrix([[2, 0],
+                                                  [1, 3]])), Matrix([[2, 0],
+                                                                     [2, 3]]))
+        self.assertRaises(ValueError, self.m2.hadamard, self.m3)
+
+    def test_block_diagonal(self):
+        self.assertEqual(Matrix.block_diagonal(self.m2, Matrix([[7]])), Matrix([[1, 1, 0],
+                                                                                [2, 1, 0],
+                                                                                [0, 0, 7]]))
+
+    def test_from_blocks(self):
+        self.assertEqual(Matrix.from_blocks([[self.m2, Matrix([[5], [6]])],
+                                             [Matrix([[3, 4]]), Matrix([[9]])]]), Matrix([[1, 1, 5],
+                                                                                          [2, 1, 6],
+                                                                                          [3, 4, 9]]))
+        self.assertRaises(ValueError, Matrix.from_blocks, [[self.m2, Matrix([[5]])]])
+
+
+class KroneckerProductTester(unittest.TestCase):
+
+    def setUp(self):
+        self.a = Matrix([[1, 2],
+                         [3, 4],
+                         [0, 1]])
+        self.b = Matrix([[0, 5, 1],
+                         [6, 7, 2]])
+        self.kron = self.a.kronecker(self.b)
+
+    def test_dimensions(self):
+        self.assertEqual(self.kron.rows, 6)
+        self.assertEqual(self.kron.cols, 6)
+
+    def test_to_matrix(self):
+        self.assertEqual(Matrix.identity(2).kronecker(Matrix([[1, 2]])).to_matrix(), Matrix([[1, 2, 0, 0],
+                                                                                             [0, 0, 1, 2]]))
+
+    def test_getitem(self):
+        dense = self.kron.to_matrix()
+        for y in range(self.kron.rows):
+            for x in range(self.kron.cols):
+                self.assertEqual(self.kron[x, y], dense[x, y])
+
+    def test_mult_matrix(self):
+        vec = Matrix([[1, 0], [2, 1], [-1, 3], [4, 0], [0, 2], [1, 1]])
+        self.assertEqual(self.kron*vec, self.kron.to_matrix()*vec)
+
+    def test_mult_kronecker(self):
+        other = Matrix([[1, 0, 2]]).kronecker(Matrix([[1, 0], [2, 1], [3, -1]]))
+        self.assertEqual((other*self.kron).to_matrix(), other.to_matrix()*self.kron.to_matrix())
+
+    def test_mult_scalar(self):
+        self.assertEqual((self.kron*2).to_matrix(), self.kron.to_matrix()*2)
+
+
 if __name__ == "__main__":
     unittest.main()